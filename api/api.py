@@ -3,88 +3,356 @@ import json
 import ast
 import uvicorn
 import importlib
-import markdown2
+import importlib.util
 import asyncio
+import shutil
+import threading
+import time
+from types import ModuleType
 from contextlib import asynccontextmanager
 from loguru import logger
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
-from typing import List, Dict, Any
+from pydantic import BaseModel, Field
+from .docs import RenderedPage, group_by_module, iter_file, iter_section, load_manifest, render_index, save_manifest
+from .function_index import FunctionIndex
+from .search import FunctionSearchIndex
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Mapping, Optional, Set, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dotenv import load_dotenv
 
 
 load_dotenv()
 
-FUNCTION_DATA = {}
-MARKDOWN_CONTENT = ""
+FUNCTION_DATA: Mapping[str, Dict[str, Any]] = {}
+MARKDOWN_DOCS: Optional[RenderedPage] = None
+SEARCH_INDEX: Optional[FunctionSearchIndex] = None
+SEARCH_INDEX_LOCK = asyncio.Lock()
+# "" -> page skeleton, module name -> that module's section; rendered to disk once per index build
+RENDERED_DOCS: Dict[str, RenderedPage] = {}
+# bare function name -> qualified names defining it, for calls that do not qualify the name
+NAME_INDEX: Dict[str, List[str]] = {}
 
-def extract_function_info(file_path: str) -> List[Dict[str, Any]]:
+# file_path -> ((mtime_ns, size), module) and (file_path, attr_path) -> ((mtime_ns, size), function)
+MODULE_CACHE: Dict[str, Tuple[Tuple[int, int], ModuleType]] = {}
+FUNCTION_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, int], Callable]] = {}
+_MODULE_LOCKS: Dict[str, threading.Lock] = {}
+_MODULE_LOCKS_GUARD = threading.Lock()
+
+
+def file_signature(file_path: str) -> Tuple[int, int]:
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_module(file_path: str, signature: Tuple[int, int]) -> ModuleType:
+    cached = MODULE_CACHE.get(file_path)
+    if cached and cached[0] == signature:
+        return cached[1]
+    with _MODULE_LOCKS_GUARD:
+        lock = _MODULE_LOCKS.setdefault(file_path, threading.Lock())
+    # Only the first caller for a file runs its top-level code; the others wait and reuse it.
+    with lock:
+        cached = MODULE_CACHE.get(file_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+        spec = importlib.util.spec_from_file_location("module", file_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        MODULE_CACHE[file_path] = (signature, module)
+        return module
+
+
+def call_function(file_path: str, attr_path: str, params: Dict[str, Any]) -> Any:
+    """Worker entry point; module level so the process pool can pickle it."""
+    return resolve_function(file_path, attr_path)(**params)
+
+
+def resolve_function(file_path: str, attr_path: str) -> Callable:
+    """
+    Returns the function at attr_path (e.g. "Class.method") in file_path, re-importing the file
+    only when its mtime or size changed.
+    """
+    signature = file_signature(file_path)
+    cached = FUNCTION_CACHE.get((file_path, attr_path))
+    if cached and cached[0] == signature:
+        return cached[1]
+    func = load_module(file_path, signature)
+    for attr in attr_path.split("."):
+        func = getattr(func, attr)
+    FUNCTION_CACHE[(file_path, attr_path)] = (signature, func)
+    return func
+
+
+def module_name(directory: str, file_path: str) -> str:
+    """returns the dotted module name of file_path relative to directory"""
+    relative = os.path.splitext(os.path.relpath(file_path, directory))[0]
+    parts = relative.split(os.sep)
+    if parts[-1] == "__init__" and len(parts) > 1:
+        parts.pop()
+    return ".".join(parts)
+
+
+def extract_function_info(file_path: str, module: str) -> List[Dict[str, Any]]:
     with open(file_path, 'r', encoding='utf-8') as file:
         tree = ast.parse(file.read())
 
     functions = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            function_info = {
-                'name': node.name,
-                'docstring': ast.get_docstring(node),
-                'parameters': [],
-                'returns': None,
-                'file_path': file_path
-            }
 
-            for arg in node.args.args:
-                param = {'name': arg.arg, 'type': None}
-                if arg.annotation:
-                    param['type'] = ast.unparse(arg.annotation)
-                function_info['parameters'].append(param)
+    def visit(node: ast.AST, scope: List[str]):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                visit(child, scope + [child.name])
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                attr_path = ".".join(scope + [child.name])
+                function_info = {
+                    'name': child.name,
+                    'qualname': f"{module}.{attr_path}",
+                    'module': module,
+                    'attr_path': attr_path,
+                    'docstring': ast.get_docstring(child),
+                    'parameters': [],
+                    'returns': None,
+                    'file_path': file_path
+                }
+
+                for arg in child.args.args:
+                    param = {'name': arg.arg, 'type': None}
+                    if arg.annotation:
+                        param['type'] = ast.unparse(arg.annotation)
+                    function_info['parameters'].append(param)
 
-            if node.returns:
-                function_info['returns'] = ast.unparse(node.returns)
+                if child.returns:
+                    function_info['returns'] = ast.unparse(child.returns)
 
-            functions.append(function_info)
+                functions.append(function_info)
+                # nested functions are not reachable as attributes, but are still worth finding
+                visit(child, scope + [child.name, "<locals>"])
+            else:
+                visit(child, scope)
 
+    visit(tree, [])
     return functions
 
-def walk_directory(directory: str) -> Dict[str, Dict[str, Any]]:
-    result = {}
-    for root, _, files in os.walk(directory):
-        for file in files:
+def index_file(args: Tuple[str, str]) -> Tuple[str, List[Dict[str, Any]], Optional[str]]:
+    """Process pool worker: takes (file_path, module) and returns (file_path, functions, error)."""
+    file_path, module = args
+    try:
+        return file_path, extract_function_info(file_path, module), None
+    except Exception as e:
+        return file_path, [], str(e)
+
+
+INDEX_CACHE_VERSION = 4
+
+
+def load_index_cache(cache_path: Optional[str], index: Optional[FunctionIndex]) -> Dict[str, Dict[str, Any]]:
+    """returns the per-file table written alongside index, or {} when it does not belong to it"""
+    if index is None or not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable index cache {cache_path}: {str(e)}")
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != INDEX_CACHE_VERSION or cache.get("index") != index.digest:
+        logger.info(f"Rebuilding index cache {cache_path} written for another index")
+        return {}
+    return cache["files"]
+
+
+def save_index_cache(cache_path: str, cache: Dict[str, Dict[str, Any]], index: FunctionIndex):
+    temp_path = f"{cache_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": INDEX_CACHE_VERSION, "index": index.digest, "files": cache}, f, separators=(",", ":"))
+    os.replace(temp_path, cache_path)
+
+
+def report_cached_failures(files: Dict[str, Dict[str, Any]], changed: Set[str]) -> int:
+    """logs the stored error of every unchanged file that failed to parse before, returns how many"""
+    failures = 0
+    for file_path, entry in files.items():
+        if file_path not in changed and entry['error']:
+            failures += 1
+            logger.error(f"Error processing {file_path} (unchanged): {entry['error']}")
+    return failures
+
+
+def walk_directory(directory: str, index_path: str, workers: Optional[int] = None) -> FunctionIndex:
+    """
+    Indexes every .py file under directory into the binary index at index_path, keyed by
+    qualified name (module.Class.func). A small per-file table next to it records each file's
+    mtime, size, module and function count: functions of unchanged modules are copied over
+    from the previous index, the rest are parsed in parallel in a process pool, and when
+    nothing changed the previous index is returned as is without reading any of its records.
+    """
+    cache_path = f"{index_path}.files.json"
+    previous = FunctionIndex.open(index_path)
+    cache = load_index_cache(cache_path, previous)
+    files = {}
+    changed = set()
+    for root, _, names in os.walk(directory):
+        for file in names:
             if file.endswith('.py'):
                 file_path = os.path.join(root, file)
                 try:
-                    functions = extract_function_info(file_path)
-                    for func in functions:
-                        result[func['name']] = func
-                except Exception as e:
-                    print(f"Error processing {file_path}: {str(e)}")
-    return result
-
-def generate_markdown(data: Dict[str, Dict[str, Any]]) -> str:
-    md = "# Python Functions Documentation\n\n"
+                    stat = os.stat(file_path)
+                except OSError as e:
+                    logger.error(f"Error processing {file_path}: {str(e)}")
+                    continue
+                module = module_name(directory, file_path)
+                entry = cache.get(file_path)
+                if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size and entry['module'] == module:
+                    files[file_path] = entry
+                else:
+                    files[file_path] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'module': module, 'count': 0, 'error': None}
+                    changed.add(file_path)
+
+    if previous is not None and not changed and files.keys() == cache.keys():
+        cached_failures = report_cached_failures(files, changed)
+        logger.info(f"Indexed 0 files, skipped {len(files) - cached_failures} unchanged, {cached_failures} failed")
+        return previous
+
+    # records are copied per module, so a module loses all of them when any file behind it changed or went away
+    stale = {files[file_path]['module'] for file_path in changed}
+    stale.update(entry['module'] for file_path, entry in cache.items() if file_path not in files)
+    changed.update(file_path for file_path, entry in files.items() if entry['module'] in stale)
+    kept = {entry['module']: 0 for file_path, entry in files.items() if file_path not in changed}
+
+    result = {}
+    if kept:
+        for qualname, func in previous.items():
+            if func.get('module') in kept:
+                result[qualname] = func
+                kept[func['module']] += 1
+        expected = {}
+        for file_path, entry in files.items():
+            if file_path not in changed:
+                expected[entry['module']] = expected.get(entry['module'], 0) + entry['count']
+        if kept != expected:
+            logger.warning("Function index does not match its file table, reindexing every file")
+            result = {}
+            changed = set(files)
+
+    failed = 0
+    if changed:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(changed) // ((workers or os.cpu_count() or 1) * 4))
+            jobs = [(file_path, files[file_path]['module']) for file_path in sorted(changed)]
+            for file_path, functions, error in pool.map(index_file, jobs, chunksize=chunksize):
+                files[file_path]['count'] = len({func['qualname'] for func in functions})
+                files[file_path]['error'] = error
+                for func in functions:
+                    result[func['qualname']] = func
+                if error:
+                    failed += 1
+                    logger.error(f"Error processing {file_path}: {error}")
+
+    cached_failures = report_cached_failures(files, changed)
+    logger.info(
+        f"Indexed {len(changed) - failed} files, skipped {len(files) - len(changed) - cached_failures} unchanged, "
+        f"{failed + cached_failures} failed"
+    )
+    if previous is not None:
+        previous.close()
+    index = FunctionIndex.write(index_path, result)
+    try:
+        save_index_cache(cache_path, files, index)
+    except OSError as e:
+        logger.error(f"Error saving index cache: {str(e)}")
+    return index
+
+
+def is_callable(qualname: str) -> bool:
+    """nested functions are indexed for docs and search, but cannot be reached through /api"""
+    return "<locals>" not in qualname
+
+
+def build_name_index(qualnames: Iterable[str]) -> Dict[str, List[str]]:
+    names: Dict[str, List[str]] = {}
+    for qualname in filter(is_callable, qualnames):
+        names.setdefault(qualname.rsplit(".", 1)[-1], []).append(qualname)
+    return names
+
+
+async def get_search_index() -> FunctionSearchIndex:
+    """builds the search index on first use, so startup never decodes every record"""
+    global SEARCH_INDEX
+    async with SEARCH_INDEX_LOCK:
+        if SEARCH_INDEX is None:
+            SEARCH_INDEX = await asyncio.to_thread(FunctionSearchIndex, FUNCTION_DATA)
+    return SEARCH_INDEX
+
+def function_markdown(func_name: str, func_info: Dict[str, Any]) -> str:
+    parts = [f"**`{func_name}`**\n\n"]
+    if func_info['docstring']:
+        parts.append(f"## **Docstring:**\n```\n{func_info['docstring']}\n```\n\n")
+    parts.append("## **Parameters:**\n")
+    if func_info['parameters']:
+        for param in func_info['parameters']:
+            param_type = f": `{param['type']}`" if param['type'] else ""
+            parts.append(f"- `{param['name']}`{param_type}\n")
+    else:
+        parts.append("None\n")
+    parts.append("\n")
+    returns = func_info['returns'] or "None specified"
+    parts.append(f"## **Returns:** `{returns}`\n\n")
+    parts.append("---\n\n")
+    return "".join(parts)
+
+
+def generate_markdown(data: Dict[str, Dict[str, Any]]) -> Iterator[str]:
+    """yields the markdown documentation one function at a time"""
+    yield "# Python Functions Documentation\n\n"
     for func_name, func_info in data.items():
-        md += f"**`{func_name}`**\n\n"
-        if func_info['docstring']:
-            md += f"## **Docstring:**\n```\n{func_info['docstring']}\n```\n\n"
-        md += "## **Parameters:**\n"
-        if func_info['parameters']:
-            for param in func_info['parameters']:
-                param_type = f": `{param['type']}`" if param['type'] else ""
-                md += f"- `{param['name']}`{param_type}\n"
-        else:
-            md += "None\n"
-        md += "\n"
-        returns = func_info['returns'] or "None specified"
-        md += f"## **Returns:** `{returns}`\n\n"
-        md += "---\n\n"
-    return md
+        yield function_markdown(func_name, func_info)
+
+
+def render_docs(data: FunctionIndex, data_dir: str) -> Tuple[RenderedPage, Dict[str, RenderedPage]]:
+    """
+    Streams function_docs.md, the docs skeleton and one compressed HTML section per module
+    into data_dir, one module at a time, and records their metadata in a manifest. Only index
+    positions are grouped in memory; each section decodes its records while it is written.
+    """
+    docs_dir = os.path.join(data_dir, "docs")
+    sections_dir = os.path.join(docs_dir, "sections")
+    shutil.rmtree(sections_dir, ignore_errors=True)
+    os.makedirs(sections_dir)
+    modified_at = time.time()
+    markdown = RenderedPage.write(generate_markdown(data), os.path.join(data_dir, "function_docs.md"), modified_at)
+    modules = group_by_module(func.get("module", "") for func in data.values())
+    index = render_index({module: len(positions) for module, positions in modules.items()})
+    pages = {"": RenderedPage.write([index], os.path.join(docs_dir, "index.html"), modified_at)}
+    for module, positions in modules.items():
+        records = ((data.key_at(position), data.record_at(position)) for position in positions)
+        pages[module] = RenderedPage.write(iter_section(records), os.path.join(sections_dir, f"{module}.html"), modified_at)
+    save_manifest(os.path.join(docs_dir, "manifest.json"), data.digest, markdown, pages)
+    return markdown, pages
+
+
+def page_response(request: Request, page: RenderedPage, media_type: str = "text/html; charset=utf-8") -> Response:
+    headers = {
+        "ETag": page.etag,
+        "Last-Modified": page.last_modified,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if page.not_modified(request.headers.get("if-none-match"), request.headers.get("if-modified-since")):
+        return Response(status_code=304, headers=headers)
+    encoding = page.select_encoding(request.headers.get("accept-encoding"))
+    path, size = page.encodings[encoding] if encoding else (page.path, page.size)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    headers["Content-Length"] = str(size)
+    return StreamingResponse(iter_file(path), media_type=media_type, headers=headers)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global FUNCTION_DATA, MARKDOWN_DOCS, SEARCH_INDEX, NAME_INDEX, RENDERED_DOCS
     directory = os.getenv("FUNCTIONS_DIRECTORY")
     data_dir = os.getenv("DATA_DIRECTORY")
 
@@ -100,26 +368,21 @@ async def lifespan(app: FastAPI):
         logger.error(f"DATA_DIRECTORY {data_dir} does not exist")
         return
 
-    FUNCTION_DATA = walk_directory(directory)
+    FUNCTION_DATA = await asyncio.to_thread(walk_directory, directory, os.path.join(data_dir, "function_index.bin"))
+    logger.info(f"Function index with {len(FUNCTION_DATA)} functions at {FUNCTION_DATA.path}")
+    NAME_INDEX = build_name_index(FUNCTION_DATA)
+    SEARCH_INDEX = None
 
-    # Save function data to a JSON file
-    try:
-        with open(os.path.join(data_dir, "function_data.json"), "w", encoding="utf-8") as f:
-            json.dump(FUNCTION_DATA, f, indent=2)
-        logger.info(f"Function data saved to {os.path.join(data_dir, 'function_data.json')}")
-    except Exception as e:
-        logger.error(f"Error saving function data: {str(e)}")
-
-    # Generate markdown content
-    MARKDOWN_CONTENT = generate_markdown(FUNCTION_DATA)
-
-    # Save markdown to a file
-    try:
-        with open(os.path.join(data_dir, "function_docs.md"), "w", encoding="utf-8") as f:
-            f.write(MARKDOWN_CONTENT)
-        logger.info(f"Markdown content saved to {os.path.join(data_dir, 'function_docs.md')}")
-    except Exception as e:
-        logger.error(f"Error saving markdown content: {str(e)}")
+    # Docs are regenerated only when the index changed since they were last written
+    docs = load_manifest(os.path.join(data_dir, "docs", "manifest.json"), FUNCTION_DATA.digest)
+    if docs is None:
+        try:
+            docs = await asyncio.to_thread(render_docs, FUNCTION_DATA, data_dir)
+            logger.info(f"Rendered documentation for {len(docs[1]) - 1} modules")
+        except Exception as e:
+            logger.error(f"Error rendering documentation: {str(e)}")
+    if docs is not None:
+        MARKDOWN_DOCS, RENDERED_DOCS = docs
     yield 
     
     
@@ -175,47 +438,119 @@ async def serve_spa():
 
 
 @app.get("/markdown", response_class=HTMLResponse)
-async def serve_markdown():
-    with open("static/function_docs.md", "r", encoding="utf-8") as f:
-        MARKDOWN_CONTENT = f.read()
-    html_content = markdown2.markdown(MARKDOWN_CONTENT, extras=["fenced-code-blocks"])
-    return f"""
-              <br />
-                <div class="markdown-body">{html_content}</div>"""
+async def serve_markdown(request: Request):
+    if "" not in RENDERED_DOCS:
+        raise HTTPException(status_code=503, detail="Documentation is not rendered yet")
+    return page_response(request, RENDERED_DOCS[""])
+
+
+@app.get("/function_docs.md")
+async def serve_markdown_source(request: Request):
+    if MARKDOWN_DOCS is None:
+        raise HTTPException(status_code=503, detail="Documentation is not generated yet")
+    return page_response(request, MARKDOWN_DOCS, media_type="text/markdown; charset=utf-8")
+
+
+@app.get("/markdown/{module}", response_class=HTMLResponse)
+async def serve_markdown_section(module: str, request: Request):
+    if module not in RENDERED_DOCS:
+        raise HTTPException(status_code=404, detail="Module not found")
+    return page_response(request, RENDERED_DOCS[module])
 
 
 @app.get("/")
 async def get_function_data():
-    return FUNCTION_DATA
+    return dict(FUNCTION_DATA.items())
+
+
+@app.get("/search")
+async def search(q: str, limit: int = 20):
+    if not FUNCTION_DATA:
+        raise HTTPException(status_code=503, detail="Function index is not built yet")
+    limit = max(1, min(limit, 200))
+    return {"query": q, "results": (await get_search_index()).search(q, limit)}
 
 
 class FunctionParams(BaseModel):
     params: Dict[str, Any]
-    
+    timeout: Optional[float] = Field(default=None, gt=0)
+
+
+CALL_TIMEOUT = float(os.getenv("API_CALL_TIMEOUT", 30))
+MAX_CONCURRENT_CALLS = int(os.getenv("API_MAX_CONCURRENT_CALLS", 4))
+THREAD_WORKERS = int(os.getenv("API_THREAD_WORKERS", 16))
+PROCESS_WORKERS = int(os.getenv("API_PROCESS_WORKERS", os.cpu_count() or 1))
+# CPU-bound functions (qualified or bare names) run in the process pool, everything else in the thread pool
+PROCESS_FUNCTIONS = {name.strip() for name in os.getenv("API_PROCESS_FUNCTIONS", "").split(",") if name.strip()}
+
+THREAD_POOL = ThreadPoolExecutor(max_workers=THREAD_WORKERS, thread_name_prefix="api-function")
+PROCESS_POOL = None
+FUNCTION_SEMAPHORES: Dict[str, asyncio.Semaphore] = {}
+
+
+def get_executor(function_name: str) -> Executor:
+    global PROCESS_POOL
+    if function_name not in PROCESS_FUNCTIONS and function_name.rsplit(".", 1)[-1] not in PROCESS_FUNCTIONS:
+        return THREAD_POOL
+    if PROCESS_POOL is None:
+        PROCESS_POOL = ProcessPoolExecutor(max_workers=PROCESS_WORKERS)
+    return PROCESS_POOL
+
+
+async def run_function(function_name: str, file_path: str, attr_path: str, params: Dict[str, Any], timeout: float) -> Any:
+    """
+    Runs the function off the event loop within `timeout` seconds. A call holds its function's
+    concurrency slot until the worker actually finishes, so calls that outlive their deadline
+    still count against the limit.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    semaphore = FUNCTION_SEMAPHORES.setdefault(function_name, asyncio.Semaphore(MAX_CONCURRENT_CALLS))
+    await asyncio.wait_for(semaphore.acquire(), timeout)
+    try:
+        future = get_executor(function_name).submit(call_function, file_path, attr_path, params)
+    except Exception:
+        semaphore.release()
+        raise
+
+    def release(_):
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(semaphore.release)
+
+    future.add_done_callback(release)
+    try:
+        return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), max(0.0, deadline - loop.time()))
+    except asyncio.TimeoutError:
+        future.cancel()
+        raise
+
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
     
     
 @app.post("/api/{function_name}")
 async def execute_function(function_name: str, params: FunctionParams):
-    if function_name not in FUNCTION_DATA:
+    # function_name is a qualified name, or a bare name when only one function has it
+    if not is_callable(function_name):
         raise HTTPException(status_code=404, detail="Function not found")
-    
+    if function_name not in FUNCTION_DATA:
+        candidates = NAME_INDEX.get(function_name, [])
+        if not candidates:
+            raise HTTPException(status_code=404, detail="Function not found")
+        if len(candidates) > 1:
+            raise HTTPException(status_code=409, detail={"message": "Ambiguous function name", "candidates": candidates})
+        function_name = candidates[0]
+
     func_info = FUNCTION_DATA[function_name]
     file_path = func_info['file_path']
+    timeout = CALL_TIMEOUT if params.timeout is None else min(params.timeout, CALL_TIMEOUT)
     
-    # Import the module dynamically
-    spec = importlib.util.spec_from_file_location("module", file_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    
-    # Get the function from the module
-    func = getattr(module, function_name)
-    
-    # Execute the function with the provided parameters
+    # Execute the function off the event loop with the provided parameters
     try:
-        result = func(**params.params)
+        result = await run_function(function_name, file_path, func_info['attr_path'], params.params, timeout)
         return {"result": result}
+    except asyncio.TimeoutError as e:
+        raise HTTPException(status_code=504, detail=f"{function_name} did not finish within {timeout} seconds") from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
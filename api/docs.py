@@ -0,0 +1,190 @@
+import os
+import json
+import gzip
+import hashlib
+import html
+import time
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import quote
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+CHUNK_SIZE = 64 * 1024
+# bump whenever the rendered HTML or markdown changes, so pages cached for the same index are rebuilt
+DOCS_VERSION = 2
+
+
+@dataclass
+class RenderedPage:
+    """
+    An HTML fragment rendered once to disk, with precompressed copies next to it. Only paths,
+    sizes and validators are kept in memory; bodies are streamed from disk when served.
+    """
+    path: str
+    size: int
+    encodings: Dict[str, Tuple[str, int]] = field(default_factory=dict)
+    etag: str = ""
+    last_modified: str = ""
+    modified_at: float = 0.0
+
+    @classmethod
+    def write(cls, chunks: Iterable[str], path: str, modified_at: Optional[float] = None) -> "RenderedPage":
+        """streams chunks into path, path.gz and (when brotli is installed) path.br in one pass"""
+        modified_at = int(modified_at or time.time())
+        digest = hashlib.sha256()
+        paths = {None: path, "gzip": f"{path}.gz"}
+        if brotli is not None:
+            paths["br"] = f"{path}.br"
+        with ExitStack() as stack:
+            raw = stack.enter_context(open(f"{path}.tmp", "wb"))
+            gz = stack.enter_context(gzip.GzipFile(f"{paths['gzip']}.tmp", "wb", compresslevel=9, mtime=0))
+            if brotli is not None:
+                br_file = stack.enter_context(open(f"{paths['br']}.tmp", "wb"))
+                compressor = brotli.Compressor(quality=11)
+            for chunk in chunks:
+                data = chunk.encode("utf-8")
+                digest.update(data)
+                raw.write(data)
+                gz.write(data)
+                if brotli is not None:
+                    br_file.write(compressor.process(data))
+            if brotli is not None:
+                br_file.write(compressor.finish())
+        for target in paths.values():
+            os.replace(f"{target}.tmp", target)
+        return cls(
+            path=path,
+            size=os.path.getsize(path),
+            encodings={encoding: (target, os.path.getsize(target)) for encoding, target in paths.items() if encoding},
+            # weak, because the same tag is sent for every content encoding of the page
+            etag=f'W/"{digest.hexdigest()[:32]}"',
+            last_modified=formatdate(modified_at, usegmt=True),
+            modified_at=modified_at,
+        )
+
+    def not_modified(self, if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+        """returns True when the client's cached copy is still current"""
+        if if_none_match is not None:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or self.etag.removeprefix("W/") in tags
+        if if_modified_since:
+            try:
+                return parsedate_to_datetime(if_modified_since).timestamp() >= self.modified_at
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def select_encoding(self, accept_encoding: Optional[str]) -> Optional[str]:
+        """returns the best precompressed encoding the client accepts, or None for identity"""
+        accepted = {}
+        for item in (accept_encoding or "").split(","):
+            name, _, params = item.strip().partition(";")
+            quality = 1.0
+            if params.strip().startswith("q="):
+                try:
+                    quality = float(params.strip()[2:])
+                except ValueError:
+                    quality = 0.0
+            accepted[name.strip().lower()] = quality
+        for encoding in ("br", "gzip"):
+            if encoding in self.encodings and accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+                return encoding
+        return None
+
+
+def function_html(qualname: str, func_info: Dict[str, Any]) -> str:
+    """
+    returns the HTML markdown2 would produce for this function's entry in function_docs.md;
+    written out directly because running markdown2 over a large index takes minutes
+    """
+    parts = [f"<p><strong><code>{html.escape(qualname)}</code></strong></p>\n\n"]
+    if func_info['docstring']:
+        parts.append(f"<h2><strong>Docstring:</strong></h2>\n\n<pre><code>{html.escape(func_info['docstring'])}\n</code></pre>\n\n")
+    parts.append("<h2><strong>Parameters:</strong></h2>\n\n")
+    if func_info['parameters']:
+        parts.append("<ul>\n")
+        for param in func_info['parameters']:
+            param_type = f": <code>{html.escape(param['type'])}</code>" if param['type'] else ""
+            parts.append(f"<li><code>{html.escape(param['name'])}</code>{param_type}</li>\n")
+        parts.append("</ul>\n\n")
+    else:
+        parts.append("<p>None</p>\n\n")
+    returns = html.escape(func_info['returns'] or "None specified")
+    parts.append(f"<h2><strong>Returns:</strong> <code>{returns}</code></h2>\n\n<hr />\n\n")
+    return "".join(parts)
+
+
+def section_id(module: str) -> str:
+    return "module-" + module.replace(".", "-")
+
+
+def render_index(modules: Dict[str, int]) -> str:
+    """returns the page skeleton: one placeholder per module, each fetched by htmx when scrolled into view"""
+    sections = []
+    for module, count in modules.items():
+        sections.append(
+            f'<section id="{html.escape(section_id(module))}" class="mb-8">'
+            f'<h2 class="text-2xl font-bold text-secondary">{html.escape(module)} <span class="text-sm">({count})</span></h2>'
+            f'<div hx-get="/markdown/{html.escape(quote(module, safe=""))}" hx-trigger="revealed" hx-swap="outerHTML">Loading...</div>'
+            f'</section>'
+        )
+    return f"""
+              <br />
+                <div class="markdown-body">{"".join(sections)}</div>"""
+
+
+def iter_section(records: Iterable[Tuple[str, Dict[str, Any]]]) -> Iterator[str]:
+    yield '<div class="markdown-body">'
+    for qualname, func_info in records:
+        yield function_html(qualname, func_info)
+    yield '</div>'
+
+
+def iter_file(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+def group_by_module(modules: Iterable[str]) -> Dict[str, List[int]]:
+    """takes each function's module in index order and returns {module: positions}, sorted by module"""
+    groups: Dict[str, List[int]] = {}
+    for position, module in enumerate(modules):
+        groups.setdefault(module, []).append(position)
+    return dict(sorted(groups.items()))
+
+
+def save_manifest(path: str, index_digest: str, markdown: RenderedPage, pages: Dict[str, RenderedPage]):
+    manifest = {
+        "version": DOCS_VERSION,
+        "index": index_digest,
+        "markdown": asdict(markdown),
+        "pages": {name: asdict(page) for name, page in pages.items()},
+    }
+    with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, separators=(",", ":"))
+    os.replace(f"{path}.tmp", path)
+
+
+def load_manifest(path: str, index_digest: str) -> Optional[Tuple[RenderedPage, Dict[str, RenderedPage]]]:
+    """returns the docs written for index_digest by this renderer version, or None when they are missing or stale"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != DOCS_VERSION or manifest["index"] != index_digest:
+            return None
+        markdown = RenderedPage(**manifest["markdown"])
+        pages = {name: RenderedPage(**page) for name, page in manifest["pages"].items()}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    for page in [markdown, *pages.values()]:
+        if not os.path.exists(page.path) or any(not os.path.exists(target) for target, _ in page.encodings.values()):
+            return None
+    return markdown, pages
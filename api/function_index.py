@@ -0,0 +1,129 @@
+import os
+import mmap
+import struct
+import hashlib
+import msgpack
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+
+MAGIC = b"FIDX"
+VERSION = 1
+# magic, version, count, table offset, keys offset, records offset, sha256 of keys and records
+HEADER = struct.Struct("<4sIIQQQ32s")
+# key offset, key length, record offset, record length; all relative to their section
+ENTRY = struct.Struct("<QIQI")
+
+
+class FunctionIndex(Mapping[str, Dict[str, Any]]):
+    """
+    Read-only function index backed by one memory-mapped file laid out as
+
+        header | key table sorted by qualname | key bytes | msgpack records
+
+    Lookups binary search the key table and decode only the matching record, so opening
+    the index and reading one function costs a handful of page faults, not a full parse.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.count, self.table_offset, self.keys_offset, self.records_offset, digest = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a version {VERSION} function index")
+        self.digest = digest.hex()
+
+    @classmethod
+    def write(cls, path: str, data: Mapping[str, Dict[str, Any]]) -> "FunctionIndex":
+        """writes data to path atomically and returns it opened"""
+        keys = sorted(data)
+        key_blob = bytearray()
+        record_blob = bytearray()
+        table = bytearray()
+        digest = hashlib.sha256()
+        for key in keys:
+            key_bytes = key.encode("utf-8")
+            record = msgpack.packb(data[key], use_bin_type=True)
+            table += ENTRY.pack(len(key_blob), len(key_bytes), len(record_blob), len(record))
+            key_blob += key_bytes
+            record_blob += record
+            digest.update(ENTRY.pack(0, len(key_bytes), 0, len(record)))
+            digest.update(key_bytes)
+            digest.update(record)
+
+        table_offset = HEADER.size
+        keys_offset = table_offset + len(table)
+        records_offset = keys_offset + len(key_blob)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(keys), table_offset, keys_offset, records_offset, digest.digest()))
+            f.write(table)
+            f.write(key_blob)
+            f.write(record_blob)
+        os.replace(temp_path, path)
+        return cls(path)
+
+    @classmethod
+    def open(cls, path: Optional[str]) -> Optional["FunctionIndex"]:
+        """returns the index at path, or None when it is missing or unreadable"""
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError, struct.error):
+            return None
+
+    def _entry(self, position: int) -> Tuple[int, int, int, int]:
+        return ENTRY.unpack_from(self._mmap, self.table_offset + position * ENTRY.size)
+
+    def key_at(self, position: int) -> str:
+        key_offset, key_length, _, _ = self._entry(position)
+        start = self.keys_offset + key_offset
+        return self._mmap[start:start + key_length].decode("utf-8")
+
+    def record_at(self, position: int) -> Dict[str, Any]:
+        _, _, record_offset, record_length = self._entry(position)
+        start = self.records_offset + record_offset
+        return msgpack.unpackb(self._mmap[start:start + record_length], raw=False)
+
+    def find(self, key: str) -> int:
+        """returns the position of the first key >= key"""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        position = self.find(key)
+        if position < self.count and self.key_at(position) == key:
+            return self.record_at(position)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        position = self.find(key)
+        return position < self.count and self.key_at(position) == key
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self.count):
+            yield self.key_at(position)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for position in range(self.count):
+            yield self.key_at(position), self.record_at(position)
+
+    def values(self) -> Iterator[Dict[str, Any]]:
+        for position in range(self.count):
+            yield self.record_at(position)
+
+    def close(self):
+        self._mmap.close()
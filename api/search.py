@@ -0,0 +1,112 @@
+import bisect
+import math
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+
+TOKEN_PATTERN = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Splits text, snake_case and CamelCase identifiers into lowercase word tokens."""
+    return [token.lower() for token in TOKEN_PATTERN.findall(text or "")]
+
+
+class PrefixIndex:
+    """
+    A flattened prefix trie: lowercase keys kept in one sorted table, so every key under a
+    prefix is a contiguous run found by binary search. Much smaller than a node-per-character
+    trie when the keys are tens of thousands of long dotted names.
+    """
+
+    def __init__(self):
+        self.keys: List[str] = []
+        self.ids: List[int] = []
+        self._pending: List[Tuple[str, int]] = []
+
+    def insert(self, key: str, item_id: int):
+        self._pending.append((key.lower(), item_id))
+
+    def freeze(self):
+        entries = sorted(list(zip(self.keys, self.ids)) + self._pending)
+        self.keys = [key for key, _ in entries]
+        self.ids = [item_id for _, item_id in entries]
+        self._pending = []
+
+    def find(self, prefix: str, limit: int) -> List[int]:
+        if self._pending:
+            self.freeze()
+        prefix = prefix.lower()
+        found = []
+        index = bisect.bisect_left(self.keys, prefix)
+        while index < len(self.keys) and self.keys[index].startswith(prefix) and len(found) < limit:
+            found.append(self.ids[index])
+            index += 1
+        return found
+
+
+class FunctionSearchIndex:
+    """
+    Search structures over a function index keyed by qualified name: a prefix index over bare,
+    class-qualified and fully qualified names, and an inverted index from name, docstring and parameter tokens to functions.
+    """
+
+    EXACT_SCORE = 100.0
+    PREFIX_SCORE = 20.0
+    NAME_WEIGHT = 3.0
+    DOC_WEIGHT = 1.0
+
+    def __init__(self, function_data: Dict[str, Dict[str, Any]]):
+        self.qualnames: List[str] = []
+        self.functions: List[Dict[str, Any]] = []
+        self.prefixes = PrefixIndex()
+        self.name_postings: Dict[str, Set[int]] = defaultdict(set)
+        self.doc_postings: Dict[str, Set[int]] = defaultdict(set)
+        for qualname, func in function_data.items():
+            self.add(qualname, func)
+        self.prefixes.freeze()
+
+    def add(self, qualname: str, func: Dict[str, Any]):
+        item_id = len(self.qualnames)
+        self.qualnames.append(qualname)
+        self.functions.append(func)
+        for key in {func["name"], func.get("attr_path") or func["name"], qualname}:
+            self.prefixes.insert(key, item_id)
+        for token in tokenize(qualname):
+            self.name_postings[token].add(item_id)
+        parameters = " ".join(f"{param['name']} {param['type'] or ''}" for param in func["parameters"])
+        for token in tokenize(f"{func['docstring'] or ''} {parameters} {func['returns'] or ''}"):
+            self.doc_postings[token].add(item_id)
+
+    def idf(self, postings: Iterable[int]) -> float:
+        return math.log(1 + len(self.qualnames) / (1 + len(postings)))
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        scores: Dict[int, float] = defaultdict(float)
+        query = query.strip()
+        for item_id in set(self.prefixes.find(query, limit * 10)):
+            func = self.functions[item_id]
+            exact = query.lower() in (func["name"].lower(), (func.get("attr_path") or "").lower(), self.qualnames[item_id].lower())
+            scores[item_id] += self.EXACT_SCORE if exact else self.PREFIX_SCORE
+        for token in tokenize(query):
+            for postings, weight in ((self.name_postings.get(token), self.NAME_WEIGHT), (self.doc_postings.get(token), self.DOC_WEIGHT)):
+                if not postings:
+                    continue
+                token_score = weight * self.idf(postings)
+                for item_id in postings:
+                    scores[item_id] += token_score
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self.qualnames[item[0]]))[:limit]
+        results = []
+        for item_id, score in ranked:
+            func = self.functions[item_id]
+            docstring = (func["docstring"] or "").strip()
+            results.append({
+                "qualname": self.qualnames[item_id],
+                "name": func["name"],
+                "score": round(score, 3),
+                "summary": docstring.splitlines()[0] if docstring else None,
+                "file_path": func["file_path"],
+            })
+        return results
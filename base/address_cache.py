@@ -0,0 +1,126 @@
+import threading
+import time
+from loguru import logger
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional
+
+from data_models import AddressCacheSettings
+
+
+class AddressSnapshot(NamedTuple):
+    """An immutable view of one subnet's address map. Treat the lists as read-only."""
+    miner_uids: List[int]
+    miner_addresses: List[str]
+    address_map: Mapping[int, str]
+    refreshed_at: float
+
+
+class MinerAddressCache:
+    """Per-subnet miner address map with a TTL, a background refresher and delta updates.
+
+    Readers get the current snapshot without locking or I/O. Refreshes diff the
+    fetched map against the snapshot and only rebuild it when entries changed.
+    """
+    settings: AddressCacheSettings
+    fetch: Callable[[int], Dict[int, str]]
+    snapshots: Dict[int, AddressSnapshot]
+
+    def __init__(self, fetch: Callable[[int], Dict[int, str]], settings: AddressCacheSettings):
+        self.fetch = fetch
+        self.settings = settings
+        self.snapshots = {}
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def get(self, subnet: int) -> AddressSnapshot:
+        snapshot = self.snapshots.get(subnet)
+        if snapshot is None:
+            return self.refresh(subnet)
+        if time.monotonic() - snapshot.refreshed_at > self.settings.ttl:
+            self.refresh_in_background(subnet)
+        return snapshot
+
+    def refresh(self, subnet: int) -> AddressSnapshot:
+        address_map = {int(uid): address for uid, address in self.fetch(subnet).items()}
+        current = self.snapshots.get(subnet)
+        if current is None:
+            return self.apply_changes(subnet, updated=address_map)
+        updated = {
+            uid: address
+            for uid, address in address_map.items()
+            if current.address_map.get(uid) != address
+        }
+        removed = [uid for uid in current.address_map if uid not in address_map]
+        return self.apply_changes(subnet, updated=updated, removed=removed)
+
+    def refresh_in_background(self, subnet: int):
+        with self._lock:
+            if subnet in self._refreshing:
+                return
+            self._refreshing.add(subnet)
+        threading.Thread(target=self._safe_refresh, args=(subnet,), daemon=True).start()
+
+    def apply_changes(
+        self,
+        subnet: int,
+        updated: Optional[Dict[int, str]] = None,
+        removed: Optional[Iterable[int]] = None,
+    ) -> AddressSnapshot:
+        """applies only the changed entries and swaps in a new snapshot if anything changed"""
+        updated = updated or {}
+        removed = list(removed or [])
+        with self._lock:
+            current = self.snapshots.get(subnet)
+            now = time.monotonic()
+            if current is not None and not updated and not removed:
+                snapshot = current._replace(refreshed_at=now)
+            else:
+                address_map = dict(current.address_map) if current is not None else {}
+                for uid in removed:
+                    address_map.pop(uid, None)
+                address_map.update(updated)
+                address_map = dict(sorted(address_map.items()))
+                snapshot = AddressSnapshot(
+                    miner_uids=list(address_map.keys()),
+                    miner_addresses=list(address_map.values()),
+                    address_map=MappingProxyType(address_map),
+                    refreshed_at=now,
+                )
+                if current is not None:
+                    logger.debug(f"Subnet {subnet} address map: {len(updated)} updated, {len(removed)} removed")
+            self.snapshots[subnet] = snapshot
+        return snapshot
+
+    def start(self, subnets: Iterable[int]):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._refresh_loop, args=(list(subnets),), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.settings.refresh_interval)
+        self._thread = None
+
+    def _refresh_loop(self, subnets: List[int]):
+        while not self._stop.is_set():
+            for subnet in subnets:
+                with self._lock:
+                    if subnet in self._refreshing:
+                        continue
+                    self._refreshing.add(subnet)
+                self._safe_refresh(subnet)
+            self._stop.wait(self.settings.refresh_interval)
+
+    def _safe_refresh(self, subnet: int):
+        try:
+            self.refresh(subnet)
+        except Exception as e:
+            logger.error(f"Error refreshing subnet {subnet} address map: {str(e)}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(subnet)
@@ -1,12 +1,16 @@
 import os
+import json
 import base64
 import requests
 import subprocess
+from loguru import logger
 from pydantic import BaseModel, Field
-from typing import List
+from typing import Dict, List, Optional
 from pathlib import Path
 
 from data_models import ModuleConfig
+from base.module_store import ModuleArtifact, ModuleStore
+from base.module_bundle import diff_manifests, read_installed_manifest, remove_files, unpack_bundle, write_installed_manifest
 
 
 
@@ -57,20 +61,28 @@ class BaseModule(BaseModel):
             else:
                 self.remove_module(module_config)
                 
-    def get_module(self, module_config: ModuleConfig):
-        module = requests.get(f"{module_config.module_url}{module_config.module_endpoint}", timeout=30).text
-        module = self.from_base64(module)
+    def module_store(self) -> ModuleStore:
+        return ModuleStore()
+
+    def get_module(self, module_config: ModuleConfig, interactive: bool = True) -> ModuleArtifact:
+        """
+        fetches the setup script through the module store, rewriting it only when its content
+        changed; with interactive=False an existing script is overwritten without asking
+        """
+        artifact = self.module_store().fetch(module_config.module_name, f"{module_config.module_url}{module_config.module_endpoint}")
         module_setup_path = Path(f"{module_config.module_path}/setup_{module_config.module_name}.py")
-        self.check_for_existing_module(module_config)
+        if not artifact.changed and module_setup_path.exists():
+            return artifact
+        if interactive:
+            self.check_for_existing_module(module_config)
         
         if not os.path.exists("modules"):
             os.makedirs("modules")
         if not os.path.exists(module_config.module_path):
             os.makedirs(module_config.module_path)
 
-        with open(module_setup_path, "w", encoding="utf-8") as f:
-            f.write(module)
-        return module
+        self.module_store().decode_to(artifact, module_setup_path)
+        return artifact
 
     def from_base64(self, data):
         return base64.b64decode(data).decode("utf-8")
@@ -85,19 +97,87 @@ class BaseModule(BaseModel):
         with open(f"{module_config.module_path}/setup_{module_config.module_name}.py", "w", encoding="utf-8") as f:
             f.write(module_data)
 
-    def setup_module(self, module_config: ModuleConfig):
+    def run_setup_script(self, module_config: ModuleConfig):
         command = f"python {module_config.module_path}/setup_{module_config.module_name}.py"
         subprocess.run(command, shell=True, check=True)
+
+    def run_install_script(self, module_config: ModuleConfig, env: Optional[Dict[str, str]] = None):
         command = f"bash {module_config.module_path}/install_{module_config.module_name}.sh"
-        subprocess.run(command, shell=True, check=True)
+        subprocess.run(command, shell=True, check=True, env=env)
+
+    def setup_module(self, module_config: ModuleConfig):
+        self.run_setup_script(module_config)
+        self.run_install_script(module_config)
 
-    def update_module(self, module_config: ModuleConfig):
-        self.install_module(module_config)
+    def install_bundle(self, module_config: ModuleConfig, run_install_script: bool = True) -> Optional[bool]:
+        """
+        Installs the module from its zip bundle, fetching and unpacking only the files whose
+        hashes differ from the installed manifest. Returns whether anything changed, or None
+        when the registrar has no bundle for the module and the setup script must be used.
+        """
+        store = self.module_store()
+        name = module_config.module_name
+        bundle_url = f"{module_config.module_url}{module_config.module_endpoint}/bundle"
+        try:
+            manifest_artifact = store.fetch(f"{name}.manifest", f"{bundle_url}/manifest")
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+        manifest = json.loads(manifest_artifact.path.read_text(encoding="utf-8"))
+        if not isinstance(manifest, dict) or "files" not in manifest:
+            # older registrars answer unknown paths with an error document instead of a 404
+            return None
+        target_dir = Path(module_config.module_path)
+        installed = read_installed_manifest(target_dir)
+        changed, removed = diff_manifests(installed, manifest, target_dir)
+        if not changed and not removed:
+            logger.info(f"{name} is up to date ({len(manifest['files'])} files)")
+            return False
+
+        bundle = None
+        if len(changed) < len(manifest["files"]):
+            try:
+                bundle = store.fetch(f"{name}.delta", bundle_url, payload={"files": changed})
+            except requests.HTTPError as e:
+                logger.warning(f"Partial bundle for {name} unavailable, fetching the full bundle: {str(e)}")
+        if bundle is None:
+            bundle = store.fetch(f"{name}.bundle", bundle_url)
+        unpack_bundle(bundle.path, target_dir, changed, manifest)
+        remove_files(target_dir, removed)
+        logger.info(f"Updated {len(changed)} and removed {len(removed)} of {name}'s files")
+
+        # dependencies only need reinstalling when the install script itself changed
+        install_script = manifest.get("install_script", f"install_{name}.sh")
+        if run_install_script and install_script in changed:
+            subprocess.run(["bash", str(target_dir / install_script)], check=True)
+        write_installed_manifest(target_dir, manifest)
+        store.prune()
+        return True
+
+    def update_module(self, module_config: ModuleConfig) -> bool:
+        """returns False without reinstalling when the registrar still serves the installed artifact"""
+        bundle_changed = self.install_bundle(module_config)
+        if bundle_changed is not None:
+            return bundle_changed
+        artifact = self.get_module(module_config)
+        module_setup_path = Path(f"{module_config.module_path}/setup_{module_config.module_name}.py")
+        if self.module_store().installed(module_config.module_name) == artifact.sha256 and module_setup_path.exists():
+            logger.info(f"{module_config.module_name} is up to date ({artifact.sha256[:12]})")
+            return False
+        self.setup_module(module_config)
+        store = self.module_store()
+        store.mark_installed(module_config.module_name, artifact.sha256)
+        store.prune()
+        return True
 
     # TODO Rename this here and in `init_module` and `update_module`
     def install_module(self, module_config):
-        self.get_module(module_config)
+        if self.install_bundle(module_config) is not None:
+            return
+        artifact = self.get_module(module_config)
         self.setup_module(module_config)
+        self.module_store().mark_installed(module_config.module_name, artifact.sha256)
 
 
 if __name__ == "__main__":
@@ -1,16 +1,29 @@
 import requests
 import subprocess
 import uvicorn
+import asyncio
+import aiohttp
+import msgpack
+import time
 import json
 import os
+import numpy as np
+from loguru import logger
 from substrateinterface import ExtrinsicReceipt
 from abc import ABC, abstractmethod
 from importlib import import_module
 from multiprocessing import Pool, process
 from typing import Any, Dict, List, Optional, Tuple
-from data_models import MinerRequest, ValidatorSettings
+from data_models import MinerRequest, MinerResponse, ValidatorSettings, FanoutSettings
 from base.base_module import BaseModule, ModuleConfig
-from fastapi import FastAPI, Request, Response
+from base.module_installer import ModuleInstaller
+from base.transport import JSON, decode_body, encode_payload, is_binary
+from base.address_cache import MinerAddressCache
+from base.scoring import ScoreBoard
+from base.pipeline import VotePipeline
+from base.miner_stats import MinerStatsStore
+from base.reference_cache import ReferenceCache
+from fastapi import FastAPI, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
 from api.api import serve_spa
@@ -20,13 +33,150 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+class MinerFanout:
+    """Sends one request to many miners at once over a pooled keep-alive session.
+
+    In-flight requests are capped by `max_in_flight`, every miner gets
+    `miner_timeout` seconds once its request is on the wire and the whole round
+    is cut off after `round_timeout` seconds.
+
+    Miners get a JSON body that offers msgpack replies until they answer in
+    msgpack, and msgpack bodies from then on. A miner that rejects a msgpack
+    body with 415 or 422 is retried once in JSON and kept on JSON.
+    """
+    settings: FanoutSettings
+    session: Optional[aiohttp.ClientSession]
+    semaphore: Optional[asyncio.Semaphore]
+    binary_miners: Dict[str, bool]
+
+    def __init__(self, settings: FanoutSettings):
+        self.settings = settings
+        self.session = None
+        self.semaphore = None
+        self.binary_miners = {}
+
+    async def open(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.settings.max_in_flight,
+                keepalive_timeout=self.settings.keepalive_timeout,
+                ttl_dns_cache=300,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.settings.connect_timeout),
+            )
+            self.semaphore = asyncio.Semaphore(self.settings.max_in_flight)
+        return self.session
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        self.semaphore = None
+
+    @staticmethod
+    def miner_url(miner_address: str, endpoint: str) -> str:
+        if "://" not in miner_address:
+            miner_address = f"http://{miner_address}"
+        return f"{miner_address.rstrip('/')}{endpoint}"
+
+    async def query_miner(
+        self,
+        miner_uid: int,
+        miner_address: str,
+        endpoint: str,
+        bodies: Dict[bool, Tuple[bytes, Dict[str, str]]],
+    ) -> MinerResponse:
+        """bodies maps binary -> (body, headers), the round payload encoded once per transport"""
+        url = self.miner_url(miner_address, endpoint)
+        timeout = aiohttp.ClientTimeout(total=self.settings.miner_timeout, sock_connect=self.settings.connect_timeout)
+        binary = self.binary_miners.get(miner_address, False) and True in bodies
+        async with self.semaphore:
+            start = time.perf_counter()
+            try:
+                while True:
+                    body, headers = bodies[binary]
+                    async with self.session.post(url, data=body, headers=headers, timeout=timeout) as response:
+                        if binary and response.status in (415, 422):
+                            logger.info(f"Miner {miner_address} rejected msgpack, switching it to JSON")
+                            self.binary_miners[miner_address] = binary = False
+                            continue
+                        content = await response.read()
+                        content_type = response.headers.get("Content-Type", JSON)
+                        if response.status == 200 and self.settings.binary_transport:
+                            self.binary_miners[miner_address] = is_binary(content_type)
+                        return MinerResponse(
+                            miner_uid=miner_uid,
+                            miner_address=miner_address,
+                            data=decode_body(content_type, content),
+                            status_code=response.status,
+                            latency=time.perf_counter() - start,
+                            bytes_received=len(content),
+                            error=None if response.status == 200 else f"HTTP {response.status}",
+                        )
+            except asyncio.TimeoutError:
+                error = "miner deadline exceeded"
+            except (aiohttp.ClientError, ValueError, msgpack.UnpackException) as e:
+                error = f"{type(e).__name__}: {e}"
+            return MinerResponse(
+                miner_uid=miner_uid,
+                miner_address=miner_address,
+                latency=time.perf_counter() - start,
+                error=error,
+            )
+
+    async def fanout(
+        self,
+        miner_uids: List[int],
+        miner_addresses: List[str],
+        endpoint: str,
+        payload: Dict[str, Any],
+    ) -> List[MinerResponse]:
+        """returns one response per miner, in the order of miner_uids"""
+        await self.open()
+        bodies = {False: encode_payload(payload, False, accept_binary=self.settings.binary_transport)}
+        if self.settings.binary_transport and any(self.binary_miners.get(miner_address) for miner_address in miner_addresses):
+            bodies[True] = encode_payload(payload, True)
+        tasks = [
+            asyncio.create_task(self.query_miner(miner_uid, miner_address, endpoint, bodies))
+            for miner_uid, miner_address in zip(miner_uids, miner_addresses)
+        ]
+        if not tasks:
+            return []
+        _, pending = await asyncio.wait(tasks, timeout=self.settings.round_timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        responses = []
+        for task, miner_uid, miner_address in zip(tasks, miner_uids, miner_addresses):
+            if task in pending:
+                responses.append(
+                    MinerResponse(
+                        miner_uid=miner_uid,
+                        miner_address=miner_address,
+                        latency=self.settings.round_timeout,
+                        error="round deadline exceeded",
+                    )
+                )
+            else:
+                responses.append(task.result())
+        return responses
+
+
 class ValdiatorExecutor:
     chain_api: Optional[Dict[str, Any]]
     module_registry: Optional[Dict[str, Any]]
     module_config: Optional[Dict[str, Any]]
     validator_config: ValidatorSettings
     module: Optional[BaseModule]
-    miner_statistics: Optional[Dict[str, Any]]
+    miner_statistics: MinerStatsStore
+    fanout: MinerFanout
+    address_cache: MinerAddressCache
+    scoreboard: ScoreBoard
+    pipeline: VotePipeline
+    reference_cache: ReferenceCache
     
     def __init__(
         self, 
@@ -41,7 +191,12 @@ class ValdiatorExecutor:
         
         self.module = self.get_module(self.module_config)
         self.process = self.module.process
-        self.miner_statistics = {}
+        self.miner_statistics = MinerStatsStore(validator_config.stats)
+        self.fanout = MinerFanout(validator_config.fanout)
+        self.address_cache = MinerAddressCache(self.query_map_addresses, validator_config.address_cache)
+        self.scoreboard = ScoreBoard(validator_config.scoring)
+        self.pipeline = VotePipeline(self, validator_config.pipeline)
+        self.reference_cache = ReferenceCache(validator_config.reference_cache)
         
     def set_module_config(
         self,
@@ -72,6 +227,10 @@ class ValdiatorExecutor:
         module_config = module_config or self.module_config
         base_module = BaseModule(module_config)
         base_module.install_module(module_config)
+
+    def install_modules(self, module_names: List[str], module_url: Optional[str] = None) -> Dict[str, str]:
+        """installs several registry modules in parallel, returns the status of each"""
+        return ModuleInstaller(module_url or self.module_config.module_url).install(module_names)
     
     def get_module(self, module_config: ModuleConfig):
         module = import_module(f"modules.{module_config.module_name}.{module_config.module_name}")
@@ -79,36 +238,55 @@ class ValdiatorExecutor:
         return module
     
     def construct_miner_request(self, sample_data: Any, request: MinerRequest) -> MinerRequest:
-        request_dict = request.model_dump()
-        return MinerRequest(data={"request_data": sample_data, **request_dict})
+        return MinerRequest(data={"input": sample_data, **(request.data or {})})
         
     def process_sample_data(self, sample_data: str, request: MinerRequest):
         miner_request = self.construct_miner_request(sample_data, request)
         return self.module.process(miner_request)
+
+    async def query_miners(self, request: MinerRequest, miner_uids: List[int], miner_addresses: List[str]) -> List[MinerResponse]:
+        endpoint = f"/modules/{self.module_config.module_name}/process"
+        return await self.fanout.fanout(miner_uids, miner_addresses, endpoint, request.model_dump())
+        
+    @abstractmethod
+    def query_map_addresses(self, subnet: int) -> Dict[int, str]:
+        """queries the chain, returns a mapping of miner_uid to miner_address"""
+
+    def collect_miner_addresses(self, subnet: int = 10) -> Tuple[List[int], List[str]]:
+        """returns a tuple of (miner_uids, miner_addresses) from the cached address map"""
+        snapshot = self.address_cache.get(subnet)
+        return snapshot.miner_uids, snapshot.miner_addresses
         
     @abstractmethod
-    def collect_miner_addresses(self) -> Tuple[List[int], List[str]]:
-        """returns a tuple of (miner_uids, miner_addresses)"""
+    def sample(self) -> Tuple[Any, MinerRequest]:
+        """returns a tuple of (sample_data, request) for the next round"""
+
+    @abstractmethod
+    async def validate(self, sample_data: Any, request: MinerRequest, miner_uids: List[int], miner_addresses: List[str]) -> List[MinerResponse]:
+        """returns one MinerResponse per miner"""
         
     @abstractmethod
-    def validate(self, sample_data: Any, request: MinerRequest, miners: List[str]) -> Tuple[int, List[float]]:
-        """returns a tuple of (miner_uid, result_tensors)"""
+    def score(self, sample_data: Any, request: MinerRequest, responses: List[MinerResponse]) -> np.ndarray:
+        """returns one raw score per response"""
+        
+    def record_round(self, responses: List[MinerResponse], scores: np.ndarray):
+        self.miner_statistics.record(responses, scores)
         
     @abstractmethod
-    def normalize(self, results: List[float]) -> List[float]:
-        """returns a tuple of (miner_uids, normalized_results)"""
+    def normalize(self, results: np.ndarray) -> np.ndarray:
+        """returns the normalized results, row by row for a 2D batch"""
         
     @abstractmethod
-    def scale(self, normalized_results: List[float]) -> List[float]:
-        """returns a list of scaled results"""
+    def scale(self, miner_uids: np.ndarray, normalized_results: np.ndarray) -> np.ndarray:
+        """returns the scaled results for miner_uids"""
         
     @abstractmethod
-    def vote(self, miner_uids: List[int], scaled_results: List[float], miner_addresses: List[str]) -> Any:
+    def vote(self, miner_uids: np.ndarray, scaled_results: np.ndarray, miner_addresses: List[str]) -> Any:
         """votes on the chain, returns the receipt"""
 
-    @abstractmethod
-    def voteloop(self, miner_uids: List[int], scaled_results: List[float], miner_addresses: List[str]) -> Any:
-        """main voting loop""" 
+    def voteloop(self, rounds: Optional[int] = None) -> Dict[str, Any]:
+        """main voting loop, returns the per-stage timing summary"""
+        return asyncio.run(self.pipeline.run(rounds))
         
     def serve(self):
         app = FastAPI()
@@ -131,7 +309,15 @@ class ValdiatorExecutor:
             return {"miner_uids": miner_uids, "miner_addresses": miner_addresses}
         
         @app.get("/stats")
-        def stats():
-            return self.miner_statistics
+        def stats(offset: int = 0, limit: int = 100, uid: Optional[List[int]] = Query(default=None), history: bool = False):
+            return self.miner_statistics.page(offset=offset, limit=limit, uids=uid, history=history)
+
+        @app.get("/pipeline")
+        def pipeline():
+            return self.pipeline.summary()
+
+        @app.get("/reference_cache")
+        def reference_cache():
+            return self.reference_cache.stats()
             
         uvicorn.run(app, host="0.0.0.0", port=6767, reload=True)
\ No newline at end of file
@@ -0,0 +1,130 @@
+import os
+import sqlite3
+import threading
+import time
+import numpy as np
+from typing import Any, Dict, Iterable, List, Optional
+
+from data_models import MinerResponse, StatsSettings
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS miner_samples (
+    uid INTEGER NOT NULL,
+    timestamp REAL NOT NULL,
+    latency REAL NOT NULL,
+    success INTEGER NOT NULL,
+    score REAL NOT NULL,
+    bytes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS miner_samples_uid_timestamp ON miner_samples (uid, timestamp);
+"""
+
+MINER_COLUMNS = """
+    uid,
+    COUNT(*) AS samples,
+    AVG(latency) AS mean_latency,
+    MAX(latency) AS max_latency,
+    AVG(success) AS success_rate,
+    AVG(score) AS mean_score,
+    SUM(bytes) AS bytes,
+    MAX(timestamp) AS last_seen
+"""
+
+
+class MinerStatsStore:
+    """Per-miner latency, success, score and transfer samples in SQLite (WAL mode).
+
+    Only the newest `window` samples are kept for each miner. Aggregates are
+    computed in SQL so callers can page through thousands of miners cheaply.
+    """
+    settings: StatsSettings
+
+    def __init__(self, settings: StatsSettings):
+        self.settings = settings
+        os.makedirs(os.path.dirname(settings.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(settings.path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+
+    def record(self, responses: List[MinerResponse], scores: Optional[np.ndarray] = None):
+        if not responses:
+            return
+        timestamp = time.time()
+        scores = np.zeros(len(responses)) if scores is None else np.asarray(scores, dtype=np.float64)
+        rows = [
+            (response.miner_uid, timestamp, response.latency, int(response.success), float(score), response.bytes_received)
+            for response, score in zip(responses, scores)
+        ]
+        uids = {(response.miner_uid, self.settings.window) for response in responses}
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT INTO miner_samples VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._connection.executemany(
+                """
+                DELETE FROM miner_samples WHERE rowid IN (
+                    SELECT rowid FROM miner_samples WHERE uid = ?
+                    ORDER BY timestamp DESC, rowid DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                uids,
+            )
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(row) for row in self._connection.execute(sql, tuple(params))]
+
+    def summary(self) -> Dict[str, Any]:
+        return self._query(
+            """
+            SELECT
+                COUNT(DISTINCT uid) AS miners,
+                COUNT(*) AS samples,
+                AVG(latency) AS mean_latency,
+                AVG(success) AS success_rate,
+                AVG(score) AS mean_score,
+                SUM(bytes) AS bytes
+            FROM miner_samples
+            """
+        )[0]
+
+    def miners(self, offset: int = 0, limit: int = 100, uids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        where, params = "", []
+        if uids:
+            where = f"WHERE uid IN ({', '.join('?' * len(uids))})"
+            params.extend(uids)
+        params.extend([limit, offset])
+        return self._query(
+            f"SELECT {MINER_COLUMNS} FROM miner_samples {where} GROUP BY uid ORDER BY uid LIMIT ? OFFSET ?",
+            params,
+        )
+
+    def count(self, uids: Optional[List[int]] = None) -> int:
+        if uids:
+            sql = f"SELECT COUNT(DISTINCT uid) AS miners FROM miner_samples WHERE uid IN ({', '.join('?' * len(uids))})"
+            return self._query(sql, uids)[0]["miners"]
+        return self._query("SELECT COUNT(DISTINCT uid) AS miners FROM miner_samples")[0]["miners"]
+
+    def score_history(self, uid: int) -> List[float]:
+        rows = self._query("SELECT score FROM miner_samples WHERE uid = ? ORDER BY timestamp, rowid", [uid])
+        return [row["score"] for row in rows]
+
+    def page(self, offset: int = 0, limit: int = 100, uids: Optional[List[int]] = None, history: bool = False) -> Dict[str, Any]:
+        limit = max(1, min(limit, self.settings.max_page_size))
+        miners = self.miners(offset, limit, uids)
+        if history:
+            for miner in miners:
+                miner["score_history"] = self.score_history(miner["uid"])
+        return {
+            "summary": self.summary(),
+            "total": self.count(uids),
+            "offset": offset,
+            "limit": limit,
+            "miners": miners,
+        }
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,167 @@
+import base64
+import hashlib
+import json
+import os
+import sys
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from base.module_store import hash_file
+
+
+MANIFEST_NAME = "manifest.json"
+INSTALLED_MANIFEST = ".bundle_manifest.json"
+CHUNK_SIZE = 64 * 1024
+EXCLUDE = ("__pycache__/*", "*.pyc", "in/*", "out/*", "setup_*.py", INSTALLED_MANIFEST)
+
+Manifest = Dict[str, Any]
+
+
+def safe_path(target_dir: Path, relative_path: str) -> Path:
+    """returns target_dir / relative_path, refusing paths that would escape target_dir"""
+    parts = PurePosixPath(relative_path).parts
+    if not parts or PurePosixPath(relative_path).is_absolute() or ".." in parts:
+        raise ValueError(f"Unsafe path in bundle: {relative_path}")
+    return target_dir.joinpath(*parts)
+
+
+def build_manifest(module_dir: Path, module_name: str, exclude: Iterable[str] = EXCLUDE) -> Manifest:
+    files = {}
+    for path in sorted(module_dir.rglob("*")):
+        relative_path = path.relative_to(module_dir).as_posix()
+        if not path.is_file() or any(fnmatch(relative_path, pattern) for pattern in exclude):
+            continue
+        files[relative_path] = {"sha256": hash_file(path), "size": path.stat().st_size, "mode": path.stat().st_mode & 0o777}
+    return {"module_name": module_name, "install_script": f"install_{module_name}.sh", "files": files}
+
+
+def build_bundle(module_dir: Path, bundle_path: Path, manifest: Manifest, files: Optional[Iterable[str]] = None) -> Manifest:
+    """
+    Writes a deflated zip holding manifest.json and the given files (all by default). The
+    manifest always lists every file, so a partial bundle still describes the whole module.
+    """
+    names = sorted(manifest["files"] if files is None else files)
+    with zipfile.ZipFile(bundle_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as bundle:
+        bundle.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+        for relative_path in names:
+            bundle.write(safe_path(module_dir, relative_path), relative_path)
+    return manifest
+
+
+def build_setup_script(module_dir: Path, manifest: Manifest) -> str:
+    """
+    Returns the legacy setup_<name>.py for registrars without bundle support: a script that
+    writes every file the manifest lists, base64-embedded, into modules/<name>
+    """
+    lines = ["import os", "import base64", f"folder_path = f'modules/{manifest['module_name']}'", "", "file_data = ["]
+    for relative_path in sorted(manifest["files"]):
+        encoded = base64.b64encode(safe_path(module_dir, relative_path).read_bytes()).decode("ascii")
+        lines.append(f"    ({relative_path!r}, '{encoded}'),")
+    lines += [
+        "]",
+        "",
+        "for relative_path, encoded_content in file_data:",
+        "    full_path = os.path.join(folder_path, relative_path)",
+        "    os.makedirs(os.path.dirname(full_path), exist_ok=True)",
+        "    with open(full_path, 'wb') as f:",
+        "        f.write(base64.b64decode(encoded_content))",
+        "    print(f'Created: {full_path}')",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def read_bundle_manifest(bundle_path: Path) -> Manifest:
+    with zipfile.ZipFile(bundle_path) as bundle:
+        return json.loads(bundle.read(MANIFEST_NAME))
+
+
+def read_installed_manifest(target_dir: Path) -> Manifest:
+    try:
+        return json.loads((target_dir / INSTALLED_MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"files": {}}
+
+
+def write_installed_manifest(target_dir: Path, manifest: Manifest):
+    temp_path = target_dir / f"{INSTALLED_MANIFEST}.tmp"
+    temp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(temp_path, target_dir / INSTALLED_MANIFEST)
+
+
+def diff_manifests(installed: Manifest, manifest: Manifest, target_dir: Path) -> Tuple[List[str], List[str]]:
+    """
+    returns (changed, removed): files whose hash differs from what was installed or that are
+    missing or resized on disk, and installed files the new manifest no longer lists
+    """
+    installed_files = installed.get("files", {})
+    changed = []
+    for relative_path, entry in manifest["files"].items():
+        local = safe_path(target_dir, relative_path)
+        previous = installed_files.get(relative_path)
+        if previous is None or previous["sha256"] != entry["sha256"] or not local.is_file() or local.stat().st_size != entry["size"]:
+            changed.append(relative_path)
+    removed = [relative_path for relative_path in installed_files if relative_path not in manifest["files"]]
+    return changed, removed
+
+
+def extract_member(bundle_path: Path, target_dir: Path, relative_path: str, entry: Dict[str, Any]) -> str:
+    """Worker: streams one member to disk through a temp file, checking its hash before it replaces the old file."""
+    target = safe_path(target_dir, relative_path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = target.with_name(f".{target.name}.tmp")
+    digest = hashlib.sha256()
+    # each worker reads through its own handle; inflating releases the GIL, so members decompress in parallel
+    with zipfile.ZipFile(bundle_path) as bundle, bundle.open(relative_path) as source, open(temp_path, "wb") as out:
+        while chunk := source.read(CHUNK_SIZE):
+            digest.update(chunk)
+            out.write(chunk)
+    if digest.hexdigest() != entry["sha256"]:
+        temp_path.unlink()
+        raise IOError(f"Integrity check failed for {relative_path}")
+    os.chmod(temp_path, entry.get("mode", 0o644))
+    os.replace(temp_path, target)
+    return relative_path
+
+
+def unpack_bundle(
+    bundle_path: Path,
+    target_dir: Path,
+    files: Iterable[str],
+    manifest: Optional[Manifest] = None,
+    workers: Optional[int] = None,
+) -> List[str]:
+    """
+    extracts files from bundle_path into target_dir in parallel, verifying each against
+    manifest, or against the manifest inside the bundle when none is given
+    """
+    manifest = manifest or read_bundle_manifest(bundle_path)
+    files = list(files)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=workers or min(8, (os.cpu_count() or 1) + 2)) as pool:
+        jobs = [pool.submit(extract_member, bundle_path, target_dir, relative_path, manifest["files"][relative_path]) for relative_path in files]
+        return [job.result() for job in jobs]
+
+
+def remove_files(target_dir: Path, files: Iterable[str]):
+    for relative_path in files:
+        path = safe_path(target_dir, relative_path)
+        if path.exists():
+            path.unlink()
+
+
+if __name__ == "__main__":
+    # python -m base.module_bundle modules/translation translation.zip
+    # python -m base.module_bundle modules/translation --setup-script   (regenerates setup_translation.py)
+    module_dir = Path(sys.argv[1])
+    bundle_manifest = build_manifest(module_dir, module_dir.name)
+    if sys.argv[2] == "--setup-script":
+        setup_path = module_dir / f"setup_{module_dir.name}.py"
+        setup_path.write_text(build_setup_script(module_dir, bundle_manifest), encoding="utf-8")
+        print(f"{setup_path}: {len(bundle_manifest['files'])} files")
+    else:
+        bundle_path = Path(sys.argv[2])
+        build_bundle(module_dir, bundle_path, bundle_manifest)
+        print(f"{bundle_path}: {len(bundle_manifest['files'])} files, {bundle_path.stat().st_size} bytes")
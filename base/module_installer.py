@@ -0,0 +1,216 @@
+import hashlib
+import os
+import subprocess
+import sys
+import requests
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from graphlib import CycleError, TopologicalSorter
+from loguru import logger
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from data_models import ModuleConfig, ModuleInstallerSettings
+from base.base_module import BaseModule
+
+
+STAMP_NAME = ".install_stamp"
+
+
+class ModuleInstaller:
+    """Installs several registry modules at once.
+
+    Fetching and unpacking runs in parallel for every requested module. Install
+    scripts then run in dependency order, independent modules side by side up to
+    `script_workers`, with pip pointed at a shared cache and local wheelhouse.
+    A module whose install script, venv and index are unchanged since its last
+    successful install is skipped, so an existing environment reinstalls in
+    the time it takes to check the registrar for changes.
+    """
+    settings: ModuleInstallerSettings
+
+    def __init__(self, module_url: str, settings: Optional[ModuleInstallerSettings] = None):
+        self.module_url = module_url.rstrip("/")
+        self.settings = settings or ModuleInstallerSettings()
+        self.wheelhouse = Path(self.settings.wheelhouse)
+        self.pip_cache = Path(self.settings.pip_cache)
+        self.wheelhouse.mkdir(parents=True, exist_ok=True)
+        self.pip_cache.mkdir(parents=True, exist_ok=True)
+        self._registry: Optional[Dict[str, Any]] = None
+
+    def registry(self) -> Dict[str, Any]:
+        """returns the registry as {module_name: entry}, fetched once"""
+        if self._registry is None:
+            response = requests.get(f"{self.module_url}/modules/registry", timeout=30)
+            response.raise_for_status()
+            registry = response.json()
+            if isinstance(registry, dict) and isinstance(registry.get("modules"), (list, dict)):
+                registry = registry["modules"]
+            if isinstance(registry, list):
+                registry = {name: {} for name in registry}
+            self._registry = {name: entry if isinstance(entry, dict) else {} for name, entry in registry.items()}
+        return self._registry
+
+    def module_config(self, module_name: str) -> ModuleConfig:
+        return ModuleConfig(
+            module_name=module_name,
+            module_path=f"modules/{module_name}",
+            module_endpoint=f"/modules/{module_name}",
+            module_url=self.module_url,
+        )
+
+    def resolve(self, module_names: List[str]) -> Dict[str, List[str]]:
+        """returns {module_name: modules it requires} for module_names and everything they require"""
+        registry = self.registry()
+        graph: Dict[str, List[str]] = {}
+        pending = list(module_names)
+        while pending:
+            name = pending.pop()
+            if name in graph:
+                continue
+            if name not in registry:
+                raise ValueError(f"Module {name} is not in the registry. Available modules: {sorted(registry)}")
+            graph[name] = list(registry[name].get("requires", []))
+            pending.extend(graph[name])
+        return graph
+
+    def pip_env(self) -> Dict[str, str]:
+        env = dict(os.environ)
+        env.update({
+            "PIP_CACHE_DIR": str(self.pip_cache.resolve()),
+            "PIP_FIND_LINKS": str(self.wheelhouse.resolve()),
+            "PIP_PREFER_BINARY": "1",
+            "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+        })
+        if self.settings.index_url:
+            env["PIP_INDEX_URL"] = self.settings.index_url
+        return env
+
+    def venv_python(self) -> Path:
+        """returns the interpreter of the venv install scripts install into"""
+        venv = Path(self.settings.venv)
+        return venv / "Scripts" / "python.exe" if os.name == "nt" else venv / "bin" / "python"
+
+    def stamp(self, module_config: ModuleConfig) -> Optional[str]:
+        """
+        returns the hash of everything an install depends on: the install script, the venv it
+        fills (its interpreter and pyvenv.cfg) and the index, or None when there is no install script
+        """
+        script = Path(module_config.module_path) / f"install_{module_config.module_name}.sh"
+        if not script.exists():
+            return None
+        digest = hashlib.sha256(script.read_bytes())
+        python = self.venv_python()
+        venv_cfg = Path(self.settings.venv) / "pyvenv.cfg"
+        digest.update(f"{python.resolve() if python.exists() else ''}|{self.settings.index_url}".encode("utf-8"))
+        if venv_cfg.exists():
+            # the mtime changes when the venv is recreated, which leaves it empty
+            digest.update(f"{venv_cfg.stat().st_mtime_ns}|".encode("utf-8") + venv_cfg.read_bytes())
+        return digest.hexdigest()
+
+    def is_current(self, module_config: ModuleConfig) -> bool:
+        """a stamp only counts while the venv it was written for still exists"""
+        if not self.venv_python().exists():
+            return False
+        stamp_path = Path(module_config.module_path) / STAMP_NAME
+        stamp = self.stamp(module_config)
+        return stamp is not None and stamp_path.exists() and stamp_path.read_text(encoding="utf-8").strip() == stamp
+
+    def fetch(self, module_name: str) -> bool:
+        """brings the module's files up to date, returns whether its install script still has to run"""
+        module_config = self.module_config(module_name)
+        base_module = BaseModule.model_construct(module_config=module_config)
+        if base_module.install_bundle(module_config, run_install_script=False) is None:
+            # legacy registrar: several workers run this at once, so nothing may prompt on stdin
+            artifact = base_module.get_module(module_config, interactive=False)
+            store = base_module.module_store()
+            unpacked = any(path.name != f"setup_{module_name}.py" for path in Path(module_config.module_path).iterdir())
+            if store.installed(module_name) != artifact.sha256 or not unpacked:
+                base_module.run_setup_script(module_config)
+                store.mark_installed(module_name, artifact.sha256)
+        return not self.is_current(module_config)
+
+    def run_install(self, module_name: str):
+        module_config = self.module_config(module_name)
+        BaseModule.model_construct(module_config=module_config).run_install_script(module_config, env=self.pip_env())
+        (Path(module_config.module_path) / STAMP_NAME).write_text(self.stamp(module_config), encoding="utf-8")
+        logger.info(f"Installed {module_name}")
+
+    def install(self, module_names: List[str]) -> Dict[str, str]:
+        """installs module_names and their requirements, returns {module_name: installed | current | failed | skipped}"""
+        graph = self.resolve(module_names)
+        try:
+            order = TopologicalSorter(graph)
+            order.prepare()
+        except CycleError as e:
+            raise ValueError(f"Module requirements form a cycle: {e.args[1]}") from e
+
+        results: Dict[str, str] = {}
+        needs_install: Dict[str, bool] = {}
+        with ThreadPoolExecutor(max_workers=self.settings.fetch_workers) as pool:
+            jobs = {name: pool.submit(self.fetch, name) for name in graph}
+            for name, job in jobs.items():
+                try:
+                    needs_install[name] = job.result()
+                except Exception as e:
+                    logger.error(f"Fetching {name} failed: {str(e)}")
+                    results[name] = "failed"
+
+        with ThreadPoolExecutor(max_workers=self.settings.script_workers) as pool:
+            running: Dict[Future, str] = {}
+            while order.is_active():
+                for name in order.get_ready():
+                    if name in results:
+                        order.done(name)
+                    elif any(results.get(requirement) in ("failed", "skipped") for requirement in graph[name]):
+                        results[name] = "skipped"
+                        order.done(name)
+                    elif not needs_install[name]:
+                        results[name] = "current"
+                        order.done(name)
+                    else:
+                        running[pool.submit(self.run_install, name)] = name
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for job in finished:
+                    name = running.pop(job)
+                    try:
+                        job.result()
+                        results[name] = "installed"
+                    except Exception as e:
+                        logger.error(f"Installing {name} failed: {str(e)}")
+                        results[name] = "failed"
+                    order.done(name)
+
+        if self.settings.build_wheelhouse and "installed" in results.values():
+            self.build_wheelhouse()
+        return results
+
+    def build_wheelhouse(self):
+        """caches wheels for everything installed in the module venv so later installs skip the network"""
+        python = self.venv_python()
+        if not python.exists():
+            logger.warning(f"No venv at {self.settings.venv}, not building the wheelhouse")
+            return
+        frozen = subprocess.run([str(python), "-m", "pip", "freeze", "--exclude-editable"], capture_output=True, text=True, check=True).stdout
+        requirements = [line for line in frozen.splitlines() if line and not line.startswith("#")]
+        existing = {wheel.name.split("-")[0].lower().replace("_", "-") for wheel in self.wheelhouse.glob("*.whl")}
+        missing = [line for line in requirements if line.split("==")[0].split(" @ ")[0].lower().replace("_", "-") not in existing]
+        if not missing:
+            return
+        result = subprocess.run(
+            [str(python), "-m", "pip", "wheel", "--no-deps", "--wheel-dir", str(self.wheelhouse), *missing],
+            env=self.pip_env(),
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            logger.warning(f"Some wheels could not be cached: {result.stderr.strip().splitlines()[-1:]}")
+        logger.info(f"Wheelhouse holds {len(list(self.wheelhouse.glob('*.whl')))} wheels")
+
+
+if __name__ == "__main__":
+    # python -m base.module_installer http://localhost:8000 translation embedding whisper
+    installer = ModuleInstaller(sys.argv[1])
+    for installed_name, status in installer.install(sys.argv[2:]).items():
+        print(f"{installed_name:24} {status}")
@@ -0,0 +1,173 @@
+import base64
+import hashlib
+import json
+import os
+import string
+import threading
+import time
+import requests
+from loguru import logger
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+from data_models import ModuleStoreSettings
+
+
+BASE64_ALPHABET = (string.ascii_letters + string.digits + "+/=").encode("ascii")
+NOT_BASE64 = bytes(set(range(256)) - set(BASE64_ALPHABET))
+
+
+def hash_file(path: Path, chunk_size: int = 64 * 1024) -> str:
+    """sha256 of a file, read in chunks; the one hash used for store objects and bundle manifests"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ModuleArtifact(NamedTuple):
+    module_name: str
+    sha256: str
+    path: Path
+    etag: Optional[str]
+    changed: bool
+
+
+class ModuleStore:
+    """Content-addressed store of downloaded module artifacts.
+
+    Artifacts live under `objects/<sha256>` exactly as the registrar served them,
+    and `refs/<module_name>.json` records the ETag, hash and installed hash for
+    each module. Fetches are conditional on the stored ETag and stream the body
+    to disk, hashing it on the way, so an unchanged module costs one 304.
+    """
+    settings: ModuleStoreSettings
+
+    def __init__(self, settings: Optional[ModuleStoreSettings] = None):
+        self.settings = settings or ModuleStoreSettings()
+        self.path = Path(self.settings.path)
+        self.objects = self.path / "objects"
+        self.refs = self.path / "refs"
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.refs.mkdir(parents=True, exist_ok=True)
+
+    def object_path(self, sha256: str) -> Path:
+        return self.objects / sha256
+
+    def get_ref(self, module_name: str) -> Dict[str, Any]:
+        ref_path = self.refs / f"{module_name}.json"
+        if not ref_path.exists():
+            return {}
+        try:
+            return json.loads(ref_path.read_text(encoding="utf-8"))
+        except ValueError:
+            return {}
+
+    def set_ref(self, module_name: str, **fields: Any):
+        ref = {**self.get_ref(module_name), **fields}
+        ref_path = self.refs / f"{module_name}.json"
+        temp_path = ref_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(ref), encoding="utf-8")
+        os.replace(temp_path, ref_path)
+
+    def cached(self, module_name: str) -> Optional[ModuleArtifact]:
+        """returns the stored artifact for module_name when its object is present and intact"""
+        ref = self.get_ref(module_name)
+        sha256 = ref.get("sha256")
+        if not sha256 or not self.object_path(sha256).exists():
+            return None
+        if self.hash_file(self.object_path(sha256)) != sha256:
+            logger.warning(f"Stored artifact for {module_name} is corrupt, discarding it")
+            self.object_path(sha256).unlink()
+            return None
+        return ModuleArtifact(module_name, sha256, self.object_path(sha256), ref.get("etag"), False)
+
+    def fetch(self, module_name: str, url: str, payload: Optional[Dict[str, Any]] = None) -> ModuleArtifact:
+        """
+        downloads url into the store unless the server confirms the stored copy is current;
+        with a payload the request is a POST, which is never conditional
+        """
+        cached = self.cached(module_name)
+        headers = {"If-None-Match": cached.etag} if cached and cached.etag and payload is None else {}
+        method = "POST" if payload is not None else "GET"
+        with requests.request(method, url, json=payload, headers=headers, stream=True, timeout=self.settings.timeout) as response:
+            if response.status_code == 304 and cached:
+                logger.info(f"{module_name} is unchanged ({cached.sha256[:12]})")
+                return cached
+            response.raise_for_status()
+            sha256 = self.store_stream(response)
+            self.verify(response, sha256)
+
+        etag = response.headers.get("ETag")
+        changed = cached is None or cached.sha256 != sha256
+        self.set_ref(module_name, sha256=sha256, etag=etag, url=url)
+        logger.info(f"Fetched {module_name} ({sha256[:12]}){'' if changed else ', content unchanged'}")
+        return ModuleArtifact(module_name, sha256, self.object_path(sha256), etag, changed)
+
+    def store_stream(self, response: requests.Response) -> str:
+        digest = hashlib.sha256()
+        temp_path = self.objects / f"download-{os.getpid()}-{threading.get_ident()}.tmp"
+        received = 0
+        try:
+            with open(temp_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=self.settings.chunk_size):
+                    digest.update(chunk)
+                    f.write(chunk)
+                    received += len(chunk)
+            expected_length = response.headers.get("Content-Length")
+            if expected_length is not None and "Content-Encoding" not in response.headers and int(expected_length) != received:
+                raise IOError(f"Truncated download: received {received} of {expected_length} bytes")
+            sha256 = digest.hexdigest()
+            os.replace(temp_path, self.object_path(sha256))
+            return sha256
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+    def verify(self, response: requests.Response, sha256: str):
+        """checks the body against the hash the server advertised, if it advertised one"""
+        expected = response.headers.get("X-Content-SHA256")
+        digest_header = response.headers.get("Digest", "")
+        if not expected and digest_header.lower().startswith("sha-256="):
+            expected = base64.b64decode(digest_header.split("=", 1)[1]).hex()
+        if expected and expected.lower() != sha256:
+            self.object_path(sha256).unlink()
+            raise IOError(f"Integrity check failed: expected sha256 {expected}, got {sha256}")
+
+    def installed(self, module_name: str) -> Optional[str]:
+        return self.get_ref(module_name).get("installed")
+
+    def mark_installed(self, module_name: str, sha256: str):
+        self.set_ref(module_name, installed=sha256)
+
+    def prune(self, min_age: float = 3600.0):
+        """
+        removes objects that no module ref points at anymore; objects younger than min_age are
+        kept, since a concurrent fetch may not have written its ref yet
+        """
+        cutoff = time.time() - min_age
+        referenced = set()
+        for ref_path in self.refs.glob("*.json"):
+            ref = self.get_ref(ref_path.stem)
+            referenced.update(value for value in (ref.get("sha256"), ref.get("installed")) if value)
+        for object_path in self.objects.iterdir():
+            if object_path.name not in referenced and object_path.suffix != ".tmp" and object_path.stat().st_mtime < cutoff:
+                object_path.unlink()
+
+    def hash_file(self, path: Path) -> str:
+        return hash_file(path, self.settings.chunk_size)
+
+    def decode_to(self, artifact: ModuleArtifact, target: Path):
+        """decodes a base64 artifact into target chunk by chunk, ignoring quotes and whitespace"""
+        temp_path = target.with_suffix(target.suffix + ".tmp")
+        pending = b""
+        with open(artifact.path, "rb") as source, open(temp_path, "wb") as out:
+            while chunk := source.read(self.settings.chunk_size):
+                pending += chunk.translate(None, NOT_BASE64)
+                usable = len(pending) - len(pending) % 4
+                out.write(base64.b64decode(pending[:usable]))
+                pending = pending[usable:]
+            if pending:
+                out.write(base64.b64decode(pending + b"=" * (-len(pending) % 4)))
+        os.replace(temp_path, target)
@@ -0,0 +1,181 @@
+import asyncio
+import time
+import numpy as np
+from dataclasses import dataclass, field
+from loguru import logger
+from typing import Any, Dict, List, Optional
+
+from data_models import MinerRequest, MinerResponse, PipelineSettings
+
+
+STAGES = ("sample", "query", "score", "vote")
+
+
+@dataclass
+class ValidationRound:
+    round_id: int
+    sample_data: Any
+    request: MinerRequest
+    miner_uids: List[int]
+    miner_addresses: List[str]
+    responses: List[MinerResponse] = field(default_factory=list)
+    miner_weights: Optional[np.ndarray] = None
+    weight_uids: Optional[np.ndarray] = None
+    started_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class StageStats:
+    """Seconds a stage spent working, waiting for input and blocked on a full output queue."""
+    count: int = 0
+    busy: float = 0.0
+    idle: float = 0.0
+    blocked: float = 0.0
+    last: float = 0.0
+    max: float = 0.0
+
+    def record(self, busy: float):
+        self.count += 1
+        self.busy += busy
+        self.last = busy
+        self.max = max(self.max, busy)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.busy / self.count if self.count else 0.0,
+            "last": self.last,
+            "max": self.max,
+            "busy": self.busy,
+            "idle": self.idle,
+            "blocked": self.blocked,
+        }
+
+
+class VotePipeline:
+    """Runs sample -> query -> score -> vote as concurrent stages joined by bounded queues.
+
+    A full queue blocks the stage feeding it, so a slow vote holds back scoring
+    and querying instead of piling up rounds. The vote stage only submits the
+    newest weights it has, since the moving average already folds in older rounds.
+    """
+    settings: PipelineSettings
+    stats: Dict[str, StageStats]
+
+    def __init__(self, validator, settings: PipelineSettings):
+        self.validator = validator
+        self.settings = settings
+        self.stats = {stage: StageStats() for stage in STAGES}
+        self.rounds_completed = 0
+
+    def summary(self) -> Dict[str, Any]:
+        stages = {stage: stats.summary() for stage, stats in self.stats.items()}
+        bottleneck = max(stages, key=lambda stage: stages[stage]["mean"])
+        return {"rounds_completed": self.rounds_completed, "bottleneck": bottleneck, "stages": stages}
+
+    async def _get(self, stage: str, queue: asyncio.Queue):
+        start = time.perf_counter()
+        item = await queue.get()
+        self.stats[stage].idle += time.perf_counter() - start
+        return item
+
+    async def _put(self, stage: str, queue: asyncio.Queue, item):
+        start = time.perf_counter()
+        await queue.put(item)
+        self.stats[stage].blocked += time.perf_counter() - start
+
+    async def sample_stage(self, out_queue: asyncio.Queue, rounds: Optional[int]):
+        round_id = 0
+        while rounds is None or round_id < rounds:
+            next_round = time.monotonic() + self.settings.round_interval
+            start = time.perf_counter()
+            # both may block: sampling reads the dataset and a cold address cache queries the chain
+            sample_data, request = await asyncio.to_thread(self.validator.sample)
+            miner_uids, miner_addresses = await asyncio.to_thread(self.validator.collect_miner_addresses)
+            self.stats["sample"].record(time.perf_counter() - start)
+            await self._put(
+                "sample",
+                out_queue,
+                ValidationRound(round_id, sample_data, request, miner_uids, miner_addresses),
+            )
+            round_id += 1
+            await asyncio.sleep(max(0.0, next_round - time.monotonic()))
+        await out_queue.put(None)
+
+    async def query_stage(self, in_queue: asyncio.Queue, out_queue: asyncio.Queue):
+        while (validation_round := await self._get("query", in_queue)) is not None:
+            start = time.perf_counter()
+            try:
+                validation_round.responses = await self.validator.validate(
+                    validation_round.sample_data,
+                    validation_round.request,
+                    validation_round.miner_uids,
+                    validation_round.miner_addresses,
+                )
+            except Exception as e:
+                logger.error(f"Round {validation_round.round_id} query failed: {str(e)}")
+                continue
+            finally:
+                self.stats["query"].record(time.perf_counter() - start)
+            await self._put("query", out_queue, validation_round)
+        await out_queue.put(None)
+
+    async def score_stage(self, in_queue: asyncio.Queue, out_queue: asyncio.Queue):
+        while (validation_round := await self._get("score", in_queue)) is not None:
+            start = time.perf_counter()
+            try:
+                results = await asyncio.to_thread(
+                    self.validator.score,
+                    validation_round.sample_data,
+                    validation_round.request,
+                    validation_round.responses,
+                )
+                await asyncio.to_thread(self.validator.record_round, validation_round.responses, results)
+                miner_uids = np.asarray([response.miner_uid for response in validation_round.responses], dtype=np.int64)
+                normalized_results = self.validator.normalize(results)
+                self.validator.scale(miner_uids, normalized_results)
+                validation_round.weight_uids, validation_round.miner_weights = self.validator.scoreboard.weights()
+            except Exception as e:
+                logger.error(f"Round {validation_round.round_id} scoring failed: {str(e)}")
+                continue
+            finally:
+                self.stats["score"].record(time.perf_counter() - start)
+            await self._put("score", out_queue, validation_round)
+        await out_queue.put(None)
+
+    async def vote_stage(self, in_queue: asyncio.Queue):
+        while (validation_round := await self._get("vote", in_queue)) is not None:
+            while not in_queue.empty():
+                newer_round = in_queue.get_nowait()
+                if newer_round is None:
+                    in_queue.put_nowait(None)
+                    break
+                validation_round = newer_round
+            start = time.perf_counter()
+            try:
+                await asyncio.to_thread(
+                    self.validator.vote,
+                    validation_round.weight_uids,
+                    validation_round.miner_weights,
+                    validation_round.miner_addresses,
+                )
+            except Exception as e:
+                logger.error(f"Round {validation_round.round_id} vote failed: {str(e)}")
+            finally:
+                self.stats["vote"].record(time.perf_counter() - start)
+            self.rounds_completed = validation_round.round_id + 1
+            if self.rounds_completed % self.settings.log_every == 0:
+                logger.info(f"Vote pipeline: {self.summary()}")
+
+    async def run(self, rounds: Optional[int] = None):
+        queues = [asyncio.Queue(maxsize=self.settings.queue_size) for _ in range(len(STAGES) - 1)]
+        try:
+            await asyncio.gather(
+                self.sample_stage(queues[0], rounds),
+                self.query_stage(queues[0], queues[1]),
+                self.score_stage(queues[1], queues[2]),
+                self.vote_stage(queues[2]),
+            )
+        finally:
+            await self.validator.fanout.close()
+        return self.summary()
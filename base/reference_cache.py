@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from loguru import logger
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from data_models import ReferenceCacheSettings
+
+
+ReferenceOutput = Tuple[Optional[str], Optional[bytes]]
+
+
+class ReferenceCache:
+    """Disk-backed LRU cache of reference outputs (text plus WAV) keyed by content.
+
+    Each entry is `<key>.txt` and/or `<key>.wav` under the cache directory. File
+    modification times carry the recency order across restarts, and the least
+    recently used entries are evicted once the cache grows past `max_bytes`.
+    """
+    settings: ReferenceCacheSettings
+    hits: int
+    misses: int
+
+    def __init__(self, settings: ReferenceCacheSettings):
+        self.settings = settings
+        self.path = Path(settings.path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        self._load()
+
+    def _load(self):
+        entries: Dict[str, Tuple[float, int]] = {}
+        for file in self.path.iterdir():
+            if file.suffix not in (".txt", ".wav"):
+                continue
+            stat = file.stat()
+            mtime, size = entries.get(file.stem, (0.0, 0))
+            entries[file.stem] = (max(mtime, stat.st_mtime), size + stat.st_size)
+        for key, (_, size) in sorted(entries.items(), key=lambda item: item[1][0]):
+            self._entries[key] = size
+            self._size += size
+
+    @staticmethod
+    def make_key(task_string: str, source_language: Optional[str], target_language: str, input_data: Union[str, bytes]) -> str:
+        digest = hashlib.sha256()
+        digest.update(json.dumps([task_string, source_language, target_language]).encode("utf-8"))
+        digest.update(input_data.encode("utf-8") if isinstance(input_data, str) else input_data)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[ReferenceOutput]:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        text_path, audio_path = self.path / f"{key}.txt", self.path / f"{key}.wav"
+        try:
+            text = text_path.read_text(encoding="utf-8") if text_path.exists() else None
+            audio = audio_path.read_bytes() if audio_path.exists() else None
+            for file in (text_path, audio_path):
+                if file.exists():
+                    os.utime(file)
+        except OSError as e:
+            logger.error(f"Error reading reference cache entry {key}: {str(e)}")
+            self.discard(key)
+            return None
+        return text, audio
+
+    def put(self, key: str, text: Optional[str], audio: Optional[bytes]):
+        size = 0
+        for suffix, data in ((".txt", text.encode("utf-8") if text is not None else None), (".wav", audio)):
+            if data is None:
+                continue
+            temp_path = self.path / f"{key}{suffix}.tmp"
+            temp_path.write_bytes(data)
+            os.replace(temp_path, self.path / f"{key}{suffix}")
+            size += len(data)
+        with self._lock:
+            self._size += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+            evicted = []
+            while self._size > self.settings.max_bytes and len(self._entries) > 1:
+                old_key, old_size = self._entries.popitem(last=False)
+                self._size -= old_size
+                evicted.append(old_key)
+        for old_key in evicted:
+            self._remove_files(old_key)
+
+    def get_or_compute(
+        self,
+        task_string: str,
+        source_language: Optional[str],
+        target_language: str,
+        input_data: Union[str, bytes],
+        compute: Callable[[], ReferenceOutput],
+    ) -> ReferenceOutput:
+        key = self.make_key(task_string, source_language, target_language, input_data)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        text, audio = compute()
+        self.put(key, text, audio)
+        return text, audio
+
+    def discard(self, key: str):
+        with self._lock:
+            self._size -= self._entries.pop(key, 0)
+        self._remove_files(key)
+
+    def _remove_files(self, key: str):
+        for suffix in (".txt", ".wav"):
+            (self.path / f"{key}{suffix}").unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "max_bytes": self.settings.max_bytes,
+        }
@@ -0,0 +1,115 @@
+import numpy as np
+from typing import Iterable, Tuple
+
+from data_models import ScoringSettings
+
+
+NORMALIZATIONS = ("minmax", "zscore", "softmax")
+
+
+def normalize_scores(scores: np.ndarray, method: str = "minmax", temperature: float = 1.0) -> np.ndarray:
+    """Normalizes scores along the last axis, so a 2D array is normalized row by row.
+
+    NaN scores (failed or missing miners) count as 0.
+    """
+    scores = np.nan_to_num(np.asarray(scores, dtype=np.float64), nan=0.0, posinf=0.0, neginf=0.0)
+    if scores.size == 0:
+        return scores
+    if method == "minmax":
+        low = scores.min(axis=-1, keepdims=True)
+        span = scores.max(axis=-1, keepdims=True) - low
+        return np.divide(scores - low, span, out=np.zeros_like(scores), where=span > 0)
+    if method == "zscore":
+        centered = scores - scores.mean(axis=-1, keepdims=True)
+        std = scores.std(axis=-1, keepdims=True)
+        return np.divide(centered, std, out=np.zeros_like(scores), where=std > 0)
+    if method == "softmax":
+        if temperature <= 0:
+            raise ValueError("Softmax temperature must be positive")
+        logits = scores / temperature
+        logits -= logits.max(axis=-1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=-1, keepdims=True)
+    raise ValueError(f"Invalid normalization {method}, expected one of {NORMALIZATIONS}")
+
+
+class ScoreBoard:
+    """Per-miner scores kept in NumPy arrays indexed by uid.
+
+    `ema` holds the exponential moving average across rounds, `active` marks
+    uids that are currently registered and `seen` marks uids whose average has
+    been seeded. Deregistering a uid clears its slot in place.
+    """
+    settings: ScoringSettings
+    ema: np.ndarray
+    active: np.ndarray
+    seen: np.ndarray
+
+    def __init__(self, settings: ScoringSettings, capacity: int = 256):
+        self.settings = settings
+        self.ema = np.zeros(capacity, dtype=np.float64)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.seen = np.zeros(capacity, dtype=bool)
+
+    @property
+    def capacity(self) -> int:
+        return self.ema.shape[0]
+
+    def _ensure_capacity(self, size: int):
+        if size <= self.capacity:
+            return
+        old_capacity = self.capacity
+        capacity = max(size, old_capacity * 2)
+        self.ema = np.resize(self.ema, capacity)
+        self.active = np.resize(self.active, capacity)
+        self.seen = np.resize(self.seen, capacity)
+        self.ema[old_capacity:] = 0.0
+        self.active[old_capacity:] = False
+        self.seen[old_capacity:] = False
+
+    def normalize(self, scores: np.ndarray) -> np.ndarray:
+        return normalize_scores(scores, self.settings.normalization, self.settings.temperature)
+
+    def update(self, miner_uids: Iterable[int], normalized_scores: np.ndarray) -> np.ndarray:
+        """folds one round of normalized scores into the moving average, returns the uids' new averages"""
+        miner_uids = np.asarray(miner_uids, dtype=np.int64)
+        normalized_scores = np.asarray(normalized_scores, dtype=np.float64)
+        if miner_uids.size == 0:
+            return normalized_scores
+        self._ensure_capacity(int(miner_uids.max()) + 1)
+        alpha = self.settings.ema_alpha
+        previous = self.ema[miner_uids]
+        self.ema[miner_uids] = np.where(
+            self.seen[miner_uids],
+            alpha * normalized_scores + (1.0 - alpha) * previous,
+            normalized_scores,
+        )
+        self.seen[miner_uids] = True
+        self.active[miner_uids] = True
+        return self.ema[miner_uids]
+
+    def deregister(self, miner_uids: Iterable[int]):
+        miner_uids = np.asarray(list(miner_uids), dtype=np.int64)
+        miner_uids = miner_uids[miner_uids < self.capacity]
+        self.ema[miner_uids] = 0.0
+        self.active[miner_uids] = False
+        self.seen[miner_uids] = False
+
+    def sync_registered(self, miner_uids: Iterable[int]):
+        """deregisters every active uid that is missing from miner_uids"""
+        miner_uids = np.asarray(list(miner_uids), dtype=np.int64)
+        if miner_uids.size:
+            self._ensure_capacity(int(miner_uids.max()) + 1)
+        registered = np.zeros(self.capacity, dtype=bool)
+        registered[miner_uids] = True
+        self.deregister(np.flatnonzero(self.active & ~registered))
+
+    def weights(self) -> Tuple[np.ndarray, np.ndarray]:
+        """returns (miner_uids, weights) for every active uid, weights scaled to integers summing to about max_weight"""
+        miner_uids = np.flatnonzero(self.active)
+        scores = np.clip(self.ema[miner_uids], 0.0, None)
+        total = scores.sum()
+        if total <= 0:
+            return miner_uids, np.zeros(miner_uids.shape[0], dtype=np.int64)
+        weights = np.rint(scores / total * self.settings.max_weight).astype(np.int64)
+        return miner_uids, weights
@@ -0,0 +1,75 @@
+import base64
+import json
+import time
+import msgpack
+from typing import Any, Dict, Optional, Tuple
+
+
+MSGPACK = "application/msgpack"
+JSON = "application/json"
+
+
+def to_json_safe(value: Any) -> Any:
+    """Replaces bytes with base64 strings, the form JSON-only miners expect."""
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode("utf-8")
+    if isinstance(value, dict):
+        return {key: to_json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json_safe(item) for item in value]
+    return value
+
+
+def encode_payload(payload: Dict[str, Any], binary: bool = True, accept_binary: Optional[bool] = None) -> Tuple[bytes, Dict[str, str]]:
+    """
+    returns (body, headers); binary bodies are msgpack with raw bytes fields. accept_binary
+    (defaulting to binary) offers msgpack replies, which a JSON body can do as well
+    """
+    accept = f"{MSGPACK}, {JSON};q=0.5" if (binary if accept_binary is None else accept_binary) else JSON
+    if binary:
+        body = msgpack.packb(payload, use_bin_type=True)
+        return body, {"Content-Type": MSGPACK, "Accept": accept}
+    body = json.dumps(to_json_safe(payload)).encode("utf-8")
+    return body, {"Content-Type": JSON, "Accept": accept}
+
+
+def is_binary(content_type: Optional[str]) -> bool:
+    return (content_type or "").split(";")[0].strip() == MSGPACK
+
+
+def decode_body(content_type: str, body: bytes) -> Any:
+    if not body:
+        return None
+    if is_binary(content_type):
+        return msgpack.unpackb(body, raw=False)
+    return json.loads(body)
+
+
+def benchmark(seconds=(1, 5, 15), sample_rate: int = 16000, iterations: int = 50) -> Dict[str, Dict[str, float]]:
+    """Compares bytes on the wire and round-trip serialization time for WAV-sized payloads."""
+    report = {}
+    for duration in seconds:
+        for sample_width, label in ((2, "pcm16"), (4, "float32")):
+            audio = bytes(duration * sample_rate * sample_width)
+            payload = {"data": {"input": audio, "task_string": "speech2text", "source_language": "English", "target_language": "French"}}
+            for binary in (False, True):
+                start = time.perf_counter()
+                for _ in range(iterations):
+                    body, headers = encode_payload(payload, binary)
+                    decode_body(headers["Content-Type"], body)
+                elapsed = (time.perf_counter() - start) / iterations
+                report[f"{duration}s-{label}-{'msgpack' if binary else 'json'}"] = {
+                    "audio_bytes": len(audio),
+                    "wire_bytes": len(body),
+                    "overhead": len(body) / len(audio) - 1,
+                    "round_trip_ms": elapsed * 1000,
+                }
+    return report
+
+
+if __name__ == "__main__":
+    for name, metrics in benchmark().items():
+        print(
+            f"{name:24} {metrics['wire_bytes']:>10} bytes "
+            f"({metrics['overhead']:+.1%}) {metrics['round_trip_ms']:8.3f} ms"
+        )
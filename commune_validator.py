@@ -1,12 +1,17 @@
 import os
 import json
 import requests
+import io
 import base64
+import random
+import torchaudio
+import numpy as np
+from difflib import SequenceMatcher
 from requests import Response, Request
 from typing import List, Dict, Tuple, Any, Optional
 from base.base_module import BaseModule, ModuleConfig
 from base.base_validator import ValdiatorExecutor, ValidatorSettings
-from data_models import MinerRequest, CLIENT_FILES
+from data_models import MinerRequest, MinerResponse, CLIENT_FILES, TOPICS
 from load_dotenv import load_dotenv
 
 
@@ -26,6 +31,10 @@ validator_config = ValidatorSettings(
     subnet_list=[10, 0]
 )
 
+SAMPLE_LANGUAGES = ["French", "German", "Spanish", "Italian", "Portuguese", "Japanese"]
+SAMPLE_TASKS = ["text2text", "text2speech"]
+OUTPUT_CODECS = ["opus", "vorbis", "flac", "pcm16"]
+
 module_config = ModuleConfig(
     module_name="translation",
     module_endpoint="/modules/translation",
@@ -40,44 +49,103 @@ class CommuneValidator(ValdiatorExecutor):
         self.validator_config = validator_config
         self.module_config = module_config
         self.module = self.get_module(self.module_config)
-        self.miner_statistics = {}
+        self.reference_model = None
+        self.address_cache.start([10])
       
-    def collect_miner_addresses(self) -> Tuple[List[int], List[str]]:
-        url = f"{self.chain_api}/comx/query_map_addresses?subnet=10"
+    def query_map_addresses(self, subnet: int) -> Dict[int, str]:
+        url = f"{self.chain_api}/comx/query_map_addresses?subnet={subnet}"
         result = requests.get(url, timeout=30)
-        print(result.json())
+        return {int(uid): address for uid, address in result.json().items()}
         
-    def validate(self, sample_data: Any, request: MinerRequest, miners: List[str]) -> Tuple[int, List[float]]:
-        sample_data = 
-    request_path = "modules/translation/in/request.txt"
-    with open(request_path, "w", encoding="utf-8") as f:
-        json.dumps(f.write(sample_data))
-    
-    module = validator.get_module(module_config)()
-    data = module.process(
-        in_file="modules/translation/in/request.txt",
-        task_string="text2speech",
-        target_languages=["French"]
-    )
-    
-    with open("modules/translation/out/test_output.txt", "wb") as f:
-        f.write(data[1])
+    def sample(self) -> Tuple[Any, MinerRequest]:
+        sample_data = random.choice(TOPICS)
+        request = MinerRequest(
+            data={
+                "task_string": random.choice(SAMPLE_TASKS),
+                "source_language": "English",
+                "target_language": random.choice(SAMPLE_LANGUAGES),
+                "output_codecs": OUTPUT_CODECS,
+            }
+        )
+        return sample_data, request
         
-    def normalize(self, results: List[float]) -> List[float]:
-        """returns a tuple of (miner_uids, normalized_results)"""
-        pass
+    async def validate(self, sample_data: Any, request: MinerRequest, miner_uids: List[int], miner_addresses: List[str]) -> List[MinerResponse]:
+        miner_request = self.construct_miner_request(sample_data, request)
+        return await self.query_miners(miner_request, miner_uids, miner_addresses)
         
-    def scale(self, normalized_results: List[float]) -> List[float]:
-        """returns a list of scaled results"""
-        pass
+    def generate_reference(self, sample_data: Any, request: MinerRequest) -> Tuple[Optional[str], Optional[bytes]]:
+        if self.reference_model is None:
+            self.reference_model = self.module()
+        task_string = request.data["task_string"]
+        target_language = request.data["target_language"]
+        if self.reference_model.takes_speech(task_string):
+            translation_input = self.reference_model.decode_audio(base64.b64decode(sample_data))
+        else:
+            translation_input = sample_data
+        results = self.reference_model.translate(
+            translation_input,
+            task_string=task_string,
+            source_language=request.data["source_language"],
+            target_languages=[target_language],
+            output_codecs=["flac", "pcm16"],
+        )
+        return results[target_language]
+
+    def reference(self, sample_data: Any, request: MinerRequest) -> Tuple[Optional[str], Optional[bytes]]:
+        return self.reference_cache.get_or_compute(
+            request.data["task_string"],
+            request.data["source_language"],
+            request.data["target_language"],
+            sample_data,
+            lambda: self.generate_reference(sample_data, request),
+        )
         
-    def vote(self, miner_uids: List[int], scaled_results: List[float], miner_addresses: List[str]) -> Any:
-        """votes on the chain, returns the receipt"""
-        pass
+    @staticmethod
+    def audio_seconds(audio: Any) -> Optional[float]:
+        """Decodes a miner's audio reply (raw bytes or base64, any negotiated codec) into a tensor, returns its duration."""
+        if not audio:
+            return None
+        if isinstance(audio, str):
+            audio = base64.b64decode(audio)
+        try:
+            waveform, sample_rate = torchaudio.load(io.BytesIO(audio))
+        except Exception:
+            return None
+        return waveform.shape[-1] / sample_rate
 
-    def voteloop(self, miner_uids: List[int], scaled_results: List[float], miner_addresses: List[str]) -> Any:
-        """main voting loop""" 
-        pass
+    def score(self, sample_data: Any, request: MinerRequest, responses: List[MinerResponse]) -> np.ndarray:
+        reference_text, reference_audio = self.reference(sample_data, request)
+        task_string = request.data["task_string"]
+        compare_text = reference_text is not None and task_string.endswith("2text")
+        reference_seconds = self.audio_seconds(reference_audio) if task_string.endswith("2speech") else None
+        scores = np.zeros(len(responses), dtype=np.float64)
+        for index, response in enumerate(responses):
+            if not response.success or not response.data:
+                continue
+            similarity = 1.0
+            if compare_text:
+                similarity = SequenceMatcher(None, reference_text, str(response.data)).ratio()
+            elif task_string.endswith("2speech"):
+                seconds = self.audio_seconds(response.data)
+                if not seconds:
+                    continue
+                if reference_seconds:
+                    similarity = min(seconds, reference_seconds) / max(seconds, reference_seconds)
+            scores[index] = similarity / (1.0 + response.latency)
+        return scores
+        
+    def normalize(self, results: np.ndarray) -> np.ndarray:
+        return self.scoreboard.normalize(results)
         
+    def scale(self, miner_uids: np.ndarray, normalized_results: np.ndarray) -> np.ndarray:
+        self.scoreboard.sync_registered(self.address_cache.get(10).miner_uids)
+        return self.scoreboard.update(miner_uids, normalized_results)
         
+    def vote(self, miner_uids: np.ndarray, scaled_results: np.ndarray, miner_addresses: List[str]) -> Any:
+        """votes on the chain, returns the receipt"""
+        pass
+
+
 if __name__ == "__main__":
+    validator = CommuneValidator(validator_config)
+    validator.voteloop()
@@ -142,6 +142,62 @@ class ConfigDict(BaseModel):
     arbitrary_types_allowed: bool = True
 
 
+class FanoutSettings(BaseModel):
+    max_in_flight: int = Field(default=64)
+    miner_timeout: float = Field(default=12.0)
+    round_timeout: float = Field(default=30.0)
+    connect_timeout: float = Field(default=3.0)
+    keepalive_timeout: float = Field(default=75.0)
+    binary_transport: bool = Field(default=True)
+
+
+class AddressCacheSettings(BaseModel):
+    ttl: float = Field(default=60.0)
+    refresh_interval: float = Field(default=30.0)
+
+
+class ScoringSettings(BaseModel):
+    normalization: str = Field(default="minmax")
+    temperature: float = Field(default=1.0)
+    ema_alpha: float = Field(default=0.1)
+    max_weight: int = Field(default=65535)
+
+
+class PipelineSettings(BaseModel):
+    queue_size: int = Field(default=2)
+    round_interval: float = Field(default=12.0)
+    log_every: int = Field(default=10)
+
+
+class StatsSettings(BaseModel):
+    path: str = Field(default="data/miner_stats.db")
+    window: int = Field(default=100)
+    max_page_size: int = Field(default=500)
+
+
+class ReferenceCacheSettings(BaseModel):
+    path: str = Field(default="data/reference_cache")
+    max_bytes: int = Field(default=512 * 1024 * 1024)
+
+
+class ModuleStoreSettings(BaseModel):
+    path: str = Field(default="data/module_store")
+    chunk_size: int = Field(default=64 * 1024)
+    timeout: float = Field(default=30.0)
+
+
+class ModuleInstallerSettings(BaseModel):
+    wheelhouse: str = Field(default="data/wheelhouse")
+    pip_cache: str = Field(default="data/pip_cache")
+    index_url: Optional[str] = Field(default=None)
+    # the environment install scripts activate; stamps and the wheelhouse are taken from it
+    venv: str = Field(default=".venv")
+    fetch_workers: int = Field(default=8)
+    # modules share ./.venv and the dpkg lock, so install scripts run one at a time unless raised
+    script_workers: int = Field(default=1)
+    build_wheelhouse: bool = Field(default=True)
+
+
 class ValidatorSettings(BaseModel):
     name: str
     ss58_address: str
@@ -153,6 +209,12 @@ class ValidatorSettings(BaseModel):
     chain: str
     use_testnet: bool
     subnet_list: Optional[List[int]]
+    fanout: FanoutSettings = Field(default_factory=FanoutSettings)
+    address_cache: AddressCacheSettings = Field(default_factory=AddressCacheSettings)
+    scoring: ScoringSettings = Field(default_factory=ScoringSettings)
+    pipeline: PipelineSettings = Field(default_factory=PipelineSettings)
+    stats: StatsSettings = Field(default_factory=StatsSettings)
+    reference_cache: ReferenceCacheSettings = Field(default_factory=ReferenceCacheSettings)
 
 
 class GenerationMessages(BaseModel):
@@ -185,6 +247,20 @@ CLIENT_FILES = {
 
 class MinerRequest(BaseModel):
     data: Any = Field(default=None)
+
+
+class MinerResponse(BaseModel):
+    miner_uid: int
+    miner_address: str
+    data: Any = Field(default=None)
+    status_code: Optional[int] = None
+    latency: float = Field(default=0.0)
+    bytes_received: int = Field(default=0)
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None and self.status_code == 200
     
     
 class ModuleConfig(BaseModel):
@@ -0,0 +1,77 @@
+import asyncio
+from loguru import logger
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from .executor import InferenceExecutor
+
+
+class MicroBatcher:
+    """Gathers concurrent requests for up to `max_wait` seconds and runs them as batches.
+
+    Requests are grouped by `batch_key`, so only requests that can share one
+    inference call are batched together. A group is flushed as soon as it holds
+    `max_batch_size` requests or its oldest request has waited `max_wait`.
+    `process_batch` may return an exception in place of a result to fail only
+    that request; an exception raised by `process_batch` fails the whole group.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], List[Any]],
+        batch_key: Callable[[Any], Hashable],
+        max_batch_size: int = 8,
+        max_wait: float = 0.005,
+        executor: Optional[InferenceExecutor] = None,
+    ):
+        self.process_batch = process_batch
+        self.executor = executor
+        self.batch_key = batch_key
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.pending: Dict[Hashable, List[Tuple[Any, asyncio.Future]]] = {}
+        self.timers: Dict[Hashable, asyncio.TimerHandle] = {}
+
+    async def submit(self, request: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = self.batch_key(request)
+        group = self.pending.setdefault(key, [])
+        group.append((request, future))
+        if len(group) >= self.max_batch_size:
+            self.flush(key)
+        elif len(group) == 1:
+            self.timers[key] = loop.call_later(self.max_wait, self.flush, key)
+        return await future
+
+    def flush(self, key: Hashable):
+        timer = self.timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        group = self.pending.pop(key, None)
+        if group:
+            asyncio.get_running_loop().create_task(self.run_batch(group))
+
+    async def run_batch(self, group: List[Tuple[Any, asyncio.Future]]):
+        requests = [request for request, _ in group]
+        try:
+            results = await self.execute(requests)
+            if len(results) != len(requests):
+                raise RuntimeError(f"Batch returned {len(results)} results for {len(requests)} requests")
+        except Exception as e:
+            logger.error(f"Batch of {len(requests)} failed: {str(e)}")
+            for _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(group, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def execute(self, requests: List[Any]) -> List[Any]:
+        if self.executor is not None:
+            return await self.executor.run(self.process_batch, requests)
+        return await asyncio.to_thread(self.process_batch, requests)
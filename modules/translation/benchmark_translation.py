@@ -0,0 +1,77 @@
+import time
+import torch
+from loguru import logger
+from typing import Any, Dict, List
+
+from .data_models import TranslationConfig
+from .translation import Translation
+
+
+BENCHMARK_TEXT = (
+    "The pursuit of knowledge has always driven people to explore the unknown, "
+    "question what they were taught and share what they discovered with others."
+)
+
+CPU_CONFIGS = {
+    "cpu-float32": TranslationConfig(device="cpu", dtype="float32"),
+    "cpu-bfloat16": TranslationConfig(device="cpu", dtype="bfloat16"),
+    "cpu-int8": TranslationConfig(device="cpu", dtype="float32", quantize_int8=True),
+}
+
+
+def count_tokens(translation: Translation, text: str, tgt_lang: str) -> int:
+    try:
+        encoder = translation.translator.text_tokenizer.create_encoder(lang=tgt_lang, mode="target")
+        return int(encoder(text).numel())
+    except Exception:
+        return len(text.split())
+
+
+def benchmark_config(
+    config: TranslationConfig,
+    task_strings: List[str],
+    target_language: str = "French",
+    iterations: int = 5,
+) -> Dict[str, Dict[str, float]]:
+    """Returns tokens per second and real-time factor (compute seconds per second of audio) per task."""
+    translation = Translation(config)
+    src_lang = translation.target_languages["English"]
+    tgt_lang = translation.target_languages[target_language]
+    results = {}
+    for task_string in task_strings:
+        task_str = translation.task_strings[task_string]
+        with torch.inference_mode():
+            translation.translator.predict(input=BENCHMARK_TEXT, task_str=task_str, src_lang=src_lang, tgt_lang=tgt_lang)
+            elapsed, tokens, audio_seconds = 0.0, 0, 0.0
+            for _ in range(iterations):
+                start = time.perf_counter()
+                text_output, speech_output = translation.translator.predict(
+                    input=BENCHMARK_TEXT, task_str=task_str, src_lang=src_lang, tgt_lang=tgt_lang
+                )
+                elapsed += time.perf_counter() - start
+                tokens += count_tokens(translation, str(text_output[0]), tgt_lang)
+                if speech_output:
+                    audio_seconds += speech_output.audio_wavs[0][0].shape[-1] / speech_output.sample_rate
+        results[task_string] = {
+            "seconds_per_request": elapsed / iterations,
+            "tokens_per_second": tokens / elapsed,
+            "real_time_factor": elapsed / audio_seconds if audio_seconds else 0.0,
+        }
+    return results
+
+
+def run_benchmark(configs: Dict[str, TranslationConfig] = CPU_CONFIGS, iterations: int = 5) -> Dict[str, Any]:
+    report = {}
+    for name, config in configs.items():
+        logger.info(f"Benchmarking {name}")
+        report[name] = benchmark_config(config, ["text2text", "text2speech"], iterations=iterations)
+        for task_string, metrics in report[name].items():
+            logger.info(
+                f"{name} {task_string}: {metrics['tokens_per_second']:.1f} tokens/s, "
+                f"RTF {metrics['real_time_factor']:.3f}, {metrics['seconds_per_request']:.2f} s/request"
+            )
+    return report
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -1,19 +1,28 @@
+import gc
 import os
+import asyncio
+import signal
+import socket
 import torch
 import json
 import requests
 import base64
 import subprocess
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 from pydantic import BaseModel, Field
-from typing import Dict, Union, Optional, Any
+from typing import Dict, Hashable, List, Union, Optional, Any
 from abc import ABC, abstractmethod
-from fastapi import APIRouter, FastAPI
+from fastapi import APIRouter, FastAPI, HTTPException, Request
 from substrateinterface.keypair import Keypair
 from communex._common import get_node_url
 from communex.client import CommuneClient
 
+from .batching import MicroBatcher
+from .executor import InferenceExecutor
+from .transport import decode_request, encode_response
+
 comx = CommuneClient(get_node_url())
 
 app = FastAPI()
@@ -137,20 +146,37 @@ class MinerRequest(BaseModel):
     data: Any = Field(default=None)
 
 
+DTYPES = {
+    "float16": torch.float16,
+    "bfloat16": torch.bfloat16,
+    "float32": torch.float32,
+}
+
+
 class TranslationConfig(BaseModel):
-    model_name_or_card: Union[str, Any] = "seamlessM4T_V2_large"
-    vocoder_name: str = (
-        "vocoder_v2"
-        if model_name_or_card == "seamlessM4T_V2_large"
-        else "vocoder_36langs"
-    )
-    device: Any = torch.device(device="cuda:0")
-    text_tokenizer: str = model_name_or_card
-    apply_mintox: bool = (True,)
-    dtype: Any = (torch.float16,)
-    input_modality: Optional[Any] = (None,)
+    model_name_or_card: Union[str, Any] = "seamlessM4T_v2_large"
+    vocoder_name: str = "vocoder_v2"
+    device: str = Field(default_factory=lambda: os.getenv("TRANSLATION_DEVICE", "cuda:0" if torch.cuda.is_available() else "cpu"))
+    dtype: str = Field(default_factory=lambda: os.getenv("TRANSLATION_DTYPE", "float16" if torch.cuda.is_available() else "float32"))
+    quantize_int8: bool = Field(default_factory=lambda: os.getenv("TRANSLATION_QUANTIZE_INT8", "false").lower() == "true")
+    intra_op_threads: Optional[int] = Field(default_factory=lambda: int(os.getenv("TRANSLATION_INTRA_OP_THREADS", 0)) or None)
+    inter_op_threads: Optional[int] = Field(default_factory=lambda: int(os.getenv("TRANSLATION_INTER_OP_THREADS", 0)) or None)
+    numa_node: Optional[int] = Field(default_factory=lambda: int(os.environ["TRANSLATION_NUMA_NODE"]) if os.getenv("TRANSLATION_NUMA_NODE") else None)
+    text_tokenizer: str = "seamlessM4T_v2_large"
+    apply_mintox: bool = True
+    input_modality: Optional[Any] = None
     output_modality: Optional[Any] = None
 
+    @property
+    def torch_device(self) -> torch.device:
+        return torch.device(self.device)
+
+    @property
+    def torch_dtype(self) -> torch.dtype:
+        if self.dtype not in DTYPES:
+            raise ValueError(f"Invalid dtype {self.dtype}, expected one of {list(DTYPES)}")
+        return DTYPES[self.dtype]
+
 
 class TranslationData(BaseModel):
     input: str
@@ -173,10 +199,22 @@ class ModuleConfig(BaseModel):
     __pydantic_field_set__ = {"module_name", "module_path", "module_endpoint", "module_url"}
     
     
+class BatchSettings(BaseModel):
+    max_batch_size: int = Field(default=8)
+    max_wait_ms: float = Field(default=5.0)
+
+
+class ExecutorSettings(BaseModel):
+    workers: int = Field(default=1)
+    max_queue: int = Field(default=64)
+
+
 class MinerConfig(BaseModel):
     module_config: ModuleConfig = Field(default_factory=ModuleConfig)
     miner_key_dict: Dict[str, Any] = Field(default_factory=dict)
     key_name: str = Field(default="test_miner_1")
+    batching: BatchSettings = Field(default_factory=BatchSettings)
+    executor: ExecutorSettings = Field(default_factory=ExecutorSettings)
 
 
 class BaseMiner(ABC):
@@ -188,18 +226,96 @@ class BaseMiner(ABC):
         self.module_config = module_config
         self.miner_config = miner_config
         self.router = APIRouter()
+        self.executor = InferenceExecutor(
+            workers=miner_config.executor.workers,
+            max_queue=miner_config.executor.max_queue,
+        )
+        self.batcher = MicroBatcher(
+            self.process_batch,
+            self.batch_key,
+            max_batch_size=miner_config.batching.max_batch_size,
+            max_wait=miner_config.batching.max_wait_ms / 1000,
+            executor=self.executor,
+        )
 
     def add_route(self, module_name: str):
         @self.router.post(f"/modules/{module_name}/process")
-        def process_request(request: MinerRequest):
-            return self.process(request)
+        async def process_request(request: Request):
+            if not self.executor.admit():
+                raise HTTPException(
+                    status_code=503,
+                    detail="Inference queue is full",
+                    headers={"Retry-After": str(self.executor.retry_after())},
+                )
+            try:
+                miner_request = MinerRequest(**await decode_request(request))
+                result = await self.batcher.submit(miner_request)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            finally:
+                self.executor.release()
+            return encode_response(request, result)
+
+        @self.router.get("/metrics")
+        def metrics():
+            return self.executor.metrics()
+
         app.include_router(self.router)
 
+    def batch_key(self, miner_request: MinerRequest) -> Hashable:
+        """Requests with the same key can be processed in one batch."""
+        return None
+
+    def process_batch(self, miner_requests: List[MinerRequest]) -> List[Any]:
+        """Processes a batch of requests, returning one result per request."""
+        return [self.process(miner_request) for miner_request in miner_requests]
+
     @staticmethod
     def run_server(host_address: str, port: int):
         import uvicorn
         uvicorn.run(app, host=host_address, port=port)
 
+    def preload(self):
+        """Loads whatever the worker processes should share before they are forked."""
+
+    def run_workers(self, host_address: str, port: int, workers: int):
+        """
+        Preloads the model, then forks `workers` uvicorn servers that accept on one shared socket.
+        The weights are loaded once and the children share those pages copy-on-write; freezing the
+        garbage collector keeps it from touching, and so copying, the preloaded objects. CUDA
+        contexts do not survive a fork, so this is meant for CPU inference.
+        """
+        import uvicorn
+        self.preload()
+        gc.collect()
+        gc.freeze()
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host_address, port))
+        sock.set_inheritable(True)
+
+        children = []
+        for _ in range(workers):
+            pid = os.fork()
+            if pid == 0:
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                server = uvicorn.Server(uvicorn.Config(app, host=host_address, port=port))
+                server.run(sockets=[sock])
+                os._exit(0)
+            children.append(pid)
+        sock.close()
+        logger.info(f"Serving {workers} workers on {host_address}:{port}")
+
+        try:
+            for pid in children:
+                os.waitpid(pid, 0)
+        except KeyboardInterrupt:
+            for pid in children:
+                os.kill(pid, signal.SIGTERM)
+            for pid in children:
+                os.waitpid(pid, 0)
+
     @staticmethod
     def get_miner_keys(keypath: Optional[str] = None):
         keypath = keypath or os.getenv("MINER_KEYPATH")
@@ -253,6 +369,62 @@ class BaseMiner(ABC):
             logger.info(f"Registered {key_name} at {external_address}:{port}")
         self.run_server(host_address, port)
 
+    def register_miners(self, external_address: str, subnet: str, min_stake: int, metadata: str) -> Dict[str, Any]:
+        """Registers every key in miner_key_dict in parallel, returns the extrinsic (or error) per key."""
+        def register(key_name: str, key_config: Dict[str, Any]):
+            try:
+                return self.register_miner(key_name, external_address, key_config["port"], subnet, min_stake, metadata)
+            except Exception as e:
+                logger.error(f"Error registering {key_name}: {str(e)}")
+                return e
+
+        key_dict = self.miner_config.miner_key_dict
+        with ThreadPoolExecutor(max_workers=max(1, len(key_dict))) as pool:
+            futures = {key_name: pool.submit(register, key_name, key_config) for key_name, key_config in key_dict.items()}
+            results = {key_name: future.result() for key_name, future in futures.items()}
+        for key_name, key_config in key_dict.items():
+            if not isinstance(results[key_name], Exception):
+                logger.info(f"Registered {key_name} at {external_address}:{key_config['port']}")
+        return results
+
+    def serve_miners(
+        self,
+        module_name: str,
+        external_address: str,
+        subnet: str,
+        min_stake: int,
+        metadata: str,
+        register: bool = False
+    ):
+        """
+        Serves every key in miner_key_dict from this process, each on its own port. The model is
+        loaded once and every tenant's requests go through the same batcher and inference queue.
+        """
+        import uvicorn
+        if not self.router.routes:
+            self.add_route(module_name)
+        self.preload()
+        if register:
+            self.register_miners(external_address, subnet, min_stake, metadata)
+
+        servers = [
+            uvicorn.Server(uvicorn.Config(app, host=key_config.get("host", "0.0.0.0"), port=int(key_config["port"])))
+            for key_config in self.miner_config.miner_key_dict.values()
+        ]
+
+        async def serve(server):
+            try:
+                await server.serve()
+            finally:
+                for other in servers:
+                    other.should_exit = True
+
+        async def serve_all():
+            await asyncio.gather(*(serve(server) for server in servers))
+
+        logger.info(f"Serving {len(servers)} miners from one {module_name} model")
+        asyncio.run(serve_all())
+
     @abstractmethod
     def process(self, miner_request: MinerRequest) -> Any:
         """Process a request made to the module."""
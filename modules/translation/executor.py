@@ -0,0 +1,84 @@
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+
+class InferenceExecutor:
+    """A dedicated inference pool with a bounded admission queue.
+
+    Requests must be admitted before they are queued. Once `max_queue` requests
+    are waiting or running, `admit` refuses new ones so the route can answer
+    with 503 and a Retry-After estimate instead of piling work into memory.
+    """
+
+    def __init__(self, workers: int = 1, max_queue: int = 64, window: int = 256):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="inference")
+        self.pending = 0
+        self.running = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.completed = 0
+        self.wait_times = deque(maxlen=window)
+        self.service_times = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def admit(self) -> bool:
+        with self._lock:
+            if self.pending >= self.max_queue:
+                self.rejected += 1
+                return False
+            self.pending += 1
+            self.admitted += 1
+            return True
+
+    def release(self):
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+
+    def retry_after(self) -> int:
+        """Seconds until the current queue should have drained, assuming one request per pool call."""
+        mean_service = sum(self.service_times) / len(self.service_times) if self.service_times else 1.0
+        return max(1, math.ceil(self.pending * mean_service / self.workers))
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        submitted = time.perf_counter()
+
+        def timed():
+            started = time.perf_counter()
+            with self._lock:
+                self.running += 1
+            try:
+                return func(*args)
+            finally:
+                finished = time.perf_counter()
+                with self._lock:
+                    self.running -= 1
+                    self.wait_times.append(started - submitted)
+                    self.service_times.append(finished - started)
+
+        return await asyncio.get_running_loop().run_in_executor(self.pool, timed)
+
+    def metrics(self) -> Dict[str, Any]:
+        wait_times = sorted(self.wait_times)
+        return {
+            "queue_depth": self.pending,
+            "running_batches": self.running,
+            "max_queue": self.max_queue,
+            "workers": self.workers,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "mean_wait": sum(wait_times) / len(wait_times) if wait_times else 0.0,
+            "p95_wait": wait_times[int(len(wait_times) * 0.95)] if wait_times else 0.0,
+            "mean_service": sum(self.service_times) / len(self.service_times) if self.service_times else 0.0,
+        }
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
@@ -3,11 +3,15 @@ import base64
 folder_path = f'modules/translation'
 
 file_data = [
-    ('translation_module.py', 'aW1wb3J0IGJhc2U2NApmcm9tIHB5ZGFudGljIGltcG9ydCBGaWVsZApmcm9tIGRvdGVudiBpbXBvcnQgbG9hZF9kb3RlbnYKCmZyb20gLmRhdGFfbW9kZWxzIGltcG9ydCBUcmFuc2xhdGlvblJlcXVlc3QsIE1pbmVyQ29uZmlnLCBNb2R1bGVDb25maWcsIEJhc2VNaW5lcgpmcm9tIC50cmFuc2xhdGlvbiBpbXBvcnQgU2VhbWxlc3NUcmFuc2xhdG9yCgoKbG9hZF9kb3RlbnYoKQoKdHJhbnNsYXRvciA9IFNlYW1sZXNzVHJhbnNsYXRvcigpCgoKdHJhbnNsYXRpb25fc2V0dGluZ3MgPSBNb2R1bGVDb25maWcoCiAgICBtb2R1bGVfcGF0aD0ibW9kdWxlL3RyYW5zbGF0aW9uIiwKICAgIG1vZHVsZV9uYW1lPSJ0cmFuc2xhdGlvbiIsCiAgICBtb2R1bGVfZW5kcG9pbnQ9Ii9tb2R1bGVzL3RyYW5zbGF0aW9uIiwKICAgIG1vZHVsZV91cmw9Imh0dHBzOi8vdHJhbnNsYXRpb24uY29tLyIKKQoKbWluZXJfc2V0dGluZ3MgPSBNaW5lckNvbmZpZygKICAgIG1vZHVsZV9uYW1lPUZpZWxkKGRlZmF1bHQ9InRyYW5zbGF0aW9uIiksCiAgICBtb2R1bGVfcGF0aD1GaWVsZChkZWZhdWx0PSJtb2R1bGVzL3RyYW5zbGF0aW9uIiksCiAgICBtb2R1bGVfZW5kcG9pbnQ9RmllbGQoZGVmYXVsdD0iL21vZHVsZXMvdHJhbnNsYXRpb24iKSwKICAgIG1vZHVsZV91cmw9RmllbGQoZGVmYXVsdD0iaHR0cHM6Ly90cmFuc2xhdGlvbi5jb20vIiksCiAgICBtaW5lcl9rZXlfZGljdD17CiAgICAgICAgInRlc3RfbWluZXJfMSI6IHsKICAgICAgICAgICAgImtleSI6ICI1R04yZExoV2E1c0NCNEE1NThCa2toOTZCTmR3d2lrUHhDQkpXNkhRWG1RZjd5cFIiLAogICAgICAgICAgICAibmFtZSI6ICJ0ZXN0X21pbmVyXzEiLAogICAgICAgICAgICAiaG9zdCI6ICIwLjAuMC4wIiwKICAgICAgICAgICAgInBvcnQiOiA4MDAwLAogICAgICAgICAgICAia2V5cGF0aCI6ICIkSE9NRS8uY29tbXVuZS9rZXkvdGVzdF9taW5lcl8xLmpzb24iCiAgICAgICAgfQogICAgfSwKKQoKY2xhc3MgVHJhbnNsYXRpb25NaW5lcihCYXNlTWluZXIpOgogICAgCiAgICBkZWYgX19pbml0X18oc2VsZik6CiAgICAgICAgc3VwZXIoKS5fX2luaXRfXyhtaW5lcl9zZXR0aW5ncywgdHJhbnNsYXRpb25fc2V0dGluZ3MpCiAgICAgICAgc2VsZi5hZGRfcm91dGUoInRyYW5zbGF0aW9uIikKICAgIAogICAgZGVmIHByb2Nlc3Moc2VsZiwgcmVxdWVzdDogVHJhbnNsYXRpb25SZXF1ZXN0KToKICAgICAgICB0ZXh0X3JlcXVlc3QgPSAibW9kdWxlcy90cmFuc2xhdGlvbi9pbi90ZXh0X3JlcXVlc3QudHh0IgogICAgICAgIGF1ZGlvX3JlcXVlc3QgPSAibW9kdWxlcy90cmFuc2xhdGlvbi9pbi9hdWRpb19yZXF1ZXN0LndhdiIKICAgICAgICByZXF1ZXN0X3BhdGggPSAiIgogICAgICAgIGlmIHJlcXVlc3QuZGF0YVsidGFza19zdHJpbmciXS5zdGFydHN3aXRoKCJzcGVlY2giKToKICAgICAgICAgICAgd2l0aCBvcGVuKGF1ZGlvX3JlcXVlc3QsICJ3YiIpIGFzIGY6CiAgICAgICAgICAgICAgICBmLndyaXRlKGJhc2U2NC5iNjRkZWNvZGUocmVxdWVzdC5kYXRhWyJpbnB1dCJdLmVuY29kZSgidXRmLTgiKSkpCiAgICAgICAgICAgIHJlcXVlc3RfcGF0aCA9IGF1ZGlvX3JlcXVlc3QKICAgICAgICBpZiByZXF1ZXN0LmRhdGFbInRhc2tfc3RyaW5nIl0uc3RhcnRzd2l0aCgidGV4dCIpOgogICAgICAgICAgICB3aXRoIG9wZW4odGV4dF9yZXF1ZXN0LCAidyIsIGVuY29kaW5nPSJ1dGYtOCIpIGFzIGY6CiAgICAgICAgICAgICAgICBmLndyaXRlKHJlcXVlc3QuZGF0YVsiaW5wdXQiXSkKICAgICAgICAgICAgcmVxdWVzdF9wYXRoID0gdGV4dF9yZXF1ZXN0CiAgICAgICAgb3V0cHV0X3RleHQsIG91dHB1dF9hdWRpbyA9IHRyYW5zbGF0b3IudHJhbnNsYXRpb25faW5mZXJlbmNlKAogICAgICAgICAgICBpbl9maWxlPXJlcXVlc3RfcGF0aCwKICAgICAgICAgICAgc291cmNlX2xhbmdhdWdlPXJlcXVlc3QuZGF0YVsic291cmNlX2xhbmd1YWdlIl0udGl0bGUoKSwKICAgICAgICAgICAgdGFyZ2V0X2xhbmd1YWdlcz1bcmVxdWVzdC5kYXRhWyJ0YXJnZXRfbGFuZ3VhZ2UiXS50aXRsZSgpXSwKICAgICAgICAgICAgdGFza19zdHJpbmc9cmVxdWVzdC5kYXRhWyJ0YXNrX3N0cmluZyJdCiAgICAgICAgKQogICAgICAgIGlmIHJlcXVlc3QuZGF0YVsidGFza19zdHJpbmciXS5lbmRzd2l0aCgiMnNwZWVjaCIpOgogICAgICAgICAgICByZXR1cm4gYmFzZTY0LmI2NGVuY29kZShvdXRwdXRfYXVkaW8pLmRlY29kZSgidXRmLTgiKQogICAgICAgIGlmIHJlcXVlc3QuZGF0YVsidGFza19zdHJpbmciXS5lbmRzd2l0aCgiMnRleHQiKToKICAgICAgICAgICAgcmV0dXJuIHN0cihvdXRwdXRfdGV4dCkKCgppZiBfX25hbWVfXyA9PSAiX19tYWluX18iOgogICAgbWluZXIgPSBUcmFuc2xhdGlvbk1pbmVyKCkKICAgICMgd2l0aCBvcGVuKCJtb2R1bGVzL3RyYW5zbGF0aW9uL2luL2dlcm1hbl90ZXN0X2RhdGEud2F2IiwgInJiIikgYXMgZjoKICAgICMgICAgIGF1ZGlvX2RhdGEgPSBmLnJlYWQoKQogICAgIyBiNjRhdWRpbyA9IGJhc2U2NC5iNjRlbmNvZGUoYXVkaW9fZGF0YSkuZGVjb2RlKCJ1dGYtOCIpCiAgICAjIHRyYW5zbGF0aW9uX2RhdGEgPSBUcmFuc2xhdGlvbkRhdGEoCiAgICAjICAgICBpbnB1dD1iNjRhdWRpbywKICAgICMgICAgIHRhc2tfc3RyaW5nPSJzcGVlY2gydGV4dCIsCiAgICAjICAgICBzb3VyY2VfbGFuZ3VhZ2U9ImVuZ2xpc2giLAogICAgIyAgICAgdGFyZ2V0X2xhbmd1YWdlPSJmcmVuY2giCiAgICAjICkubW9kZWxfZHVtcCgpCiAgICAjIHRyYW5zbGF0aW9uX3JlcXVlc3QgPSBUcmFuc2xhdGlvblJlcXVlc3QoCiAgICAjICAgICBkYXRhPXRyYW5zbGF0aW9uX2RhdGEKICAgICMgKQogICAgIyByZXN1bHQgPSBtaW5lci5wcm9jZXNzKHJlcXVlc3Q9dHJhbnNsYXRpb25fcmVxdWVzdCkKICAgICMgcHJpbnQocmVzdWx0KQogICAgbWluZXIucnVuX3NlcnZlcigiMC4wLjAuMCIsIDQyNjkp'),
-    ('translation.py', 'aW1wb3J0IHRvcmNoYXVkaW8KaW1wb3J0IHRvcmNoCgpmcm9tIHBhdGhsaWIgaW1wb3J0IFBhdGgKCmZyb20gbG9ndXJ1IGltcG9ydCBsb2dnZXIKZnJvbSB0eXBpbmcgaW1wb3J0IFVuaW9uLCBUdXBsZSwgTGlzdCwgRGljdCwgT3B0aW9uYWwKCmZyb20gLnNlYW1sZXNzLnNyYy5zZWFtbGVzc19jb21tdW5pY2F0aW9uLmluZmVyZW5jZS50cmFuc2xhdG9yIGltcG9ydCBUcmFuc2xhdG9yCmZyb20gLmRhdGFfbW9kZWxzIGltcG9ydCBUQVJHRVRfTEFOR1VBR0VTLCBUQVNLX1NUUklOR1MKCgpjbGFzcyBTZWFtbGVzc1RyYW5zbGF0b3I6CiAgICAiIiJBIGNsYXNzIGZvciBwZXJmb3JtaW5nIHRyYW5zbGF0aW9uIHRhc2tzIHVzaW5nIGEgc3BlY2lmaWVkIG1vZGVsIGFuZCB2b2NvZGVyLgoKICAgIEF0dHJpYnV0ZXM6CiAgICAgICAgbW9kZWxfbmFtZSAoc3RyKTogVGhlIG5hbWUgb2YgdGhlIHRyYW5zbGF0aW9uIG1vZGVsLgogICAgICAgIHZvY29kZXJfbmFtZSAoc3RyKTogVGhlIG5hbWUgb2YgdGhlIHZvY29kZXIuCiAgICAgICAgdHJhbnNsYXRvciAoVHJhbnNsYXRvcik6IFRoZSB0cmFuc2xhdG9yIG9iamVjdC4KICAgICAgICB0YXJnZXRfbGFuZ3VhZ2VzIChEaWN0W3N0ciwgc3RyXSk6IEEgZGljdGlvbmFyeSBtYXBwaW5nIGxhbmd1YWdlIG5hbWVzIHRvIGxhbmd1YWdlIGNvZGVzLgogICAgICAgIHRhc2tfc3RyaW5ncyAoRGljdFtzdHIsIHN0cl0pOiBBIGRpY3Rpb25hcnkgbWFwcGluZyB0YXNrIHN0cmluZ3MgdG8gYWJicmV2aWF0aW9ucy4KCiAgICBBcmdzOgogICAgICAgIGluX2ZpbGUgKFVuaW9uW3N0ciwgUGF0aF0pOiBUaGUgaW5wdXQgZmlsZSBmb3IgdHJhbnNsYXRpb24uCiAgICAgICAgdGFza19zdHJpbmcgKHN0cik6IFRoZSB0eXBlIG9mIHRyYW5zbGF0aW9uIHRhc2suCiAgICAgICAgdGFyZ2V0X2xhbmd1YWdlcyAoTGlzdFtzdHJdKTogVGhlIHRhcmdldCBsYW5ndWFnZXMgZm9yIHRyYW5zbGF0aW9uLgoKICAgIFJldHVybnM6CiAgICAgICAgVHVwbGVbUGF0aCwgUGF0aF0gfCBOb25lOiBBIHR1cGxlIGNvbnRhaW5pbmcgdGhlIHBhdGhzIHRvIHRoZSB0cmFuc2xhdGVkIHRleHQgYW5kIGF1ZGlvIGZpbGVzLCBvciBOb25lIGlmIHRyYW5zbGF0aW9uIGZhaWxzLgogICAgIiIiCgogICAgbW9kZWxfbmFtZTogc3RyCiAgICB2b2NvZGVyX25hbWU6IHN0cgogICAgdHJhbnNsYXRvcjogVHJhbnNsYXRvcgogICAgdGFyZ2V0X2xhbmd1YWdlczogRGljdFtzdHIsIHN0cl0KICAgIHRhc2tfc3RyaW5nczogRGljdFtzdHIsIHN0cl0KCiAgICBkZWYgX19pbml0X18oc2VsZikgLT4gTm9uZToKICAgICAgICAiIiIKICAgICAgICBJbml0aWFsaXplcyB0aGUgU2VhbWxlc3NUcmFuc2xhdG9yIG9iamVjdCB3aXRoIHRoZSBzcGVjaWZpZWQgbW9kZWwgYW5kIHZvY29kZXIgbmFtZXMsCiAgICAgICAgYW5kIGNyZWF0ZXMgYSB0cmFuc2xhdG9yIG9iamVjdCB1c2luZyB0aGUgc3BlY2lmaWVkIG1vZGVsIGFuZCB2b2NvZGVyLiBUaGUgdHJhbnNsYXRvcgogICAgICAgIG9iamVjdCBpcyBjcmVhdGVkIHdpdGggdGhlIGRldmljZSBzZXQgdG8gImN1ZGE6MCIgYW5kIHRoZSBkYXRhIHR5cGUgc2V0IHRvICJ0b3JjaC5mbG9hdDE2Ii4KICAgICAgICBUaGUgdGFyZ2V0X2xhbmd1YWdlcyBkaWN0aW9uYXJ5IG1hcHMgbGFuZ3VhZ2UgbmFtZXMgdG8gbGFuZ3VhZ2UgY29kZXMsIGFuZCB0aGUgdGFza19zdHJpbmdzCiAgICAgICAgZGljdGlvbmFyeSBtYXBzIHRhc2sgc3RyaW5ncyB0byBhYmJyZXZpYXRpb25zLgogICAgICAgICIiIgogICAgICAgIHNlbGYubW9kZWxfbmFtZSA9ICJzZWFtbGVzc000VF92Ml9sYXJnZSIKICAgICAgICBzZWxmLnZvY29kZXJfbmFtZSA9ICgKICAgICAgICAgICAgInZvY29kZXJfdjIiCiAgICAgICAgICAgIGlmIHNlbGYubW9kZWxfbmFtZSA9PSAic2VhbWxlc3NNNFRfdjJfbGFyZ2UiCiAgICAgICAgICAgIGVsc2UgInZvY29kZXJfMzZsYW5ncyIKICAgICAgICApCgogICAgICAgIHNlbGYudHJhbnNsYXRvciA9IFRyYW5zbGF0b3IoCiAgICAgICAgICAgIG1vZGVsX25hbWVfb3JfY2FyZD1zZWxmLm1vZGVsX25hbWUsCiAgICAgICAgICAgIHZvY29kZXJfbmFtZV9vcl9jYXJkPXNlbGYudm9jb2Rlcl9uYW1lLAogICAgICAgICAgICBkZXZpY2U9dG9yY2guZGV2aWNlKGRldmljZT0iY3VkYTowIiksCiAgICAgICAgICAgIGR0eXBlPXRvcmNoLmZsb2F0MTYsCiAgICAgICAgKQogICAgICAgIHNlbGYudGFza19zdHJpbmdzID0gVEFTS19TVFJJTkdTCiAgICAgICAgc2VsZi50YXJnZXRfbGFuZ3VhZ2VzID0gVEFSR0VUX0xBTkdVQUdFUwogICAgICAgIAoKICAgIGRlZiB0cmFuc2xhdGlvbl9pbmZlcmVuY2UoCiAgICAgICAgc2VsZiwKICAgICAgICBpbl9maWxlOiBVbmlvbltzdHIsIFBhdGhdLAogICAgICAgIHRhc2tfc3RyaW5nOiBzdHIgPSAic3BlZWNoMnRleHQiLAogICAgICAgIHNvdXJjZV9sYW5nYXVnZTogT3B0aW9uYWxbc3RyXSA9ICJlbmdsaXNoIiwKICAgICAgICB0YXJnZXRfbGFuZ3VhZ2VzOiBMaXN0W3N0cl0gPSBbIkVuZ2xpc2giXSwKICAgICkgLT4gVHVwbGVbUGF0aCwgUGF0aF0gfCBOb25lOgogICAgICAgICIiIgogICAgICAgIFBlcmZvcm0gdHJhbnNsYXRpb24gaW5mZXJlbmNlIG9uIHRoZSBnaXZlbiBpbnB1dCBmaWxlLgoKICAgICAgICBBcmdzOgogICAgICAgICAgICBpbl9maWxlIChVbmlvbltzdHIsIFBhdGhdKTogVGhlIHBhdGggdG8gdGhlIGlucHV0IGZpbGUuCiAgICAgICAgICAgIHRhc2tfc3RyaW5nIChzdHIsIG9wdGlvbmFsKTogVGhlIHRhc2sgc3RyaW5nLiBEZWZhdWx0cyB0byAiczJzdCIuCiAgICAgICAgICAgIHRhcmdldF9sYW5ndWFnZXMgKExpc3Rbc3RyXSwgb3B0aW9uYWwpOiBUaGUgbGlzdCBvZiB0YXJnZXQgbGFuZ3VhZ2VzLiBEZWZhdWx0cyB0byBbImVuZyJdLgoKICAgICAgICBSZXR1cm5zOgogICAgICAgICAgICBUdXBsZVtQYXRoLCBQYXRoXSB8IE5vbmU6IEEgdHVwbGUgY29udGFpbmluZyB0aGUgYWJzb2x1dGUgcGF0aHMgdG8gdGhlIG91dHB1dCB0ZXh0IGZpbGUgYW5kIG91dHB1dCBhdWRpbyBmaWxlLCBvciBOb25lIGlmIHRoZSBpbnB1dCBmaWxlIGlzIG5vdCBmb3VuZC4KCiAgICAgICAgUmFpc2VzOgogICAgICAgICAgICBGaWxlTm90Rm91bmRFcnJvcjogSWYgdGhlIGlucHV0IGZpbGUgaXMgbm90IGZvdW5kLgogICAgICAgICAgICBWYWx1ZUVycm9yOiBJZiB0aGUgdGFzayBzdHJpbmcgb3IgdGFyZ2V0IGxhbmd1YWdlIGlzIGludmFsaWQuCgogICAgICAgICIiIgoKICAgICAgICBpZiBub3QgUGF0aChpbl9maWxlKS5leGlzdHMoKToKICAgICAgICAgICAgbG9nZ2VyLmVycm9yKGYiRmlsZSB7aW5fZmlsZX0gbm90IGZvdW5kIikKICAgICAgICAgICAgcmFpc2UgRmlsZU5vdEZvdW5kRXJyb3IoZiJGaWxlIHtpbl9maWxlfSBub3QgZm91bmQiKQoKICAgICAgICBpbnB1dF9maWxlID0gUGF0aChpbl9maWxlKQogICAgICAgIG91dHB1dF90ZXh0ID0gUGF0aChmIm1vZHVsZXMvdHJhbnNsYXRpb24vb3V0L3tpbnB1dF9maWxlLnN0ZW19LnR4dCIpCiAgICAgICAgb3V0cHV0X2F1ZGlvID0gUGF0aChmIm1vZHVsZXMvdHJhbnNsYXRpb24vb3V0L3tpbnB1dF9maWxlLnN0ZW19LndhdiIpCiAgICAgICAgCiAgICAgICAgdGFza19zdHI6IHN0ciA9IHNlbGYudGFza19zdHJpbmdzW3Rhc2tfc3RyaW5nXQogICAgICAgIGlmIG5vdCB0YXNrX3N0cjoKICAgICAgICAgICAgbG9nZ2VyLmVycm9yKCJJbnZhbGlkIHRhc2sgc3RyaW5nIikKICAgICAgICAgICAgcmFpc2UgVmFsdWVFcnJvcigiSW52YWxpZCB0YXNrIHN0cmluZyIpCgogICAgICAgIGZvciB0Z3RfbGFuZyBpbiB0YXJnZXRfbGFuZ3VhZ2VzOgoKICAgICAgICAgICAgdGd0X2xhbmc6IHN0ciA9IHNlbGYudGFyZ2V0X2xhbmd1YWdlc1t0Z3RfbGFuZ10KICAgICAgICAgICAgaWYgbm90IHRndF9sYW5nOgogICAgICAgICAgICAgICAgbG9nZ2VyLmVycm9yKCJJbnZhbGlkIHRhcmdldCBsYW5ndWFnZSIpCiAgICAgICAgICAgICAgICByYWlzZSBWYWx1ZUVycm9yKCJJbnZhbGlkIHRhcmdldCBsYW5ndWFnZSIpCgogICAgICAgICAgICBpZiB0YXNrX3N0ci5zdGFydHN3aXRoKCJ0Iik6CiAgICAgICAgICAgICAgICB0ZXh0X291dHB1dCwgc3BlZWNoX291dHB1dCA9IHNlbGYudHJhbnNsYXRvci5wcmVkaWN0KAogICAgICAgICAgICAgICAgICAgIGlucHV0PXN0cihpbnB1dF9maWxlLnJlYWRfdGV4dChlbmNvZGluZz0idXRmLTgiKSksCiAgICAgICAgICAgICAgICAgICAgdGFza19zdHI9dGFza19zdHIsCiAgICAgICAgICAgICAgICAgICAgc3JjX2xhbmc9c2VsZi50YXJnZXRfbGFuZ3VhZ2VzW3NvdXJjZV9sYW5nYXVnZV0sCiAgICAgICAgICAgICAgICAgICAgdGd0X2xhbmc9dGd0X2xhbmcsCiAgICAgICAgICAgICAgICAgICAgKQogICAgICAgICAgICBpZiB0YXNrX3N0ci5zdGFydHN3aXRoKCJzIik6CiAgICAgICAgICAgICAgICB0ZXh0X291dHB1dCwgc3BlZWNoX291dHB1dCA9IHNlbGYudHJhbnNsYXRvci5wcmVkaWN0KAogICAgICAgICAgICAgICAgICAgIGlucHV0PXN0cihpbnB1dF9maWxlKSwKICAgICAgICAgICAgICAgICAgICB0YXNrX3N0cj10YXNrX3N0ciwKICAgICAgICAgICAgICAgICAgICBzcmNfbGFuZz1zZWxmLnRhcmdldF9sYW5ndWFnZXNbc291cmNlX2xhbmdhdWdlXSwKICAgICAgICAgICAgICAgICAgICB0Z3RfbGFuZz10Z3RfbGFuZywKICAgICAgICAgICAgICAgICkKICAgICAgICAgICAgbG9nZ2VyLmluZm8oZiJUcmFuc2xhdGVkIHRleHQgaW4ge3RndF9sYW5nfToge3RleHRfb3V0cHV0WzBdfSIpCgogICAgICAgICAgICBpZiBzcGVlY2hfb3V0cHV0OgogICAgICAgICAgICAgICAgdG9yY2hhdWRpby5zYXZlKAogICAgICAgICAgICAgICAgICAgIHVyaT1vdXRwdXRfYXVkaW8sCiAgICAgICAgICAgICAgICAgICAgc3JjPXNwZWVjaF9vdXRwdXQuYXVkaW9fd2F2c1swXVswXS50byh0b3JjaC5mbG9hdDMyKS5jcHUoKSwKICAgICAgICAgICAgICAgICAgICBzYW1wbGVfcmF0ZT1zcGVlY2hfb3V0cHV0LnNhbXBsZV9yYXRlLAogICAgICAgICAgICAgICAgKQogICAgICAgICAgICBpZiB0ZXh0X291dHB1dDoKICAgICAgICAgICAgICAgIG91dHB1dF90ZXh0LndyaXRlX3RleHQoCiAgICAgICAgICAgICAgICAgICAgZGF0YT1zdHIob2JqZWN0PXRleHRfb3V0cHV0WzBdKSwgZW5jb2Rpbmc9InV0Zi04IgogICAgICAgICAgICAgICAgKQoKICAgICAgICAgICAgbG9nZ2VyLmluZm8oIlRyYW5zbGF0ZWQgdGFyZ2V0IGZpbGUiKQoKICAgICAgICAgICAgcmV0dXJuIHRleHRfb3V0cHV0LCBzcGVlY2hfb3V0cHV0CgoKaWYgX19uYW1lX18gPT0gIl9fbWFpbl9fIjoKICAgIHRyYW5zbGF0b3IgPSBTZWFtbGVzc1RyYW5zbGF0b3IoKQogICAgdHJhbnNsYXRvci50cmFuc2xhdGlvbl9pbmZlcmVuY2UoCiAgICAgICAgaW5fZmlsZT0ibW9kdWxlcy90cmFuc2xhdGlvbi9pbi9hdWRpb19yZXF1ZXN0LndhdiIsCiAgICAgICAgdGFza19zdHJpbmc9InNwZWVjaDJzcGVlY2giLAogICAgICAgIHRhcmdldF9sYW5ndWFnZXM9WyJGcmVuY2giXQogICAgKQ=='),
     ('__init__.py', ''),
-    ('data_models.py', 'aW1wb3J0IG9zCmltcG9ydCB0b3JjaAppbXBvcnQganNvbgppbXBvcnQgcmVxdWVzdHMKaW1wb3J0IGJhc2U2NAppbXBvcnQgc3VicHJvY2Vzcwpmcm9tIHBhdGhsaWIgaW1wb3J0IFBhdGgKZnJvbSBsb2d1cnUgaW1wb3J0IGxvZ2dlcgpmcm9tIHB5ZGFudGljIGltcG9ydCBCYXNlTW9kZWwsIEZpZWxkCmZyb20gdHlwaW5nIGltcG9ydCBEaWN0LCBVbmlvbiwgT3B0aW9uYWwsIEFueQpmcm9tIGFiYyBpbXBvcnQgQUJDLCBhYnN0cmFjdG1ldGhvZApmcm9tIGZhc3RhcGkgaW1wb3J0IEFQSVJvdXRlciwgRmFzdEFQSQpmcm9tIHN1YnN0cmF0ZWludGVyZmFjZS5rZXlwYWlyIGltcG9ydCBLZXlwYWlyCmZyb20gY29tbXVuZXguX2NvbW1vbiBpbXBvcnQgZ2V0X25vZGVfdXJsCmZyb20gY29tbXVuZXguY2xpZW50IGltcG9ydCBDb21tdW5lQ2xpZW50Cgpjb214ID0gQ29tbXVuZUNsaWVudChnZXRfbm9kZV91cmwoKSkKCmFwcCA9IEZhc3RBUEkoKQoKVEFTS19TVFJJTkdTID0gewogICAgInNwZWVjaDJ0ZXh0IjogInMydHQiLAogICAgInNwZWVjaDJzcGVlY2giOiAiczJzdCIsCiAgICAiYXV0b19zcGVlY2hfcmVjb2duaXRpb24iOiAiYXNyIiwKICAgICJ0ZXh0MnNwZWVjaCI6ICJ0MnN0IiwKICAgICJ0ZXh0MnRleHQiOiAidDJ0dCIsCn0KClRBUkdFVF9MQU5HVUFHRVMgPSB7CiAgICAiRW5nbGlzaCI6ICJlbmciLAogICAgIkFmcmlrYWFucyI6ICJhZnIiLAogICAgIkFtaGFyaWMiOiAiYW1oIiwKICAgICJNb2Rlcm4gU3RhbmRhcmQgQXJhYmljIjogImFyYiIsCiAgICAiTW9yb2NjYW4gQXJhYmljIjogImFyeSIsCiAgICAiRWd5cHRpYW4gQXJhYmljIjogImFyeiIsCiAgICAiQXNzYW1lc2UiOiAiYXNtIiwKICAgICJBc3R1cmlhbiI6ICJhc3QiLAogICAgIk5vcnRoIEF6ZXJiYWlqYW5pIjogImF6aiIsCiAgICAiQmVsYXJ1c2lhbiI6ICJiZWwiLAogICAgIkJlbmdhbGkiOiAiYmVuIiwKICAgICJCb3NuaWFuIjogImJvcyIsCiAgICAiQnVsZ2FyaWFuIjogImJ1bCIsCiAgICAiQ2F0YWxhbiI6ICJjYXQiLAogICAgIkNlYnVhbm8iOiAiY2ViIiwKICAgICJDemVjaCI6ICJjZXMiLAogICAgIkNlbnRyYWwiOiAiY2tiIiwKICAgICJNYW5kYXJpbiBDaGluZXNlIjogImNtbiIsCiAgICAiTWFuZGFyaW4gQ2hpbmVzZSBIYW50IjogImNtbl9IYW50IiwKICAgICJXZWxzaCI6ICJjeW0iLAogICAgIkRhbmlzaCI6ICJkYW4iLAogICAgIkdlcm1hbiI6ICJkZXUiLAogICAgIkVzdG9uaWFuIjogImVzdCIsCiAgICAiQmFzcXVlIjogImV1cyIsCiAgICAiRmlubmlzaCI6ICJmaW4iLAogICAgIkZyZW5jaCI6ICJmcmEiLAogICAgIk5pZ2VyaWFuIEZ1bGZ1bGRlIjogImZ1diIsCiAgICAiV2VzdCBDZW50cmFsIE9yb21vIjogImdheiIsCiAgICAiSXJpc2giOiAiZ2xlIiwKICAgICJHYWxpY2lhbiI6ICJnbGciLAogICAgIkd1amFyYXRpIjogImd1aiIsCiAgICAiSGVicmV3IjogImhlYiIsCiAgICAiSGluZGkiOiAiaGluIiwKICAgICJDcm9hdGlhbiI6ICJocnYiLAogICAgIkh1bmdhcmlhbiI6ICJodW4iLAogICAgIkFybWVuaWFuIjogImh5ZSIsCiAgICAiSWdibyI6ICJpYm8iLAogICAgIkluZG9uZXNpYW4iOiAiaW5kIiwKICAgICJJY2VsYW5kaWMiOiAiaXNsIiwKICAgICJJdGFsaWFuIjogIml0YSIsCiAgICAiSmF2YW5lc2UiOiAiamF2IiwKICAgICJKYXBhbmVzZSI6ICJqcG4iLAogICAgIkthbWJhIjogImthbSIsCiAgICAiS2FubmFkYSI6ICJrYW4iLAogICAgIkdlb3JnaWFuIjogImthdCIsCiAgICAiS2F6YWtoIjogImtheiIsCiAgICAiS2FidXZlcmRpYW51IjogImtlYSIsCiAgICAiSGFsaCBNb25nb2xpYW4iOiAia2hrIiwKICAgICJLaG1lciI6ICJraG0iLAogICAgIkt5cmd5eiI6ICJraXIiLAogICAgIktvcmVhbiI6ICJrb3IiLAogICAgIkxhbyI6ICJsYW8iLAogICAgIkxpdGh1YW5pYW4iOiAibGl0IiwKICAgICJMdXhlbWJvdXJnaXNoIjogImx0eiIsCiAgICAiR2FuZGEiOiAibHVnIiwKICAgICJMdW8iOiAibHVvIiwKICAgICJTdGFuZGFyZCBMYXR2aWFuIjogImx2cyIsCiAgICAiTWFpdGhpbGkiOiAibWFpIiwKICAgICJNYWxheWFsYW0iOiAibWFsIiwKICAgICJNYXJhdGhpIjogIm1hciIsCiAgICAiTWFjZWRvbmlhbiI6ICJta2QiLAogICAgIk1hbHRlc2UiOiAibWx0IiwKICAgICJNZWl0ZWkiOiAibW5pIiwKICAgICJCdXJtZXNlIjogIm15YSIsCiAgICAiRHV0Y2giOiAibmxkIiwKICAgICJOb3J3ZWdpYW4gTnlub3JzayI6ICJubm8iLAogICAgIk5vcndlZ2lhbiBCb2ttw6VsIjogIm5vYiIsCiAgICAiTmVwYWxpIjogIm5waSIsCiAgICAiTnlhbmphIjogIm55YSIsCiAgICAiT2NjaXRhbiI6ICJvY2kiLAogICAgIk9kaWEiOiAib3J5IiwKICAgICJQdW5qYWJpIjogInBhbiIsCiAgICAiU291dGhlcm4gUGFzaHRvIjogInBidCIsCiAgICAiV2VzdGVybiBQZXJzaWFuIjogInBlcyIsCiAgICAiUG9saXNoIjogInBvbCIsCiAgICAiUG9ydHVndWVzZSI6ICJwb3IiLAogICAgIlJvbWFuaWFuIjogInJvbiIsCiAgICAiUnVzc2lhbiI6ICJydXMiLAogICAgIlNsb3ZhayI6ICJzbGsiLAogICAgIlNsb3ZlbmlhbiI6ICJzbHYiLAogICAgIlNob25hIjogInNuYSIsCiAgICAiU2luZGhpIjogInNuZCIsCiAgICAiU29tYWxpIjogInNvbSIsCiAgICAiU3BhbmlzaCI6ICJzcGEiLAogICAgIlNlcmJpYW4iOiAic3JwIiwKICAgICJTd2VkaXNoIjogInN3ZSIsCiAgICAiU3dhaGlsaSI6ICJzd2giLAogICAgIlRhbWlsIjogInRhbSIsCiAgICAiVGVsdWd1IjogInRlbCIsCiAgICAiVGFqaWsiOiAidGdrIiwKICAgICJUYWdhbG9nIjogInRnbCIsCiAgICAiVGhhaSI6ICJ0aGEiLAogICAgIlR1cmtpc2giOiAidHVyIiwKICAgICJVa3JhaW5pYW4iOiAidWtyIiwKICAgICJVcmR1IjogInVyZCIsCiAgICAiTm9ydGhlcm4gVXpiZWsiOiAidXpuIiwKICAgICJWaWV0bmFtZXNlIjogInZpZSIsCiAgICAiWGhvc2EiOiAieGhvIiwKICAgICJZb3J1YmEiOiAieW9yIiwKICAgICJDYW50b25lc2UiOiAieXVlIiwKICAgICJDb2xsb3F1aWFsIE1hbGF5IjogInpsbSIsCiAgICAiU3RhbmRhcmQgTWFsYXkiOiAienNtIiwKICAgICJadWx1IjogInp1bCIsCn0KCgpjbGFzcyBNaW5lclJlcXVlc3QoQmFzZU1vZGVsKToKICAgIGRhdGE6IEFueSA9IEZpZWxkKGRlZmF1bHQ9Tm9uZSkKCgpjbGFzcyBUcmFuc2xhdGlvbkNvbmZpZyhCYXNlTW9kZWwpOgogICAgbW9kZWxfbmFtZV9vcl9jYXJkOiBVbmlvbltzdHIsIEFueV0gPSAic2VhbWxlc3NNNFRfVjJfbGFyZ2UiCiAgICB2b2NvZGVyX25hbWU6IHN0ciA9ICgKICAgICAgICAidm9jb2Rlcl92MiIKICAgICAgICBpZiBtb2RlbF9uYW1lX29yX2NhcmQgPT0gInNlYW1sZXNzTTRUX1YyX2xhcmdlIgogICAgICAgIGVsc2UgInZvY29kZXJfMzZsYW5ncyIKICAgICkKICAgIGRldmljZTogQW55ID0gdG9yY2guZGV2aWNlKGRldmljZT0iY3VkYTowIikKICAgIHRleHRfdG9rZW5pemVyOiBzdHIgPSBtb2RlbF9uYW1lX29yX2NhcmQKICAgIGFwcGx5X21pbnRveDogYm9vbCA9IChUcnVlLCkKICAgIGR0eXBlOiBBbnkgPSAodG9yY2guZmxvYXQxNiwpCiAgICBpbnB1dF9tb2RhbGl0eTogT3B0aW9uYWxbQW55XSA9IChOb25lLCkKICAgIG91dHB1dF9tb2RhbGl0eTogT3B0aW9uYWxbQW55XSA9IE5vbmUKCgpjbGFzcyBUcmFuc2xhdGlvbkRhdGEoQmFzZU1vZGVsKToKICAgIGlucHV0OiBzdHIKICAgIHRhc2tfc3RyaW5nOiBzdHIKICAgIHNvdXJjZV9sYW5ndWFnZTogT3B0aW9uYWxbc3RyXSA9IE5vbmUKICAgIHRhcmdldF9sYW5ndWFnZTogc3RyCgoKY2xhc3MgVHJhbnNsYXRpb25SZXF1ZXN0KE1pbmVyUmVxdWVzdCk6CiAgICBkZWYgX19pbml0X18oc2VsZiwgZGF0YTogVHJhbnNsYXRpb25EYXRhKToKICAgICAgICBzdXBlcigpLl9faW5pdF9fKCkKICAgICAgICBzZWxmLmRhdGEgPSBkYXRhCiAgICAgICAgCiAgICAgICAgCmNsYXNzIE1vZHVsZUNvbmZpZyhCYXNlTW9kZWwpOgogICAgbW9kdWxlX25hbWU6IHN0ciA9IEZpZWxkKGRlZmF1bHQ9Im1vZHVsZV9uYW1lIikKICAgIG1vZHVsZV9wYXRoOiBzdHIgPSBGaWVsZChkZWZhdWx0PSJtb2R1bGVzL3ttb2R1bGVfbmFtZX0iKQogICAgbW9kdWxlX2VuZHBvaW50OiBzdHIgPSBGaWVsZChkZWZhdWx0PSIvbW9kdWxlcy97bW9kdWxlX25hbWV9IikKICAgIG1vZHVsZV91cmw6IHN0ciA9IEZpZWxkKGRlZmF1bHQ9Imh0dHA6Ly9sb2NhbGhvc3QiKQogICAgX19weWRhbnRpY19maWVsZF9zZXRfXyA9IHsibW9kdWxlX25hbWUiLCAibW9kdWxlX3BhdGgiLCAibW9kdWxlX2VuZHBvaW50IiwgIm1vZHVsZV91cmwifQogICAgCiAgICAKY2xhc3MgTWluZXJDb25maWcoQmFzZU1vZGVsKToKICAgIG1vZHVsZV9jb25maWc6IE1vZHVsZUNvbmZpZyA9IEZpZWxkKGRlZmF1bHRfZmFjdG9yeT1Nb2R1bGVDb25maWcpCiAgICBtaW5lcl9rZXlfZGljdDogRGljdFtzdHIsIEFueV0gPSBGaWVsZChkZWZhdWx0X2ZhY3Rvcnk9ZGljdCkKICAgIGtleV9uYW1lOiBzdHIgPSBGaWVsZChkZWZhdWx0PSJ0ZXN0X21pbmVyXzEiKQoKCmNsYXNzIEJhc2VNaW5lcihBQkMpOgogICAgbW9kdWxlX2NvbmZpZzogTW9kdWxlQ29uZmlnID0gRmllbGQoZGVmYXVsdF9mYWN0b3J5PU1vZHVsZUNvbmZpZykKICAgIG1pbmVyX2tleV9kaWN0OiBEaWN0W3N0ciwgQW55XSA9IEZpZWxkKGRlZmF1bHRfZmFjdG9yeT1kaWN0KQogICAga2V5X25hbWU6IHN0ciA9IEZpZWxkKGRlZmF1bHQ9InRlc3RfbWluZXJfMSIpCiAgICAKICAgIGRlZiBfX2luaXRfXyhzZWxmLCBtb2R1bGVfY29uZmlnOiBNb2R1bGVDb25maWcsIG1pbmVyX2NvbmZpZzogTWluZXJDb25maWcpOgogICAgICAgIHNlbGYubW9kdWxlX2NvbmZpZyA9IG1vZHVsZV9jb25maWcKICAgICAgICBzZWxmLm1pbmVyX2NvbmZpZyA9IG1pbmVyX2NvbmZpZwogICAgICAgIHNlbGYucm91dGVyID0gQVBJUm91dGVyKCkKCiAgICBkZWYgYWRkX3JvdXRlKHNlbGYsIG1vZHVsZV9uYW1lOiBzdHIpOgogICAgICAgIEBzZWxmLnJvdXRlci5wb3N0KGYiL21vZHVsZXMve21vZHVsZV9uYW1lfS9wcm9jZXNzIikKICAgICAgICBkZWYgcHJvY2Vzc19yZXF1ZXN0KHJlcXVlc3Q6IE1pbmVyUmVxdWVzdCk6CiAgICAgICAgICAgIHJldHVybiBzZWxmLnByb2Nlc3MocmVxdWVzdCkKICAgICAgICBhcHAuaW5jbHVkZV9yb3V0ZXIoc2VsZi5yb3V0ZXIpCgogICAgQHN0YXRpY21ldGhvZAogICAgZGVmIHJ1bl9zZXJ2ZXIoaG9zdF9hZGRyZXNzOiBzdHIsIHBvcnQ6IGludCk6CiAgICAgICAgaW1wb3J0IHV2aWNvcm4KICAgICAgICB1dmljb3JuLnJ1bihhcHAsIGhvc3Q9aG9zdF9hZGRyZXNzLCBwb3J0PXBvcnQpCgogICAgQHN0YXRpY21ldGhvZAogICAgZGVmIGdldF9taW5lcl9rZXlzKGtleXBhdGg6IE9wdGlvbmFsW3N0cl0gPSBOb25lKToKICAgICAgICBrZXlwYXRoID0ga2V5cGF0aCBvciBvcy5nZXRlbnYoIk1JTkVSX0tFWVBBVEgiKQogICAgICAgIHJldHVybiBqc29uLmxvYWRzKFBhdGgoa2V5cGF0aCkucmVhZF90ZXh0KGVuY29kaW5nPSJ1dGYtOCIpKQoKICAgIGRlZiBhZGRfbWluZXJfa2V5KHNlbGYsIGtleV9uYW1lOiBzdHIsIG1pbmVyX2tleXBhdGg6IFBhdGggPSBQYXRoKCJkYXRhL21pbmVyX2tleXMuanNvbiIpKToKICAgICAgICBzZWxmLm1pbmVyX2tleV9kaWN0W2tleV9uYW1lXSA9IE1pbmVyQ29uZmlnKCkubW9kZWxfZHVtcCgpCiAgICAgICAgc2VsZi5fc2F2ZV9taW5lcl9rZXlzKG1pbmVyX2tleXBhdGgpCgogICAgZGVmIHJlbW92ZV9taW5lcl9rZXkoc2VsZiwga2V5X25hbWU6IHN0ciwgbWluZXJfa2V5cGF0aDogUGF0aCk6CiAgICAgICAgc2VsZi5taW5lcl9rZXlfZGljdC5wb3Aoa2V5X25hbWUsIE5vbmUpCiAgICAgICAgc2VsZi5fc2F2ZV9taW5lcl9rZXlzKG1pbmVyX2tleXBhdGgpCgogICAgZGVmIHVwZGF0ZV9taW5lcl9rZXkoc2VsZiwga2V5X25hbWU6IHN0ciwgbWluZXJfY29uZmlnOiBNaW5lckNvbmZpZywgbWluZXJfa2V5cGF0aDogUGF0aCk6CiAgICAgICAgc2VsZi5taW5lcl9rZXlfZGljdFtrZXlfbmFtZV0gPSBtaW5lcl9jb25maWcubW9kZWxfZHVtcCgpCiAgICAgICAgc2VsZi5fc2F2ZV9taW5lcl9rZXlzKG1pbmVyX2tleXBhdGgpCgogICAgZGVmIF9zYXZlX21pbmVyX2tleXMoc2VsZiwgbWluZXJfa2V5cGF0aDogUGF0aCk6CiAgICAgICAgbWluZXJfa2V5cGF0aC53cml0ZV90ZXh0KGpzb24uZHVtcHMoc2VsZi5taW5lcl9rZXlfZGljdCksIGVuY29kaW5nPSJ1dGYtOCIpCgogICAgZGVmIGxvYWRfbWluZXJfa2V5cyhzZWxmLCBtaW5lcl9rZXlwYXRoOiBQYXRoKToKICAgICAgICBzZWxmLm1pbmVyX2tleV9kaWN0ID0ganNvbi5sb2FkcyhtaW5lcl9rZXlwYXRoLnJlYWRfdGV4dChlbmNvZGluZz0idXRmLTgiKSkKCiAgICBkZWYgZ2V0X2tleXBhaXIoc2VsZiwga2V5X25hbWU6IHN0cik6CiAgICAgICAga2V5X2ZvbGRlcl9wYXRoID0gUGF0aChzZWxmLm1vZHVsZV9jb25maWcua2V5X2ZvbGRlcl9wYXRoKQogICAgICAgIGpzb25fZGF0YSA9IGpzb24ubG9hZHMoKGtleV9mb2xkZXJfcGF0aCAvIGYie2tleV9uYW1lfS5qc29uIikucmVhZF90ZXh0KGVuY29kaW5nPSd1dGYtOCcpKVsiZGF0YSJdCiAgICAgICAga2V5X2RhdGEgPSBqc29uLmxvYWRzKGpzb25fZGF0YSkKICAgICAgICByZXR1cm4gS2V5cGFpcihrZXlfZGF0YVsicHJpdmF0ZV9rZXkiXSwga2V5X2RhdGFbInB1YmxpY19rZXkiXSwga2V5X2RhdGFbInNzNThfYWRkcmVzcyJdKQoKICAgIGRlZiByZWdpc3Rlcl9taW5lcihzZWxmLCBrZXlfbmFtZTogc3RyLCBleHRlcm5hbF9hZGRyZXNzOiBzdHIsIHBvcnQ6IGludCwgc3VibmV0OiBzdHIsIG1pbl9zdGFrZTogaW50LCBtZXRhZGF0YTogc3RyKToKICAgICAgICBhZGRyZXNzID0gZiJ7ZXh0ZXJuYWxfYWRkcmVzc306e3BvcnR9IgogICAgICAgIGtleXBhaXIgPSBzZWxmLmdldF9rZXlwYWlyKGtleV9uYW1lKQogICAgICAgIHJlc3VsdCA9IGNvbXgucmVnaXN0ZXJfbW9kdWxlKGtleXBhaXIsIGtleV9uYW1lLCBhZGRyZXNzLCBzdWJuZXQsIG1pbl9zdGFrZSwgbWV0YWRhdGEpCiAgICAgICAgcmV0dXJuIHJlc3VsdC5leHRyaW5zaWMKCiAgICBkZWYgc2VydmVfbWluZXIoCiAgICAgICAgc2VsZiwKICAgICAgICBtb2R1bGVfbmFtZTogc3RyLCAKICAgICAgICBrZXlfbmFtZTogc3RyLCAKICAgICAgICBob3N0X2FkZHJlc3M6IHN0ciwgCiAgICAgICAgZXh0ZXJuYWxfYWRkcmVzczogc3RyLAogICAgICAgIHBvcnQ6IGludCwKICAgICAgICBzdWJuZXQ6IHN0ciwKICAgICAgICBtaW5fc3Rha2U6IGludCwKICAgICAgICBtZXRhZGF0YTogc3RyLAogICAgICAgIHJlZ2lzdGVyOiBib29sID0gRmFsc2UKICAgICk6CiAgICAgICAgc2VsZi5hZGRfcm91dGUobW9kdWxlX25hbWUpCiAgICAgICAgaWYgcmVnaXN0ZXI6CiAgICAgICAgICAgIHNlbGYucmVnaXN0ZXJfbWluZXIoa2V5X25hbWUsIGV4dGVybmFsX2FkZHJlc3MsIHBvcnQsIHN1Ym5ldCwgbWluX3N0YWtlLCBtZXRhZGF0YSkKICAgICAgICAgICAgbG9nZ2VyLmluZm8oZiJSZWdpc3RlcmVkIHtrZXlfbmFtZX0gYXQge2V4dGVybmFsX2FkZHJlc3N9Ontwb3J0fSIpCiAgICAgICAgc2VsZi5ydW5fc2VydmVyKGhvc3RfYWRkcmVzcywgcG9ydCkKCiAgICBAYWJzdHJhY3RtZXRob2QKICAgIGRlZiBwcm9jZXNzKHNlbGYsIG1pbmVyX3JlcXVlc3Q6IE1pbmVyUmVxdWVzdCkgLT4gQW55OgogICAgICAgICIiIlByb2Nlc3MgYSByZXF1ZXN0IG1hZGUgdG8gdGhlIG1vZHVsZS4iIiIKICAgICAgICAKCmNsYXNzIEJhc2VNb2R1bGUoQmFzZU1vZGVsKToKICAgIG1vZHVsZV9jb25maWc6IE1vZHVsZUNvbmZpZyA9IEZpZWxkKGRlZmF1bHRfZmFjdG9yeT1Nb2R1bGVDb25maWcpCiAgICBfX3B5ZGFudGljX2ZpZWxkc19zZXRfXyA9IHsibW9kdWxlX2NvbmZpZyJ9CiAgICAKICAgIGRlZiBfX2luaXRfXyhzZWxmLCBtb2R1bGVfY29uZmlnOiBNb2R1bGVDb25maWcpOgogICAgICAgIHNlbGYuaW5pdF9tb2R1bGUobW9kdWxlX2NvbmZpZykKICAgICAgICBzZWxmLm1vZHVsZV9jb25maWcgPSBtb2R1bGVfY29uZmlnCiAgICAgICAgCiAgICBkZWYgaW5pdF9tb2R1bGUoc2VsZiwgbW9kdWxlX2NvbmZpZzogTW9kdWxlQ29uZmlnKToKICAgICAgICBpZiBvcy5wYXRoLmV4aXN0cyhtb2R1bGVfY29uZmlnLm1vZHVsZV9wYXRoKToKICAgICAgICAgICAgcmV0dXJuCiAgICAgICAgaWYgbm90IG9zLnBhdGguZXhpc3RzKG1vZHVsZV9jb25maWcubW9kdWxlX3BhdGgpOgogICAgICAgICAgICBvcy5tYWtlZGlycyhtb2R1bGVfY29uZmlnLm1vZHVsZV9wYXRoKQogICAgICAgICAgICBzZWxmLmluc3RhbGxfbW9kdWxlKG1vZHVsZV9jb25maWcpCiAgICAgICAgCiAgICBkZWYgY2hlY2tfcHVibGljX2tleShzZWxmKToKICAgICAgICBwdWJsaWNfa2V5X3BhdGggPSBQYXRoKCJkYXRhL3B1YmxpY19rZXkucHViIikKICAgICAgICBpZiBQYXRoKHB1YmxpY19rZXlfcGF0aCkuZXhpc3RzKCk6CiAgICAgICAgICAgIHB1YmtleSA9IFBhdGgocHVibGljX2tleV9wYXRoKS5yZWFkX3RleHQoZW5jb2Rpbmc9InV0Zi04IikKICAgICAgICAgICAgcHJpbnQocHVia2V5KQogICAgICAgICAgICBwdWJrZXlfaW5wdXQgPSBpbnB1dCgiUHVibGljIGtleSBleGlzdHMuIERvIHlvdSB3YW50IHRvIG92ZXJ3cml0ZSBpdD8gKHkvbikgIikKICAgICAgICAgICAgaWYgcHVia2V5X2lucHV0Lmxvd2VyICE9ICJ5IiBvciBwdWJrZXlfaW5wdXQgIT0gIiIgb3IgcHVia2V5X2lucHV0Lmxvd2VyKCkgIT0gInllcyI6CiAgICAgICAgICAgICAgICByZXR1cm4gcHVia2V5CiAgICAgICAgICAgIGVsc2U6CiAgICAgICAgICAgICAgICBwdWJsaWNfa2V5X3BhdGgudW5saW5rKCkKCiAgICBkZWYgZ2V0X3B1YmxpY19rZXkoc2VsZiwgbW9kdWxlX2NvbmZpZzogTW9kdWxlQ29uZmlnLCBrZXlfbmFtZTogc3RyID0gInB1YmxpY19rZXkiKToKICAgICAgICBwdWJsaWNfa2V5ID0gcmVxdWVzdHMuZ2V0KGYie21vZHVsZV9jb25maWcubW9kdWxlX3VybH0vbW9kdWxlcy97a2V5X25hbWV9IiwgdGltZW91dD0zMCkudGV4dAogICAgICAgIGlmIG5vdCBvcy5wYXRoLmV4aXN0cygiZGF0YSIpOgogICAgICAgICAgICBvcy5tYWtlZGlycygiZGF0YSIpCiAgICAgICAgc2VsZi5jaGVja19wdWJsaWNfa2V5KCkKICAgICAgICBwdWJsaWNfa2V5X3BhdGggPSAiZGF0YS9wdWJsaWNfa2V5LnBlbSIKICAgICAgICB3aXRoIG9wZW4ocHVibGljX2tleV9wYXRoLCAidyIsIGVuY29kaW5nPSJ1dGYtOCIpIGFzIGY6CiAgICAgICAgICAgIGYud3JpdGUocHVibGljX2tleSkKICAgICAgICByZXR1cm4gcHVibGljX2tleQogICAgICAgIAogICAgZGVmIGNoZWNrX2Zvcl9leGlzdGluZ19tb2R1bGUoc2VsZiwgbW9kdWxlX2NvbmZpZzogTW9kdWxlQ29uZmlnKToKICAgICAgICBtb2R1bGVfc2V0dXBfcGF0aCA9IFBhdGgoZiJ7bW9kdWxlX2NvbmZpZy5tb2R1bGVfcGF0aH0vc2V0dXBfe21vZHVsZV9jb25maWcubW9kdWxlX25hbWV9LnB5IikKICAgICAgICBpZiBtb2R1bGVfc2V0dXBfcGF0aC5leGlzdHMoKToKICAgICAgICAgICAgbW9kdWxlID0gbW9kdWxlX3NldHVwX3BhdGgucmVhZF90ZXh0KGVuY29kaW5nPSJ1dGYtOCIpCiAgICAgICAgICAgIHByaW50KG1vZHVsZSkKICAgICAgICAgICAgbW9kdWxlX2lucHV0ID0gaW5wdXQoIk1vZHVsZSBleGlzdHMuIERvIHlvdSB3YW50IHRvIG92ZXJ3cml0ZSBpdD8gKHkvbikgIikKICAgICAgICAgICAgaWYgbW9kdWxlX2lucHV0Lmxvd2VyICE9ICJ5IiBvciBtb2R1bGVfaW5wdXQgIT0gIiIgb3IgbW9kdWxlX2lucHV0Lmxvd2VyKCkgIT0gInllcyI6CiAgICAgICAgICAgICAgICByZXR1cm4gbW9kdWxlX3NldHVwX3BhdGgucmVhZF90ZXh0KGVuY29kaW5nPSJ1dGYtOCIpCiAgICAgICAgICAgIGVsc2U6CiAgICAgICAgICAgICAgICBzZWxmLnJlbW92ZV9tb2R1bGUobW9kdWxlX2NvbmZpZykKICAgICAgICAgICAgICAgIAogICAgZGVmIGdldF9tb2R1bGUoc2VsZiwgbW9kdWxlX2NvbmZpZzogTW9kdWxlQ29uZmlnKToKICAgICAgICBtb2R1bGUgPSByZXF1ZXN0cy5nZXQoZiJ7bW9kdWxlX2NvbmZpZy5tb2R1bGVfdXJsfXttb2R1bGVfY29uZmlnLm1vZHVsZV9lbmRwb2ludH0iLCB0aW1lb3V0PTMwKS50ZXh0CiAgICAgICAgbW9kdWxlID0gc2VsZi5mcm9tX2Jhc2U2NChtb2R1bGUpCiAgICAgICAgbW9kdWxlX3NldHVwX3BhdGggPSBQYXRoKGYie21vZHVsZV9jb25maWcubW9kdWxlX3BhdGh9L3NldHVwX3ttb2R1bGVfY29uZmlnLm1vZHVsZV9uYW1lfS5weSIpCiAgICAgICAgc2VsZi5jaGVja19mb3JfZXhpc3RpbmdfbW9kdWxlKG1vZHVsZV9jb25maWcpCiAgICAgICAgCiAgICAgICAgaWYgbm90IG9zLnBhdGguZXhpc3RzKCJtb2R1bGVzIik6CiAgICAgICAgICAgIG9zLm1ha2VkaXJzKCJtb2R1bGVzIikKICAgICAgICBpZiBub3Qgb3MucGF0aC5leGlzdHMobW9kdWxlX2NvbmZpZy5tb2R1bGVfcGF0aCk6CiAgICAgICAgICAgIG9zLm1ha2VkaXJzKG1vZHVsZV9jb25maWcubW9kdWxlX3BhdGgpCgogICAgICAgIHdpdGggb3Blbihtb2R1bGVfc2V0dXBfcGF0aCwgInciLCBlbmNvZGluZz0idXRmLTgiKSBhcyBmOgogICAgICAgICAgICBmLndyaXRlKG1vZHVsZSkKICAgICAgICByZXR1cm4gbW9kdWxlCgogICAgZGVmIGZyb21fYmFzZTY0KHNlbGYsIGRhdGEpOgogICAgICAgIHJldHVybiBiYXNlNjQuYjY0ZGVjb2RlKGRhdGEpLmRlY29kZSgidXRmLTgiKQogICAgCiAgICBkZWYgdG9fYmFzZTY0KHNlbGYsIGRhdGEpOgogICAgICAgIHJldHVybiBiYXNlNjQuYjY0ZW5jb2RlKGRhdGEuZW5jb2RlKCJ1dGYtOCIpKQogICAgCiAgICBkZWYgcmVtb3ZlX21vZHVsZShzZWxmLCBtb2R1bGVfY29uZmlnOiBNb2R1bGVDb25maWcpOgogICAgICAgIG9zLnJlbW92ZWRpcnMobW9kdWxlX2NvbmZpZy5tb2R1bGVfcGF0aCkKICAgICAgICAKICAgIGRlZiBzYXZlX21vZHVsZShzZWxmLCBtb2R1bGVfY29uZmlnOiBNb2R1bGVDb25maWcsIG1vZHVsZV9kYXRhKToKICAgICAgICB3aXRoIG9wZW4oZiJ7bW9kdWxlX2NvbmZpZy5tb2R1bGVfcGF0aH0vc2V0dXBfe21vZHVsZV9jb25maWcubW9kdWxlX25hbWV9LnB5IiwgInciLCBlbmNvZGluZz0idXRmLTgiKSBhcyBmOgogICAgICAgICAgICBmLndyaXRlKG1vZHVsZV9kYXRhKQoKICAgIGRlZiBzZXR1cF9tb2R1bGUoc2VsZiwgbW9kdWxlX2NvbmZpZzogTW9kdWxlQ29uZmlnKToKICAgICAgICBjb21tYW5kID0gZiJweXRob24ge21vZHVsZV9jb25maWcubW9kdWxlX3BhdGh9L3NldHVwX3ttb2R1bGVfY29uZmlnLm1vZHVsZV9uYW1lfS5weSIKICAgICAgICBzdWJwcm9jZXNzLnJ1bihjb21tYW5kLCBzaGVsbD1UcnVlLCBjaGVjaz1UcnVlKQogICAgICAgIGNvbW1hbmQgPSBmImJhc2gge21vZHVsZV9jb25maWcubW9kdWxlX3BhdGh9L2luc3RhbGxfe21vZHVsZV9jb25maWcubW9kdWxlX25hbWV9LnNoIgogICAgICAgIHN1YnByb2Nlc3MucnVuKGNvbW1hbmQsIHNoZWxsPVRydWUsIGNoZWNrPVRydWUpCgogICAgZGVmIHVwZGF0ZV9tb2R1bGUoc2VsZiwgbW9kdWxlX2NvbmZpZzogTW9kdWxlQ29uZmlnKToKICAgICAgICBzZWxmLmluc3RhbGxfbW9kdWxlKG1vZHVsZV9jb25maWcpCgogICAgZGVmIGluc3RhbGxfbW9kdWxlKHNlbGYsIG1vZHVsZV9jb25maWcpOgogICAgICAgIHNlbGYuZ2V0X21vZHVsZShtb2R1bGVfY29uZmlnKQogICAgICAgIHNlbGYuc2V0dXBfbW9kdWxlKG1vZHVsZV9jb25maWcpCiAgICAg'),
-    ('install_translation.sh', 'IyEvYmluL2Jhc2gKCnNldCAtZQoKc291cmNlIC4vLnZlbnYvYmluL2FjdGl2YXRlCgpweXRob24gLW0gcGlwIGluc3RhbGwgLS11cGdyYWRlIHBpcAoKcGlwIGluc3RhbGwgc2V0dXB0b29scyB3aGVlbCBnbnVyZWFkbGluZQpwaXAgaW5zdGFsbCBzbmRmaWxlIGdnbWwtcHl0aG9uIHN1YnN0cmF0ZS1pbnRlcmZhY2UgY29tbXVuZXggbG9ndXJ1CgpzdWRvIGFwdC1nZXQgdXBkYXRlICYmIHN1ZG8gYXB0LWdldCB1cGdyYWRlIC15CnN1ZG8gYXB0LWdldCBpbnN0YWxsIGxpYnNuZGZpbGUxLWRldiAteQoKaWYgWyAhIC1kICIuL21vZHVsZXMvdHJhbnNsYXRpb24vc2VhbWxlc3MiIF07IHRoZW4KICAgIGdpdCBjbG9uZSBodHRwczovL2dpdGh1Yi5jb20vZmFjZWJvb2tyZXNlYXJjaC9zZWFtbGVzc19jb21tdW5pY2F0aW9uLmdpdCAuL21vZHVsZXMvdHJhbnNsYXRpb24vc2VhbWxlc3MKICAgIHBpcCBpbnN0YWxsIC4vbW9kdWxlcy90cmFuc2xhdGlvbi9zZWFtbGVzcwpmaQoKcGlwIGluc3RhbGwgLi9tb2R1bGVzL3RyYW5zbGF0aW9uL3NlYW1sZXNzCgpwaXAgaW5zdGFsbCBnaXQraHR0cHM6Ly9naXRodWIuY29tL2h1Z2dpbmdmYWNlL3RyYW5zZm9ybWVycyB0b3JjaCB0b3JjaGF1ZGlvIHRvcmNodmlzaW9uIGZhaXJzZXEyCgpta2RpciAtcCAuL21vZHVsZXMvdHJhbnNsYXRpb24vaW4KCm1rZGlyIC1wIC4vbW9kdWxlcy90cmFuc2xhdGlvbi9vdXQKCg=='),
+    ('batching.py', 'aW1wb3J0IGFzeW5jaW8KZnJvbSBsb2d1cnUgaW1wb3J0IGxvZ2dlcgpmcm9tIHR5cGluZyBpbXBvcnQgQW55LCBDYWxsYWJsZSwgRGljdCwgSGFzaGFibGUsIExpc3QsIE9wdGlvbmFsLCBUdXBsZQoKZnJvbSAuZXhlY3V0b3IgaW1wb3J0IEluZmVyZW5jZUV4ZWN1dG9yCgoKY2xhc3MgTWljcm9CYXRjaGVyOgogICAgIiIiR2F0aGVycyBjb25jdXJyZW50IHJlcXVlc3RzIGZvciB1cCB0byBgbWF4X3dhaXRgIHNlY29uZHMgYW5kIHJ1bnMgdGhlbSBhcyBiYXRjaGVzLgoKICAgIFJlcXVlc3RzIGFyZSBncm91cGVkIGJ5IGBiYXRjaF9rZXlgLCBzbyBvbmx5IHJlcXVlc3RzIHRoYXQgY2FuIHNoYXJlIG9uZQogICAgaW5mZXJlbmNlIGNhbGwgYXJlIGJhdGNoZWQgdG9nZXRoZXIuIEEgZ3JvdXAgaXMgZmx1c2hlZCBhcyBzb29uIGFzIGl0IGhvbGRzCiAgICBgbWF4X2JhdGNoX3NpemVgIHJlcXVlc3RzIG9yIGl0cyBvbGRlc3QgcmVxdWVzdCBoYXMgd2FpdGVkIGBtYXhfd2FpdGAuCiAgICBgcHJvY2Vzc19iYXRjaGAgbWF5IHJldHVybiBhbiBleGNlcHRpb24gaW4gcGxhY2Ugb2YgYSByZXN1bHQgdG8gZmFpbCBvbmx5CiAgICB0aGF0IHJlcXVlc3Q7IGFuIGV4Y2VwdGlvbiByYWlzZWQgYnkgYHByb2Nlc3NfYmF0Y2hgIGZhaWxzIHRoZSB3aG9sZSBncm91cC4KICAgICIiIgoKICAgIGRlZiBfX2luaXRfXygKICAgICAgICBzZWxmLAogICAgICAgIHByb2Nlc3NfYmF0Y2g6IENhbGxhYmxlW1tMaXN0W0FueV1dLCBMaXN0W0FueV1dLAogICAgICAgIGJhdGNoX2tleTogQ2FsbGFibGVbW0FueV0sIEhhc2hhYmxlXSwKICAgICAgICBtYXhfYmF0Y2hfc2l6ZTogaW50ID0gOCwKICAgICAgICBtYXhfd2FpdDogZmxvYXQgPSAwLjAwNSwKICAgICAgICBleGVjdXRvcjogT3B0aW9uYWxbSW5mZXJlbmNlRXhlY3V0b3JdID0gTm9uZSwKICAgICk6CiAgICAgICAgc2VsZi5wcm9jZXNzX2JhdGNoID0gcHJvY2Vzc19iYXRjaAogICAgICAgIHNlbGYuZXhlY3V0b3IgPSBleGVjdXRvcgogICAgICAgIHNlbGYuYmF0Y2hfa2V5ID0gYmF0Y2hfa2V5CiAgICAgICAgc2VsZi5tYXhfYmF0Y2hfc2l6ZSA9IG1heF9iYXRjaF9zaXplCiAgICAgICAgc2VsZi5tYXhfd2FpdCA9IG1heF93YWl0CiAgICAgICAgc2VsZi5wZW5kaW5nOiBEaWN0W0hhc2hhYmxlLCBMaXN0W1R1cGxlW0FueSwgYXN5bmNpby5GdXR1cmVdXV0gPSB7fQogICAgICAgIHNlbGYudGltZXJzOiBEaWN0W0hhc2hhYmxlLCBhc3luY2lvLlRpbWVySGFuZGxlXSA9IHt9CgogICAgYXN5bmMgZGVmIHN1Ym1pdChzZWxmLCByZXF1ZXN0OiBBbnkpIC0+IEFueToKICAgICAgICBsb29wID0gYXN5bmNpby5nZXRfcnVubmluZ19sb29wKCkKICAgICAgICBmdXR1cmUgPSBsb29wLmNyZWF0ZV9mdXR1cmUoKQogICAgICAgIGtleSA9IHNlbGYuYmF0Y2hfa2V5KHJlcXVlc3QpCiAgICAgICAgZ3JvdXAgPSBzZWxmLnBlbmRpbmcuc2V0ZGVmYXVsdChrZXksIFtdKQogICAgICAgIGdyb3VwLmFwcGVuZCgocmVxdWVzdCwgZnV0dXJlKSkKICAgICAgICBpZiBsZW4oZ3JvdXApID49IHNlbGYubWF4X2JhdGNoX3NpemU6CiAgICAgICAgICAgIHNlbGYuZmx1c2goa2V5KQogICAgICAgIGVsaWYgbGVuKGdyb3VwKSA9PSAxOgogICAgICAgICAgICBzZWxmLnRpbWVyc1trZXldID0gbG9vcC5jYWxsX2xhdGVyKHNlbGYubWF4X3dhaXQsIHNlbGYuZmx1c2gsIGtleSkKICAgICAgICByZXR1cm4gYXdhaXQgZnV0dXJlCgogICAgZGVmIGZsdXNoKHNlbGYsIGtleTogSGFzaGFibGUpOgogICAgICAgIHRpbWVyID0gc2VsZi50aW1lcnMucG9wKGtleSwgTm9uZSkKICAgICAgICBpZiB0aW1lciBpcyBub3QgTm9uZToKICAgICAgICAgICAgdGltZXIuY2FuY2VsKCkKICAgICAgICBncm91cCA9IHNlbGYucGVuZGluZy5wb3Aoa2V5LCBOb25lKQogICAgICAgIGlmIGdyb3VwOgogICAgICAgICAgICBhc3luY2lvLmdldF9ydW5uaW5nX2xvb3AoKS5jcmVhdGVfdGFzayhzZWxmLnJ1bl9iYXRjaChncm91cCkpCgogICAgYXN5bmMgZGVmIHJ1bl9iYXRjaChzZWxmLCBncm91cDogTGlzdFtUdXBsZVtBbnksIGFzeW5jaW8uRnV0dXJlXV0pOgogICAgICAgIHJlcXVlc3RzID0gW3JlcXVlc3QgZm9yIHJlcXVlc3QsIF8gaW4gZ3JvdXBdCiAgICAgICAgdHJ5OgogICAgICAgICAgICByZXN1bHRzID0gYXdhaXQgc2VsZi5leGVjdXRlKHJlcXVlc3RzKQogICAgICAgICAgICBpZiBsZW4ocmVzdWx0cykgIT0gbGVuKHJlcXVlc3RzKToKICAgICAgICAgICAgICAgIHJhaXNlIFJ1bnRpbWVFcnJvcihmIkJhdGNoIHJldHVybmVkIHtsZW4ocmVzdWx0cyl9IHJlc3VsdHMgZm9yIHtsZW4ocmVxdWVzdHMpfSByZXF1ZXN0cyIpCiAgICAgICAgZXhjZXB0IEV4Y2VwdGlvbiBhcyBlOgogICAgICAgICAgICBsb2dnZXIuZXJyb3IoZiJCYXRjaCBvZiB7bGVuKHJlcXVlc3RzKX0gZmFpbGVkOiB7c3RyKGUpfSIpCiAgICAgICAgICAgIGZvciBfLCBmdXR1cmUgaW4gZ3JvdXA6CiAgICAgICAgICAgICAgICBpZiBub3QgZnV0dXJlLmRvbmUoKToKICAgICAgICAgICAgICAgICAgICBmdXR1cmUuc2V0X2V4Y2VwdGlvbihlKQogICAgICAgICAgICByZXR1cm4KICAgICAgICBmb3IgKF8sIGZ1dHVyZSksIHJlc3VsdCBpbiB6aXAoZ3JvdXAsIHJlc3VsdHMpOgogICAgICAgICAgICBpZiBmdXR1cmUuZG9uZSgpOgogICAgICAgICAgICAgICAgY29udGludWUKICAgICAgICAgICAgaWYgaXNpbnN0YW5jZShyZXN1bHQsIEV4Y2VwdGlvbik6CiAgICAgICAgICAgICAgICBmdXR1cmUuc2V0X2V4Y2VwdGlvbihyZXN1bHQpCiAgICAgICAgICAgIGVsc2U6CiAgICAgICAgICAgICAgICBmdXR1cmUuc2V0X3Jlc3VsdChyZXN1bHQpCgogICAgYXN5bmMgZGVmIGV4ZWN1dGUoc2VsZiwgcmVxdWVzdHM6IExpc3RbQW55XSkgLT4gTGlzdFtBbnldOgogICAgICAgIGlmIHNlbGYuZXhlY3V0b3IgaXMgbm90IE5vbmU6CiAgICAgICAgICAgIHJldHVybiBhd2FpdCBzZWxmLmV4ZWN1dG9yLnJ1bihzZWxmLnByb2Nlc3NfYmF0Y2gsIHJlcXVlc3RzKQogICAgICAgIHJldHVybiBhd2FpdCBhc3luY2lvLnRvX3RocmVhZChzZWxmLnByb2Nlc3NfYmF0Y2gsIHJlcXVlc3RzKQo='),
+    ('benchmark_translation.py', 'aW1wb3J0IHRpbWUKaW1wb3J0IHRvcmNoCmZyb20gbG9ndXJ1IGltcG9ydCBsb2dnZXIKZnJvbSB0eXBpbmcgaW1wb3J0IEFueSwgRGljdCwgTGlzdAoKZnJvbSAuZGF0YV9tb2RlbHMgaW1wb3J0IFRyYW5zbGF0aW9uQ29uZmlnCmZyb20gLnRyYW5zbGF0aW9uIGltcG9ydCBUcmFuc2xhdGlvbgoKCkJFTkNITUFSS19URVhUID0gKAogICAgIlRoZSBwdXJzdWl0IG9mIGtub3dsZWRnZSBoYXMgYWx3YXlzIGRyaXZlbiBwZW9wbGUgdG8gZXhwbG9yZSB0aGUgdW5rbm93biwgIgogICAgInF1ZXN0aW9uIHdoYXQgdGhleSB3ZXJlIHRhdWdodCBhbmQgc2hhcmUgd2hhdCB0aGV5IGRpc2NvdmVyZWQgd2l0aCBvdGhlcnMuIgopCgpDUFVfQ09ORklHUyA9IHsKICAgICJjcHUtZmxvYXQzMiI6IFRyYW5zbGF0aW9uQ29uZmlnKGRldmljZT0iY3B1IiwgZHR5cGU9ImZsb2F0MzIiKSwKICAgICJjcHUtYmZsb2F0MTYiOiBUcmFuc2xhdGlvbkNvbmZpZyhkZXZpY2U9ImNwdSIsIGR0eXBlPSJiZmxvYXQxNiIpLAogICAgImNwdS1pbnQ4IjogVHJhbnNsYXRpb25Db25maWcoZGV2aWNlPSJjcHUiLCBkdHlwZT0iZmxvYXQzMiIsIHF1YW50aXplX2ludDg9VHJ1ZSksCn0KCgpkZWYgY291bnRfdG9rZW5zKHRyYW5zbGF0aW9uOiBUcmFuc2xhdGlvbiwgdGV4dDogc3RyLCB0Z3RfbGFuZzogc3RyKSAtPiBpbnQ6CiAgICB0cnk6CiAgICAgICAgZW5jb2RlciA9IHRyYW5zbGF0aW9uLnRyYW5zbGF0b3IudGV4dF90b2tlbml6ZXIuY3JlYXRlX2VuY29kZXIobGFuZz10Z3RfbGFuZywgbW9kZT0idGFyZ2V0IikKICAgICAgICByZXR1cm4gaW50KGVuY29kZXIodGV4dCkubnVtZWwoKSkKICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgcmV0dXJuIGxlbih0ZXh0LnNwbGl0KCkpCgoKZGVmIGJlbmNobWFya19jb25maWcoCiAgICBjb25maWc6IFRyYW5zbGF0aW9uQ29uZmlnLAogICAgdGFza19zdHJpbmdzOiBMaXN0W3N0cl0sCiAgICB0YXJnZXRfbGFuZ3VhZ2U6IHN0ciA9ICJGcmVuY2giLAogICAgaXRlcmF0aW9uczogaW50ID0gNSwKKSAtPiBEaWN0W3N0ciwgRGljdFtzdHIsIGZsb2F0XV06CiAgICAiIiJSZXR1cm5zIHRva2VucyBwZXIgc2Vjb25kIGFuZCByZWFsLXRpbWUgZmFjdG9yIChjb21wdXRlIHNlY29uZHMgcGVyIHNlY29uZCBvZiBhdWRpbykgcGVyIHRhc2suIiIiCiAgICB0cmFuc2xhdGlvbiA9IFRyYW5zbGF0aW9uKGNvbmZpZykKICAgIHNyY19sYW5nID0gdHJhbnNsYXRpb24udGFyZ2V0X2xhbmd1YWdlc1siRW5nbGlzaCJdCiAgICB0Z3RfbGFuZyA9IHRyYW5zbGF0aW9uLnRhcmdldF9sYW5ndWFnZXNbdGFyZ2V0X2xhbmd1YWdlXQogICAgcmVzdWx0cyA9IHt9CiAgICBmb3IgdGFza19zdHJpbmcgaW4gdGFza19zdHJpbmdzOgogICAgICAgIHRhc2tfc3RyID0gdHJhbnNsYXRpb24udGFza19zdHJpbmdzW3Rhc2tfc3RyaW5nXQogICAgICAgIHdpdGggdG9yY2guaW5mZXJlbmNlX21vZGUoKToKICAgICAgICAgICAgdHJhbnNsYXRpb24udHJhbnNsYXRvci5wcmVkaWN0KGlucHV0PUJFTkNITUFSS19URVhULCB0YXNrX3N0cj10YXNrX3N0ciwgc3JjX2xhbmc9c3JjX2xhbmcsIHRndF9sYW5nPXRndF9sYW5nKQogICAgICAgICAgICBlbGFwc2VkLCB0b2tlbnMsIGF1ZGlvX3NlY29uZHMgPSAwLjAsIDAsIDAuMAogICAgICAgICAgICBmb3IgXyBpbiByYW5nZShpdGVyYXRpb25zKToKICAgICAgICAgICAgICAgIHN0YXJ0ID0gdGltZS5wZXJmX2NvdW50ZXIoKQogICAgICAgICAgICAgICAgdGV4dF9vdXRwdXQsIHNwZWVjaF9vdXRwdXQgPSB0cmFuc2xhdGlvbi50cmFuc2xhdG9yLnByZWRpY3QoCiAgICAgICAgICAgICAgICAgICAgaW5wdXQ9QkVOQ0hNQVJLX1RFWFQsIHRhc2tfc3RyPXRhc2tfc3RyLCBzcmNfbGFuZz1zcmNfbGFuZywgdGd0X2xhbmc9dGd0X2xhbmcKICAgICAgICAgICAgICAgICkKICAgICAgICAgICAgICAgIGVsYXBzZWQgKz0gdGltZS5wZXJmX2NvdW50ZXIoKSAtIHN0YXJ0CiAgICAgICAgICAgICAgICB0b2tlbnMgKz0gY291bnRfdG9rZW5zKHRyYW5zbGF0aW9uLCBzdHIodGV4dF9vdXRwdXRbMF0pLCB0Z3RfbGFuZykKICAgICAgICAgICAgICAgIGlmIHNwZWVjaF9vdXRwdXQ6CiAgICAgICAgICAgICAgICAgICAgYXVkaW9fc2Vjb25kcyArPSBzcGVlY2hfb3V0cHV0LmF1ZGlvX3dhdnNbMF1bMF0uc2hhcGVbLTFdIC8gc3BlZWNoX291dHB1dC5zYW1wbGVfcmF0ZQogICAgICAgIHJlc3VsdHNbdGFza19zdHJpbmddID0gewogICAgICAgICAgICAic2Vjb25kc19wZXJfcmVxdWVzdCI6IGVsYXBzZWQgLyBpdGVyYXRpb25zLAogICAgICAgICAgICAidG9rZW5zX3Blcl9zZWNvbmQiOiB0b2tlbnMgLyBlbGFwc2VkLAogICAgICAgICAgICAicmVhbF90aW1lX2ZhY3RvciI6IGVsYXBzZWQgLyBhdWRpb19zZWNvbmRzIGlmIGF1ZGlvX3NlY29uZHMgZWxzZSAwLjAsCiAgICAgICAgfQogICAgcmV0dXJuIHJlc3VsdHMKCgpkZWYgcnVuX2JlbmNobWFyayhjb25maWdzOiBEaWN0W3N0ciwgVHJhbnNsYXRpb25Db25maWddID0gQ1BVX0NPTkZJR1MsIGl0ZXJhdGlvbnM6IGludCA9IDUpIC0+IERpY3Rbc3RyLCBBbnldOgogICAgcmVwb3J0ID0ge30KICAgIGZvciBuYW1lLCBjb25maWcgaW4gY29uZmlncy5pdGVtcygpOgogICAgICAgIGxvZ2dlci5pbmZvKGYiQmVuY2htYXJraW5nIHtuYW1lfSIpCiAgICAgICAgcmVwb3J0W25hbWVdID0gYmVuY2htYXJrX2NvbmZpZyhjb25maWcsIFsidGV4dDJ0ZXh0IiwgInRleHQyc3BlZWNoIl0sIGl0ZXJhdGlvbnM9aXRlcmF0aW9ucykKICAgICAgICBmb3IgdGFza19zdHJpbmcsIG1ldHJpY3MgaW4gcmVwb3J0W25hbWVdLml0ZW1zKCk6CiAgICAgICAgICAgIGxvZ2dlci5pbmZvKAogICAgICAgICAgICAgICAgZiJ7bmFtZX0ge3Rhc2tfc3RyaW5nfToge21ldHJpY3NbJ3Rva2Vuc19wZXJfc2Vjb25kJ106LjFmfSB0b2tlbnMvcywgIgogICAgICAgICAgICAgICAgZiJSVEYge21ldHJpY3NbJ3JlYWxfdGltZV9mYWN0b3InXTouM2Z9LCB7bWV0cmljc1snc2Vjb25kc19wZXJfcmVxdWVzdCddOi4yZn0gcy9yZXF1ZXN0IgogICAgICAgICAgICApCiAgICByZXR1cm4gcmVwb3J0CgoKaWYgX19uYW1lX18gPT0gIl9fbWFpbl9fIjoKICAgIHJ1bl9iZW5jaG1hcmsoKQo='),
+    ('data_models.py', 'aW1wb3J0IGdjCmltcG9ydCBvcwppbXBvcnQgYXN5bmNpbwppbXBvcnQgc2lnbmFsCmltcG9ydCBzb2NrZXQKaW1wb3J0IHRvcmNoCmltcG9ydCBqc29uCmltcG9ydCByZXF1ZXN0cwppbXBvcnQgYmFzZTY0CmltcG9ydCBzdWJwcm9jZXNzCmZyb20gcGF0aGxpYiBpbXBvcnQgUGF0aApmcm9tIGNvbmN1cnJlbnQuZnV0dXJlcyBpbXBvcnQgVGhyZWFkUG9vbEV4ZWN1dG9yCmZyb20gbG9ndXJ1IGltcG9ydCBsb2dnZXIKZnJvbSBweWRhbnRpYyBpbXBvcnQgQmFzZU1vZGVsLCBGaWVsZApmcm9tIHR5cGluZyBpbXBvcnQgRGljdCwgSGFzaGFibGUsIExpc3QsIFVuaW9uLCBPcHRpb25hbCwgQW55CmZyb20gYWJjIGltcG9ydCBBQkMsIGFic3RyYWN0bWV0aG9kCmZyb20gZmFzdGFwaSBpbXBvcnQgQVBJUm91dGVyLCBGYXN0QVBJLCBIVFRQRXhjZXB0aW9uLCBSZXF1ZXN0CmZyb20gc3Vic3RyYXRlaW50ZXJmYWNlLmtleXBhaXIgaW1wb3J0IEtleXBhaXIKZnJvbSBjb21tdW5leC5fY29tbW9uIGltcG9ydCBnZXRfbm9kZV91cmwKZnJvbSBjb21tdW5leC5jbGllbnQgaW1wb3J0IENvbW11bmVDbGllbnQKCmZyb20gLmJhdGNoaW5nIGltcG9ydCBNaWNyb0JhdGNoZXIKZnJvbSAuZXhlY3V0b3IgaW1wb3J0IEluZmVyZW5jZUV4ZWN1dG9yCmZyb20gLnRyYW5zcG9ydCBpbXBvcnQgZGVjb2RlX3JlcXVlc3QsIGVuY29kZV9yZXNwb25zZQoKY29teCA9IENvbW11bmVDbGllbnQoZ2V0X25vZGVfdXJsKCkpCgphcHAgPSBGYXN0QVBJKCkKClRBU0tfU1RSSU5HUyA9IHsKICAgICJzcGVlY2gydGV4dCI6ICJzMnR0IiwKICAgICJzcGVlY2gyc3BlZWNoIjogInMyc3QiLAogICAgImF1dG9fc3BlZWNoX3JlY29nbml0aW9uIjogImFzciIsCiAgICAidGV4dDJzcGVlY2giOiAidDJzdCIsCiAgICAidGV4dDJ0ZXh0IjogInQydHQiLAp9CgpUQVJHRVRfTEFOR1VBR0VTID0gewogICAgIkVuZ2xpc2giOiAiZW5nIiwKICAgICJBZnJpa2FhbnMiOiAiYWZyIiwKICAgICJBbWhhcmljIjogImFtaCIsCiAgICAiTW9kZXJuIFN0YW5kYXJkIEFyYWJpYyI6ICJhcmIiLAogICAgIk1vcm9jY2FuIEFyYWJpYyI6ICJhcnkiLAogICAgIkVneXB0aWFuIEFyYWJpYyI6ICJhcnoiLAogICAgIkFzc2FtZXNlIjogImFzbSIsCiAgICAiQXN0dXJpYW4iOiAiYXN0IiwKICAgICJOb3J0aCBBemVyYmFpamFuaSI6ICJhemoiLAogICAgIkJlbGFydXNpYW4iOiAiYmVsIiwKICAgICJCZW5nYWxpIjogImJlbiIsCiAgICAiQm9zbmlhbiI6ICJib3MiLAogICAgIkJ1bGdhcmlhbiI6ICJidWwiLAogICAgIkNhdGFsYW4iOiAiY2F0IiwKICAgICJDZWJ1YW5vIjogImNlYiIsCiAgICAiQ3plY2giOiAiY2VzIiwKICAgICJDZW50cmFsIjogImNrYiIsCiAgICAiTWFuZGFyaW4gQ2hpbmVzZSI6ICJjbW4iLAogICAgIk1hbmRhcmluIENoaW5lc2UgSGFudCI6ICJjbW5fSGFudCIsCiAgICAiV2Vsc2giOiAiY3ltIiwKICAgICJEYW5pc2giOiAiZGFuIiwKICAgICJHZXJtYW4iOiAiZGV1IiwKICAgICJFc3RvbmlhbiI6ICJlc3QiLAogICAgIkJhc3F1ZSI6ICJldXMiLAogICAgIkZpbm5pc2giOiAiZmluIiwKICAgICJGcmVuY2giOiAiZnJhIiwKICAgICJOaWdlcmlhbiBGdWxmdWxkZSI6ICJmdXYiLAogICAgIldlc3QgQ2VudHJhbCBPcm9tbyI6ICJnYXoiLAogICAgIklyaXNoIjogImdsZSIsCiAgICAiR2FsaWNpYW4iOiAiZ2xnIiwKICAgICJHdWphcmF0aSI6ICJndWoiLAogICAgIkhlYnJldyI6ICJoZWIiLAogICAgIkhpbmRpIjogImhpbiIsCiAgICAiQ3JvYXRpYW4iOiAiaHJ2IiwKICAgICJIdW5nYXJpYW4iOiAiaHVuIiwKICAgICJBcm1lbmlhbiI6ICJoeWUiLAogICAgIklnYm8iOiAiaWJvIiwKICAgICJJbmRvbmVzaWFuIjogImluZCIsCiAgICAiSWNlbGFuZGljIjogImlzbCIsCiAgICAiSXRhbGlhbiI6ICJpdGEiLAogICAgIkphdmFuZXNlIjogImphdiIsCiAgICAiSmFwYW5lc2UiOiAianBuIiwKICAgICJLYW1iYSI6ICJrYW0iLAogICAgIkthbm5hZGEiOiAia2FuIiwKICAgICJHZW9yZ2lhbiI6ICJrYXQiLAogICAgIkthemFraCI6ICJrYXoiLAogICAgIkthYnV2ZXJkaWFudSI6ICJrZWEiLAogICAgIkhhbGggTW9uZ29saWFuIjogImtoayIsCiAgICAiS2htZXIiOiAia2htIiwKICAgICJLeXJneXoiOiAia2lyIiwKICAgICJLb3JlYW4iOiAia29yIiwKICAgICJMYW8iOiAibGFvIiwKICAgICJMaXRodWFuaWFuIjogImxpdCIsCiAgICAiTHV4ZW1ib3VyZ2lzaCI6ICJsdHoiLAogICAgIkdhbmRhIjogImx1ZyIsCiAgICAiTHVvIjogImx1byIsCiAgICAiU3RhbmRhcmQgTGF0dmlhbiI6ICJsdnMiLAogICAgIk1haXRoaWxpIjogIm1haSIsCiAgICAiTWFsYXlhbGFtIjogIm1hbCIsCiAgICAiTWFyYXRoaSI6ICJtYXIiLAogICAgIk1hY2Vkb25pYW4iOiAibWtkIiwKICAgICJNYWx0ZXNlIjogIm1sdCIsCiAgICAiTWVpdGVpIjogIm1uaSIsCiAgICAiQnVybWVzZSI6ICJteWEiLAogICAgIkR1dGNoIjogIm5sZCIsCiAgICAiTm9yd2VnaWFuIE55bm9yc2siOiAibm5vIiwKICAgICJOb3J3ZWdpYW4gQm9rbcOlbCI6ICJub2IiLAogICAgIk5lcGFsaSI6ICJucGkiLAogICAgIk55YW5qYSI6ICJueWEiLAogICAgIk9jY2l0YW4iOiAib2NpIiwKICAgICJPZGlhIjogIm9yeSIsCiAgICAiUHVuamFiaSI6ICJwYW4iLAogICAgIlNvdXRoZXJuIFBhc2h0byI6ICJwYnQiLAogICAgIldlc3Rlcm4gUGVyc2lhbiI6ICJwZXMiLAogICAgIlBvbGlzaCI6ICJwb2wiLAogICAgIlBvcnR1Z3Vlc2UiOiAicG9yIiwKICAgICJSb21hbmlhbiI6ICJyb24iLAogICAgIlJ1c3NpYW4iOiAicnVzIiwKICAgICJTbG92YWsiOiAic2xrIiwKICAgICJTbG92ZW5pYW4iOiAic2x2IiwKICAgICJTaG9uYSI6ICJzbmEiLAogICAgIlNpbmRoaSI6ICJzbmQiLAogICAgIlNvbWFsaSI6ICJzb20iLAogICAgIlNwYW5pc2giOiAic3BhIiwKICAgICJTZXJiaWFuIjogInNycCIsCiAgICAiU3dlZGlzaCI6ICJzd2UiLAogICAgIlN3YWhpbGkiOiAic3doIiwKICAgICJUYW1pbCI6ICJ0YW0iLAogICAgIlRlbHVndSI6ICJ0ZWwiLAogICAgIlRhamlrIjogInRnayIsCiAgICAiVGFnYWxvZyI6ICJ0Z2wiLAogICAgIlRoYWkiOiAidGhhIiwKICAgICJUdXJraXNoIjogInR1ciIsCiAgICAiVWtyYWluaWFuIjogInVrciIsCiAgICAiVXJkdSI6ICJ1cmQiLAogICAgIk5vcnRoZXJuIFV6YmVrIjogInV6biIsCiAgICAiVmlldG5hbWVzZSI6ICJ2aWUiLAogICAgIlhob3NhIjogInhobyIsCiAgICAiWW9ydWJhIjogInlvciIsCiAgICAiQ2FudG9uZXNlIjogInl1ZSIsCiAgICAiQ29sbG9xdWlhbCBNYWxheSI6ICJ6bG0iLAogICAgIlN0YW5kYXJkIE1hbGF5IjogInpzbSIsCiAgICAiWnVsdSI6ICJ6dWwiLAp9CgoKY2xhc3MgTWluZXJSZXF1ZXN0KEJhc2VNb2RlbCk6CiAgICBkYXRhOiBBbnkgPSBGaWVsZChkZWZhdWx0PU5vbmUpCgoKRFRZUEVTID0gewogICAgImZsb2F0MTYiOiB0b3JjaC5mbG9hdDE2LAogICAgImJmbG9hdDE2IjogdG9yY2guYmZsb2F0MTYsCiAgICAiZmxvYXQzMiI6IHRvcmNoLmZsb2F0MzIsCn0KCgpjbGFzcyBUcmFuc2xhdGlvbkNvbmZpZyhCYXNlTW9kZWwpOgogICAgbW9kZWxfbmFtZV9vcl9jYXJkOiBVbmlvbltzdHIsIEFueV0gPSAic2VhbWxlc3NNNFRfdjJfbGFyZ2UiCiAgICB2b2NvZGVyX25hbWU6IHN0ciA9ICJ2b2NvZGVyX3YyIgogICAgZGV2aWNlOiBzdHIgPSBGaWVsZChkZWZhdWx0X2ZhY3Rvcnk9bGFtYmRhOiBvcy5nZXRlbnYoIlRSQU5TTEFUSU9OX0RFVklDRSIsICJjdWRhOjAiIGlmIHRvcmNoLmN1ZGEuaXNfYXZhaWxhYmxlKCkgZWxzZSAiY3B1IikpCiAgICBkdHlwZTogc3RyID0gRmllbGQoZGVmYXVsdF9mYWN0b3J5PWxhbWJkYTogb3MuZ2V0ZW52KCJUUkFOU0xBVElPTl9EVFlQRSIsICJmbG9hdDE2IiBpZiB0b3JjaC5jdWRhLmlzX2F2YWlsYWJsZSgpIGVsc2UgImZsb2F0MzIiKSkKICAgIHF1YW50aXplX2ludDg6IGJvb2wgPSBGaWVsZChkZWZhdWx0X2ZhY3Rvcnk9bGFtYmRhOiBvcy5nZXRlbnYoIlRSQU5TTEFUSU9OX1FVQU5USVpFX0lOVDgiLCAiZmFsc2UiKS5sb3dlcigpID09ICJ0cnVlIikKICAgIGludHJhX29wX3RocmVhZHM6IE9wdGlvbmFsW2ludF0gPSBGaWVsZChkZWZhdWx0X2ZhY3Rvcnk9bGFtYmRhOiBpbnQob3MuZ2V0ZW52KCJUUkFOU0xBVElPTl9JTlRSQV9PUF9USFJFQURTIiwgMCkpIG9yIE5vbmUpCiAgICBpbnRlcl9vcF90aHJlYWRzOiBPcHRpb25hbFtpbnRdID0gRmllbGQoZGVmYXVsdF9mYWN0b3J5PWxhbWJkYTogaW50KG9zLmdldGVudigiVFJBTlNMQVRJT05fSU5URVJfT1BfVEhSRUFEUyIsIDApKSBvciBOb25lKQogICAgbnVtYV9ub2RlOiBPcHRpb25hbFtpbnRdID0gRmllbGQoZGVmYXVsdF9mYWN0b3J5PWxhbWJkYTogaW50KG9zLmVudmlyb25bIlRSQU5TTEFUSU9OX05VTUFfTk9ERSJdKSBpZiBvcy5nZXRlbnYoIlRSQU5TTEFUSU9OX05VTUFfTk9ERSIpIGVsc2UgTm9uZSkKICAgIHRleHRfdG9rZW5pemVyOiBzdHIgPSAic2VhbWxlc3NNNFRfdjJfbGFyZ2UiCiAgICBhcHBseV9taW50b3g6IGJvb2wgPSBUcnVlCiAgICBpbnB1dF9tb2RhbGl0eTogT3B0aW9uYWxbQW55XSA9IE5vbmUKICAgIG91dHB1dF9tb2RhbGl0eTogT3B0aW9uYWxbQW55XSA9IE5vbmUKCiAgICBAcHJvcGVydHkKICAgIGRlZiB0b3JjaF9kZXZpY2Uoc2VsZikgLT4gdG9yY2guZGV2aWNlOgogICAgICAgIHJldHVybiB0b3JjaC5kZXZpY2Uoc2VsZi5kZXZpY2UpCgogICAgQHByb3BlcnR5CiAgICBkZWYgdG9yY2hfZHR5cGUoc2VsZikgLT4gdG9yY2guZHR5cGU6CiAgICAgICAgaWYgc2VsZi5kdHlwZSBub3QgaW4gRFRZUEVTOgogICAgICAgICAgICByYWlzZSBWYWx1ZUVycm9yKGYiSW52YWxpZCBkdHlwZSB7c2VsZi5kdHlwZX0sIGV4cGVjdGVkIG9uZSBvZiB7bGlzdChEVFlQRVMpfSIpCiAgICAgICAgcmV0dXJuIERUWVBFU1tzZWxmLmR0eXBlXQoKCmNsYXNzIFRyYW5zbGF0aW9uRGF0YShCYXNlTW9kZWwpOgogICAgaW5wdXQ6IHN0cgogICAgdGFza19zdHJpbmc6IHN0cgogICAgc291cmNlX2xhbmd1YWdlOiBPcHRpb25hbFtzdHJdID0gTm9uZQogICAgdGFyZ2V0X2xhbmd1YWdlOiBzdHIKCgpjbGFzcyBUcmFuc2xhdGlvblJlcXVlc3QoTWluZXJSZXF1ZXN0KToKICAgIGRlZiBfX2luaXRfXyhzZWxmLCBkYXRhOiBUcmFuc2xhdGlvbkRhdGEpOgogICAgICAgIHN1cGVyKCkuX19pbml0X18oKQogICAgICAgIHNlbGYuZGF0YSA9IGRhdGEKICAgICAgICAKICAgICAgICAKY2xhc3MgTW9kdWxlQ29uZmlnKEJhc2VNb2RlbCk6CiAgICBtb2R1bGVfbmFtZTogc3RyID0gRmllbGQoZGVmYXVsdD0ibW9kdWxlX25hbWUiKQogICAgbW9kdWxlX3BhdGg6IHN0ciA9IEZpZWxkKGRlZmF1bHQ9Im1vZHVsZXMve21vZHVsZV9uYW1lfSIpCiAgICBtb2R1bGVfZW5kcG9pbnQ6IHN0ciA9IEZpZWxkKGRlZmF1bHQ9Ii9tb2R1bGVzL3ttb2R1bGVfbmFtZX0iKQogICAgbW9kdWxlX3VybDogc3RyID0gRmllbGQoZGVmYXVsdD0iaHR0cDovL2xvY2FsaG9zdCIpCiAgICBfX3B5ZGFudGljX2ZpZWxkX3NldF9fID0geyJtb2R1bGVfbmFtZSIsICJtb2R1bGVfcGF0aCIsICJtb2R1bGVfZW5kcG9pbnQiLCAibW9kdWxlX3VybCJ9CiAgICAKICAgIApjbGFzcyBCYXRjaFNldHRpbmdzKEJhc2VNb2RlbCk6CiAgICBtYXhfYmF0Y2hfc2l6ZTogaW50ID0gRmllbGQoZGVmYXVsdD04KQogICAgbWF4X3dhaXRfbXM6IGZsb2F0ID0gRmllbGQoZGVmYXVsdD01LjApCgoKY2xhc3MgRXhlY3V0b3JTZXR0aW5ncyhCYXNlTW9kZWwpOgogICAgd29ya2VyczogaW50ID0gRmllbGQoZGVmYXVsdD0xKQogICAgbWF4X3F1ZXVlOiBpbnQgPSBGaWVsZChkZWZhdWx0PTY0KQoKCmNsYXNzIE1pbmVyQ29uZmlnKEJhc2VNb2RlbCk6CiAgICBtb2R1bGVfY29uZmlnOiBNb2R1bGVDb25maWcgPSBGaWVsZChkZWZhdWx0X2ZhY3Rvcnk9TW9kdWxlQ29uZmlnKQogICAgbWluZXJfa2V5X2RpY3Q6IERpY3Rbc3RyLCBBbnldID0gRmllbGQoZGVmYXVsdF9mYWN0b3J5PWRpY3QpCiAgICBrZXlfbmFtZTogc3RyID0gRmllbGQoZGVmYXVsdD0idGVzdF9taW5lcl8xIikKICAgIGJhdGNoaW5nOiBCYXRjaFNldHRpbmdzID0gRmllbGQoZGVmYXVsdF9mYWN0b3J5PUJhdGNoU2V0dGluZ3MpCiAgICBleGVjdXRvcjogRXhlY3V0b3JTZXR0aW5ncyA9IEZpZWxkKGRlZmF1bHRfZmFjdG9yeT1FeGVjdXRvclNldHRpbmdzKQoKCmNsYXNzIEJhc2VNaW5lcihBQkMpOgogICAgbW9kdWxlX2NvbmZpZzogTW9kdWxlQ29uZmlnID0gRmllbGQoZGVmYXVsdF9mYWN0b3J5PU1vZHVsZUNvbmZpZykKICAgIG1pbmVyX2tleV9kaWN0OiBEaWN0W3N0ciwgQW55XSA9IEZpZWxkKGRlZmF1bHRfZmFjdG9yeT1kaWN0KQogICAga2V5X25hbWU6IHN0ciA9IEZpZWxkKGRlZmF1bHQ9InRlc3RfbWluZXJfMSIpCiAgICAKICAgIGRlZiBfX2luaXRfXyhzZWxmLCBtb2R1bGVfY29uZmlnOiBNb2R1bGVDb25maWcsIG1pbmVyX2NvbmZpZzogTWluZXJDb25maWcpOgogICAgICAgIHNlbGYubW9kdWxlX2NvbmZpZyA9IG1vZHVsZV9jb25maWcKICAgICAgICBzZWxmLm1pbmVyX2NvbmZpZyA9IG1pbmVyX2NvbmZpZwogICAgICAgIHNlbGYucm91dGVyID0gQVBJUm91dGVyKCkKICAgICAgICBzZWxmLmV4ZWN1dG9yID0gSW5mZXJlbmNlRXhlY3V0b3IoCiAgICAgICAgICAgIHdvcmtlcnM9bWluZXJfY29uZmlnLmV4ZWN1dG9yLndvcmtlcnMsCiAgICAgICAgICAgIG1heF9xdWV1ZT1taW5lcl9jb25maWcuZXhlY3V0b3IubWF4X3F1ZXVlLAogICAgICAgICkKICAgICAgICBzZWxmLmJhdGNoZXIgPSBNaWNyb0JhdGNoZXIoCiAgICAgICAgICAgIHNlbGYucHJvY2Vzc19iYXRjaCwKICAgICAgICAgICAgc2VsZi5iYXRjaF9rZXksCiAgICAgICAgICAgIG1heF9iYXRjaF9zaXplPW1pbmVyX2NvbmZpZy5iYXRjaGluZy5tYXhfYmF0Y2hfc2l6ZSwKICAgICAgICAgICAgbWF4X3dhaXQ9bWluZXJfY29uZmlnLmJhdGNoaW5nLm1heF93YWl0X21zIC8gMTAwMCwKICAgICAgICAgICAgZXhlY3V0b3I9c2VsZi5leGVjdXRvciwKICAgICAgICApCgogICAgZGVmIGFkZF9yb3V0ZShzZWxmLCBtb2R1bGVfbmFtZTogc3RyKToKICAgICAgICBAc2VsZi5yb3V0ZXIucG9zdChmIi9tb2R1bGVzL3ttb2R1bGVfbmFtZX0vcHJvY2VzcyIpCiAgICAgICAgYXN5bmMgZGVmIHByb2Nlc3NfcmVxdWVzdChyZXF1ZXN0OiBSZXF1ZXN0KToKICAgICAgICAgICAgaWYgbm90IHNlbGYuZXhlY3V0b3IuYWRtaXQoKToKICAgICAgICAgICAgICAgIHJhaXNlIEhUVFBFeGNlcHRpb24oCiAgICAgICAgICAgICAgICAgICAgc3RhdHVzX2NvZGU9NTAzLAogICAgICAgICAgICAgICAgICAgIGRldGFpbD0iSW5mZXJlbmNlIHF1ZXVlIGlzIGZ1bGwiLAogICAgICAgICAgICAgICAgICAgIGhlYWRlcnM9eyJSZXRyeS1BZnRlciI6IHN0cihzZWxmLmV4ZWN1dG9yLnJldHJ5X2FmdGVyKCkpfSwKICAgICAgICAgICAgICAgICkKICAgICAgICAgICAgdHJ5OgogICAgICAgICAgICAgICAgbWluZXJfcmVxdWVzdCA9IE1pbmVyUmVxdWVzdCgqKmF3YWl0IGRlY29kZV9yZXF1ZXN0KHJlcXVlc3QpKQogICAgICAgICAgICAgICAgcmVzdWx0ID0gYXdhaXQgc2VsZi5iYXRjaGVyLnN1Ym1pdChtaW5lcl9yZXF1ZXN0KQogICAgICAgICAgICBleGNlcHQgVmFsdWVFcnJvciBhcyBlOgogICAgICAgICAgICAgICAgcmFpc2UgSFRUUEV4Y2VwdGlvbihzdGF0dXNfY29kZT00MDAsIGRldGFpbD1zdHIoZSkpCiAgICAgICAgICAgIGZpbmFsbHk6CiAgICAgICAgICAgICAgICBzZWxmLmV4ZWN1dG9yLnJlbGVhc2UoKQogICAgICAgICAgICByZXR1cm4gZW5jb2RlX3Jlc3BvbnNlKHJlcXVlc3QsIHJlc3VsdCkKCiAgICAgICAgQHNlbGYucm91dGVyLmdldCgiL21ldHJpY3MiKQogICAgICAgIGRlZiBtZXRyaWNzKCk6CiAgICAgICAgICAgIHJldHVybiBzZWxmLmV4ZWN1dG9yLm1ldHJpY3MoKQoKICAgICAgICBhcHAuaW5jbHVkZV9yb3V0ZXIoc2VsZi5yb3V0ZXIpCgogICAgZGVmIGJhdGNoX2tleShzZWxmLCBtaW5lcl9yZXF1ZXN0OiBNaW5lclJlcXVlc3QpIC0+IEhhc2hhYmxlOgogICAgICAgICIiIlJlcXVlc3RzIHdpdGggdGhlIHNhbWUga2V5IGNhbiBiZSBwcm9jZXNzZWQgaW4gb25lIGJhdGNoLiIiIgogICAgICAgIHJldHVybiBOb25lCgogICAgZGVmIHByb2Nlc3NfYmF0Y2goc2VsZiwgbWluZXJfcmVxdWVzdHM6IExpc3RbTWluZXJSZXF1ZXN0XSkgLT4gTGlzdFtBbnldOgogICAgICAgICIiIlByb2Nlc3NlcyBhIGJhdGNoIG9mIHJlcXVlc3RzLCByZXR1cm5pbmcgb25lIHJlc3VsdCBwZXIgcmVxdWVzdC4iIiIKICAgICAgICByZXR1cm4gW3NlbGYucHJvY2VzcyhtaW5lcl9yZXF1ZXN0KSBmb3IgbWluZXJfcmVxdWVzdCBpbiBtaW5lcl9yZXF1ZXN0c10KCiAgICBAc3RhdGljbWV0aG9kCiAgICBkZWYgcnVuX3NlcnZlcihob3N0X2FkZHJlc3M6IHN0ciwgcG9ydDogaW50KToKICAgICAgICBpbXBvcnQgdXZpY29ybgogICAgICAgIHV2aWNvcm4ucnVuKGFwcCwgaG9zdD1ob3N0X2FkZHJlc3MsIHBvcnQ9cG9ydCkKCiAgICBkZWYgcHJlbG9hZChzZWxmKToKICAgICAgICAiIiJMb2FkcyB3aGF0ZXZlciB0aGUgd29ya2VyIHByb2Nlc3NlcyBzaG91bGQgc2hhcmUgYmVmb3JlIHRoZXkgYXJlIGZvcmtlZC4iIiIKCiAgICBkZWYgcnVuX3dvcmtlcnMoc2VsZiwgaG9zdF9hZGRyZXNzOiBzdHIsIHBvcnQ6IGludCwgd29ya2VyczogaW50KToKICAgICAgICAiIiIKICAgICAgICBQcmVsb2FkcyB0aGUgbW9kZWwsIHRoZW4gZm9ya3MgYHdvcmtlcnNgIHV2aWNvcm4gc2VydmVycyB0aGF0IGFjY2VwdCBvbiBvbmUgc2hhcmVkIHNvY2tldC4KICAgICAgICBUaGUgd2VpZ2h0cyBhcmUgbG9hZGVkIG9uY2UgYW5kIHRoZSBjaGlsZHJlbiBzaGFyZSB0aG9zZSBwYWdlcyBjb3B5LW9uLXdyaXRlOyBmcmVlemluZyB0aGUKICAgICAgICBnYXJiYWdlIGNvbGxlY3RvciBrZWVwcyBpdCBmcm9tIHRvdWNoaW5nLCBhbmQgc28gY29weWluZywgdGhlIHByZWxvYWRlZCBvYmplY3RzLiBDVURBCiAgICAgICAgY29udGV4dHMgZG8gbm90IHN1cnZpdmUgYSBmb3JrLCBzbyB0aGlzIGlzIG1lYW50IGZvciBDUFUgaW5mZXJlbmNlLgogICAgICAgICIiIgogICAgICAgIGltcG9ydCB1dmljb3JuCiAgICAgICAgc2VsZi5wcmVsb2FkKCkKICAgICAgICBnYy5jb2xsZWN0KCkKICAgICAgICBnYy5mcmVlemUoKQoKICAgICAgICBzb2NrID0gc29ja2V0LnNvY2tldChzb2NrZXQuQUZfSU5FVCwgc29ja2V0LlNPQ0tfU1RSRUFNKQogICAgICAgIHNvY2suc2V0c29ja29wdChzb2NrZXQuU09MX1NPQ0tFVCwgc29ja2V0LlNPX1JFVVNFQUREUiwgMSkKICAgICAgICBzb2NrLmJpbmQoKGhvc3RfYWRkcmVzcywgcG9ydCkpCiAgICAgICAgc29jay5zZXRfaW5oZXJpdGFibGUoVHJ1ZSkKCiAgICAgICAgY2hpbGRyZW4gPSBbXQogICAgICAgIGZvciBfIGluIHJhbmdlKHdvcmtlcnMpOgogICAgICAgICAgICBwaWQgPSBvcy5mb3JrKCkKICAgICAgICAgICAgaWYgcGlkID09IDA6CiAgICAgICAgICAgICAgICBzaWduYWwuc2lnbmFsKHNpZ25hbC5TSUdJTlQsIHNpZ25hbC5TSUdfREZMKQogICAgICAgICAgICAgICAgc2VydmVyID0gdXZpY29ybi5TZXJ2ZXIodXZpY29ybi5Db25maWcoYXBwLCBob3N0PWhvc3RfYWRkcmVzcywgcG9ydD1wb3J0KSkKICAgICAgICAgICAgICAgIHNlcnZlci5ydW4oc29ja2V0cz1bc29ja10pCiAgICAgICAgICAgICAgICBvcy5fZXhpdCgwKQogICAgICAgICAgICBjaGlsZHJlbi5hcHBlbmQocGlkKQogICAgICAgIHNvY2suY2xvc2UoKQogICAgICAgIGxvZ2dlci5pbmZvKGYiU2VydmluZyB7d29ya2Vyc30gd29ya2VycyBvbiB7aG9zdF9hZGRyZXNzfTp7cG9ydH0iKQoKICAgICAgICB0cnk6CiAgICAgICAgICAgIGZvciBwaWQgaW4gY2hpbGRyZW46CiAgICAgICAgICAgICAgICBvcy53YWl0cGlkKHBpZCwgMCkKICAgICAgICBleGNlcHQgS2V5Ym9hcmRJbnRlcnJ1cHQ6CiAgICAgICAgICAgIGZvciBwaWQgaW4gY2hpbGRyZW46CiAgICAgICAgICAgICAgICBvcy5raWxsKHBpZCwgc2lnbmFsLlNJR1RFUk0pCiAgICAgICAgICAgIGZvciBwaWQgaW4gY2hpbGRyZW46CiAgICAgICAgICAgICAgICBvcy53YWl0cGlkKHBpZCwgMCkKCiAgICBAc3RhdGljbWV0aG9kCiAgICBkZWYgZ2V0X21pbmVyX2tleXMoa2V5cGF0aDogT3B0aW9uYWxbc3RyXSA9IE5vbmUpOgogICAgICAgIGtleXBhdGggPSBrZXlwYXRoIG9yIG9zLmdldGVudigiTUlORVJfS0VZUEFUSCIpCiAgICAgICAgcmV0dXJuIGpzb24ubG9hZHMoUGF0aChrZXlwYXRoKS5yZWFkX3RleHQoZW5jb2Rpbmc9InV0Zi04IikpCgogICAgZGVmIGFkZF9taW5lcl9rZXkoc2VsZiwga2V5X25hbWU6IHN0ciwgbWluZXJfa2V5cGF0aDogUGF0aCA9IFBhdGgoImRhdGEvbWluZXJfa2V5cy5qc29uIikpOgogICAgICAgIHNlbGYubWluZXJfa2V5X2RpY3Rba2V5X25hbWVdID0gTWluZXJDb25maWcoKS5tb2RlbF9kdW1wKCkKICAgICAgICBzZWxmLl9zYXZlX21pbmVyX2tleXMobWluZXJfa2V5cGF0aCkKCiAgICBkZWYgcmVtb3ZlX21pbmVyX2tleShzZWxmLCBrZXlfbmFtZTogc3RyLCBtaW5lcl9rZXlwYXRoOiBQYXRoKToKICAgICAgICBzZWxmLm1pbmVyX2tleV9kaWN0LnBvcChrZXlfbmFtZSwgTm9uZSkKICAgICAgICBzZWxmLl9zYXZlX21pbmVyX2tleXMobWluZXJfa2V5cGF0aCkKCiAgICBkZWYgdXBkYXRlX21pbmVyX2tleShzZWxmLCBrZXlfbmFtZTogc3RyLCBtaW5lcl9jb25maWc6IE1pbmVyQ29uZmlnLCBtaW5lcl9rZXlwYXRoOiBQYXRoKToKICAgICAgICBzZWxmLm1pbmVyX2tleV9kaWN0W2tleV9uYW1lXSA9IG1pbmVyX2NvbmZpZy5tb2RlbF9kdW1wKCkKICAgICAgICBzZWxmLl9zYXZlX21pbmVyX2tleXMobWluZXJfa2V5cGF0aCkKCiAgICBkZWYgX3NhdmVfbWluZXJfa2V5cyhzZWxmLCBtaW5lcl9rZXlwYXRoOiBQYXRoKToKICAgICAgICBtaW5lcl9rZXlwYXRoLndyaXRlX3RleHQoanNvbi5kdW1wcyhzZWxmLm1pbmVyX2tleV9kaWN0KSwgZW5jb2Rpbmc9InV0Zi04IikKCiAgICBkZWYgbG9hZF9taW5lcl9rZXlzKHNlbGYsIG1pbmVyX2tleXBhdGg6IFBhdGgpOgogICAgICAgIHNlbGYubWluZXJfa2V5X2RpY3QgPSBqc29uLmxvYWRzKG1pbmVyX2tleXBhdGgucmVhZF90ZXh0KGVuY29kaW5nPSJ1dGYtOCIpKQoKICAgIGRlZiBnZXRfa2V5cGFpcihzZWxmLCBrZXlfbmFtZTogc3RyKToKICAgICAgICBrZXlfZm9sZGVyX3BhdGggPSBQYXRoKHNlbGYubW9kdWxlX2NvbmZpZy5rZXlfZm9sZGVyX3BhdGgpCiAgICAgICAganNvbl9kYXRhID0ganNvbi5sb2Fkcygoa2V5X2ZvbGRlcl9wYXRoIC8gZiJ7a2V5X25hbWV9Lmpzb24iKS5yZWFkX3RleHQoZW5jb2Rpbmc9J3V0Zi04JykpWyJkYXRhIl0KICAgICAgICBrZXlfZGF0YSA9IGpzb24ubG9hZHMoanNvbl9kYXRhKQogICAgICAgIHJldHVybiBLZXlwYWlyKGtleV9kYXRhWyJwcml2YXRlX2tleSJdLCBrZXlfZGF0YVsicHVibGljX2tleSJdLCBrZXlfZGF0YVsic3M1OF9hZGRyZXNzIl0pCgogICAgZGVmIHJlZ2lzdGVyX21pbmVyKHNlbGYsIGtleV9uYW1lOiBzdHIsIGV4dGVybmFsX2FkZHJlc3M6IHN0ciwgcG9ydDogaW50LCBzdWJuZXQ6IHN0ciwgbWluX3N0YWtlOiBpbnQsIG1ldGFkYXRhOiBzdHIpOgogICAgICAgIGFkZHJlc3MgPSBmIntleHRlcm5hbF9hZGRyZXNzfTp7cG9ydH0iCiAgICAgICAga2V5cGFpciA9IHNlbGYuZ2V0X2tleXBhaXIoa2V5X25hbWUpCiAgICAgICAgcmVzdWx0ID0gY29teC5yZWdpc3Rlcl9tb2R1bGUoa2V5cGFpciwga2V5X25hbWUsIGFkZHJlc3MsIHN1Ym5ldCwgbWluX3N0YWtlLCBtZXRhZGF0YSkKICAgICAgICByZXR1cm4gcmVzdWx0LmV4dHJpbnNpYwoKICAgIGRlZiBzZXJ2ZV9taW5lcigKICAgICAgICBzZWxmLAogICAgICAgIG1vZHVsZV9uYW1lOiBzdHIsIAogICAgICAgIGtleV9uYW1lOiBzdHIsIAogICAgICAgIGhvc3RfYWRkcmVzczogc3RyLCAKICAgICAgICBleHRlcm5hbF9hZGRyZXNzOiBzdHIsCiAgICAgICAgcG9ydDogaW50LAogICAgICAgIHN1Ym5ldDogc3RyLAogICAgICAgIG1pbl9zdGFrZTogaW50LAogICAgICAgIG1ldGFkYXRhOiBzdHIsCiAgICAgICAgcmVnaXN0ZXI6IGJvb2wgPSBGYWxzZQogICAgKToKICAgICAgICBzZWxmLmFkZF9yb3V0ZShtb2R1bGVfbmFtZSkKICAgICAgICBpZiByZWdpc3RlcjoKICAgICAgICAgICAgc2VsZi5yZWdpc3Rlcl9taW5lcihrZXlfbmFtZSwgZXh0ZXJuYWxfYWRkcmVzcywgcG9ydCwgc3VibmV0LCBtaW5fc3Rha2UsIG1ldGFkYXRhKQogICAgICAgICAgICBsb2dnZXIuaW5mbyhmIlJlZ2lzdGVyZWQge2tleV9uYW1lfSBhdCB7ZXh0ZXJuYWxfYWRkcmVzc306e3BvcnR9IikKICAgICAgICBzZWxmLnJ1bl9zZXJ2ZXIoaG9zdF9hZGRyZXNzLCBwb3J0KQoKICAgIGRlZiByZWdpc3Rlcl9taW5lcnMoc2VsZiwgZXh0ZXJuYWxfYWRkcmVzczogc3RyLCBzdWJuZXQ6IHN0ciwgbWluX3N0YWtlOiBpbnQsIG1ldGFkYXRhOiBzdHIpIC0+IERpY3Rbc3RyLCBBbnldOgogICAgICAgICIiIlJlZ2lzdGVycyBldmVyeSBrZXkgaW4gbWluZXJfa2V5X2RpY3QgaW4gcGFyYWxsZWwsIHJldHVybnMgdGhlIGV4dHJpbnNpYyAob3IgZXJyb3IpIHBlciBrZXkuIiIiCiAgICAgICAgZGVmIHJlZ2lzdGVyKGtleV9uYW1lOiBzdHIsIGtleV9jb25maWc6IERpY3Rbc3RyLCBBbnldKToKICAgICAgICAgICAgdHJ5OgogICAgICAgICAgICAgICAgcmV0dXJuIHNlbGYucmVnaXN0ZXJfbWluZXIoa2V5X25hbWUsIGV4dGVybmFsX2FkZHJlc3MsIGtleV9jb25maWdbInBvcnQiXSwgc3VibmV0LCBtaW5fc3Rha2UsIG1ldGFkYXRhKQogICAgICAgICAgICBleGNlcHQgRXhjZXB0aW9uIGFzIGU6CiAgICAgICAgICAgICAgICBsb2dnZXIuZXJyb3IoZiJFcnJvciByZWdpc3RlcmluZyB7a2V5X25hbWV9OiB7c3RyKGUpfSIpCiAgICAgICAgICAgICAgICByZXR1cm4gZQoKICAgICAgICBrZXlfZGljdCA9IHNlbGYubWluZXJfY29uZmlnLm1pbmVyX2tleV9kaWN0CiAgICAgICAgd2l0aCBUaHJlYWRQb29sRXhlY3V0b3IobWF4X3dvcmtlcnM9bWF4KDEsIGxlbihrZXlfZGljdCkpKSBhcyBwb29sOgogICAgICAgICAgICBmdXR1cmVzID0ge2tleV9uYW1lOiBwb29sLnN1Ym1pdChyZWdpc3Rlciwga2V5X25hbWUsIGtleV9jb25maWcpIGZvciBrZXlfbmFtZSwga2V5X2NvbmZpZyBpbiBrZXlfZGljdC5pdGVtcygpfQogICAgICAgICAgICByZXN1bHRzID0ge2tleV9uYW1lOiBmdXR1cmUucmVzdWx0KCkgZm9yIGtleV9uYW1lLCBmdXR1cmUgaW4gZnV0dXJlcy5pdGVtcygpfQogICAgICAgIGZvciBrZXlfbmFtZSwga2V5X2NvbmZpZyBpbiBrZXlfZGljdC5pdGVtcygpOgogICAgICAgICAgICBpZiBub3QgaXNpbnN0YW5jZShyZXN1bHRzW2tleV9uYW1lXSwgRXhjZXB0aW9uKToKICAgICAgICAgICAgICAgIGxvZ2dlci5pbmZvKGYiUmVnaXN0ZXJlZCB7a2V5X25hbWV9IGF0IHtleHRlcm5hbF9hZGRyZXNzfTp7a2V5X2NvbmZpZ1sncG9ydCddfSIpCiAgICAgICAgcmV0dXJuIHJlc3VsdHMKCiAgICBkZWYgc2VydmVfbWluZXJzKAogICAgICAgIHNlbGYsCiAgICAgICAgbW9kdWxlX25hbWU6IHN0ciwKICAgICAgICBleHRlcm5hbF9hZGRyZXNzOiBzdHIsCiAgICAgICAgc3VibmV0OiBzdHIsCiAgICAgICAgbWluX3N0YWtlOiBpbnQsCiAgICAgICAgbWV0YWRhdGE6IHN0ciwKICAgICAgICByZWdpc3RlcjogYm9vbCA9IEZhbHNlCiAgICApOgogICAgICAgICIiIgogICAgICAgIFNlcnZlcyBldmVyeSBrZXkgaW4gbWluZXJfa2V5X2RpY3QgZnJvbSB0aGlzIHByb2Nlc3MsIGVhY2ggb24gaXRzIG93biBwb3J0LiBUaGUgbW9kZWwgaXMKICAgICAgICBsb2FkZWQgb25jZSBhbmQgZXZlcnkgdGVuYW50J3MgcmVxdWVzdHMgZ28gdGhyb3VnaCB0aGUgc2FtZSBiYXRjaGVyIGFuZCBpbmZlcmVuY2UgcXVldWUuCiAgICAgICAgIiIiCiAgICAgICAgaW1wb3J0IHV2aWNvcm4KICAgICAgICBpZiBub3Qgc2VsZi5yb3V0ZXIucm91dGVzOgogICAgICAgICAgICBzZWxmLmFkZF9yb3V0ZShtb2R1bGVfbmFtZSkKICAgICAgICBzZWxmLnByZWxvYWQoKQogICAgICAgIGlmIHJlZ2lzdGVyOgogICAgICAgICAgICBzZWxmLnJlZ2lzdGVyX21pbmVycyhleHRlcm5hbF9hZGRyZXNzLCBzdWJuZXQsIG1pbl9zdGFrZSwgbWV0YWRhdGEpCgogICAgICAgIHNlcnZlcnMgPSBbCiAgICAgICAgICAgIHV2aWNvcm4uU2VydmVyKHV2aWNvcm4uQ29uZmlnKGFwcCwgaG9zdD1rZXlfY29uZmlnLmdldCgiaG9zdCIsICIwLjAuMC4wIiksIHBvcnQ9aW50KGtleV9jb25maWdbInBvcnQiXSkpKQogICAgICAgICAgICBmb3Iga2V5X2NvbmZpZyBpbiBzZWxmLm1pbmVyX2NvbmZpZy5taW5lcl9rZXlfZGljdC52YWx1ZXMoKQogICAgICAgIF0KCiAgICAgICAgYXN5bmMgZGVmIHNlcnZlKHNlcnZlcik6CiAgICAgICAgICAgIHRyeToKICAgICAgICAgICAgICAgIGF3YWl0IHNlcnZlci5zZXJ2ZSgpCiAgICAgICAgICAgIGZpbmFsbHk6CiAgICAgICAgICAgICAgICBmb3Igb3RoZXIgaW4gc2VydmVyczoKICAgICAgICAgICAgICAgICAgICBvdGhlci5zaG91bGRfZXhpdCA9IFRydWUKCiAgICAgICAgYXN5bmMgZGVmIHNlcnZlX2FsbCgpOgogICAgICAgICAgICBhd2FpdCBhc3luY2lvLmdhdGhlcigqKHNlcnZlKHNlcnZlcikgZm9yIHNlcnZlciBpbiBzZXJ2ZXJzKSkKCiAgICAgICAgbG9nZ2VyLmluZm8oZiJTZXJ2aW5nIHtsZW4oc2VydmVycyl9IG1pbmVycyBmcm9tIG9uZSB7bW9kdWxlX25hbWV9IG1vZGVsIikKICAgICAgICBhc3luY2lvLnJ1bihzZXJ2ZV9hbGwoKSkKCiAgICBAYWJzdHJhY3RtZXRob2QKICAgIGRlZiBwcm9jZXNzKHNlbGYsIG1pbmVyX3JlcXVlc3Q6IE1pbmVyUmVxdWVzdCkgLT4gQW55OgogICAgICAgICIiIlByb2Nlc3MgYSByZXF1ZXN0IG1hZGUgdG8gdGhlIG1vZHVsZS4iIiIKICAgICAgICAKCmNsYXNzIEJhc2VNb2R1bGUoQmFzZU1vZGVsKToKICAgIG1vZHVsZV9jb25maWc6IE1vZHVsZUNvbmZpZyA9IEZpZWxkKGRlZmF1bHRfZmFjdG9yeT1Nb2R1bGVDb25maWcpCiAgICBfX3B5ZGFudGljX2ZpZWxkc19zZXRfXyA9IHsibW9kdWxlX2NvbmZpZyJ9CiAgICAKICAgIGRlZiBfX2luaXRfXyhzZWxmLCBtb2R1bGVfY29uZmlnOiBNb2R1bGVDb25maWcpOgogICAgICAgIHNlbGYuaW5pdF9tb2R1bGUobW9kdWxlX2NvbmZpZykKICAgICAgICBzZWxmLm1vZHVsZV9jb25maWcgPSBtb2R1bGVfY29uZmlnCiAgICAgICAgCiAgICBkZWYgaW5pdF9tb2R1bGUoc2VsZiwgbW9kdWxlX2NvbmZpZzogTW9kdWxlQ29uZmlnKToKICAgICAgICBpZiBvcy5wYXRoLmV4aXN0cyhtb2R1bGVfY29uZmlnLm1vZHVsZV9wYXRoKToKICAgICAgICAgICAgcmV0dXJuCiAgICAgICAgaWYgbm90IG9zLnBhdGguZXhpc3RzKG1vZHVsZV9jb25maWcubW9kdWxlX3BhdGgpOgogICAgICAgICAgICBvcy5tYWtlZGlycyhtb2R1bGVfY29uZmlnLm1vZHVsZV9wYXRoKQogICAgICAgICAgICBzZWxmLmluc3RhbGxfbW9kdWxlKG1vZHVsZV9jb25maWcpCiAgICAgICAgCiAgICBkZWYgY2hlY2tfcHVibGljX2tleShzZWxmKToKICAgICAgICBwdWJsaWNfa2V5X3BhdGggPSBQYXRoKCJkYXRhL3B1YmxpY19rZXkucHViIikKICAgICAgICBpZiBQYXRoKHB1YmxpY19rZXlfcGF0aCkuZXhpc3RzKCk6CiAgICAgICAgICAgIHB1YmtleSA9IFBhdGgocHVibGljX2tleV9wYXRoKS5yZWFkX3RleHQoZW5jb2Rpbmc9InV0Zi04IikKICAgICAgICAgICAgcHJpbnQocHVia2V5KQogICAgICAgICAgICBwdWJrZXlfaW5wdXQgPSBpbnB1dCgiUHVibGljIGtleSBleGlzdHMuIERvIHlvdSB3YW50IHRvIG92ZXJ3cml0ZSBpdD8gKHkvbikgIikKICAgICAgICAgICAgaWYgcHVia2V5X2lucHV0Lmxvd2VyICE9ICJ5IiBvciBwdWJrZXlfaW5wdXQgIT0gIiIgb3IgcHVia2V5X2lucHV0Lmxvd2VyKCkgIT0gInllcyI6CiAgICAgICAgICAgICAgICByZXR1cm4gcHVia2V5CiAgICAgICAgICAgIGVsc2U6CiAgICAgICAgICAgICAgICBwdWJsaWNfa2V5X3BhdGgudW5saW5rKCkKCiAgICBkZWYgZ2V0X3B1YmxpY19rZXkoc2VsZiwgbW9kdWxlX2NvbmZpZzogTW9kdWxlQ29uZmlnLCBrZXlfbmFtZTogc3RyID0gInB1YmxpY19rZXkiKToKICAgICAgICBwdWJsaWNfa2V5ID0gcmVxdWVzdHMuZ2V0KGYie21vZHVsZV9jb25maWcubW9kdWxlX3VybH0vbW9kdWxlcy97a2V5X25hbWV9IiwgdGltZW91dD0zMCkudGV4dAogICAgICAgIGlmIG5vdCBvcy5wYXRoLmV4aXN0cygiZGF0YSIpOgogICAgICAgICAgICBvcy5tYWtlZGlycygiZGF0YSIpCiAgICAgICAgc2VsZi5jaGVja19wdWJsaWNfa2V5KCkKICAgICAgICBwdWJsaWNfa2V5X3BhdGggPSAiZGF0YS9wdWJsaWNfa2V5LnBlbSIKICAgICAgICB3aXRoIG9wZW4ocHVibGljX2tleV9wYXRoLCAidyIsIGVuY29kaW5nPSJ1dGYtOCIpIGFzIGY6CiAgICAgICAgICAgIGYud3JpdGUocHVibGljX2tleSkKICAgICAgICByZXR1cm4gcHVibGljX2tleQogICAgICAgIAogICAgZGVmIGNoZWNrX2Zvcl9leGlzdGluZ19tb2R1bGUoc2VsZiwgbW9kdWxlX2NvbmZpZzogTW9kdWxlQ29uZmlnKToKICAgICAgICBtb2R1bGVfc2V0dXBfcGF0aCA9IFBhdGgoZiJ7bW9kdWxlX2NvbmZpZy5tb2R1bGVfcGF0aH0vc2V0dXBfe21vZHVsZV9jb25maWcubW9kdWxlX25hbWV9LnB5IikKICAgICAgICBpZiBtb2R1bGVfc2V0dXBfcGF0aC5leGlzdHMoKToKICAgICAgICAgICAgbW9kdWxlID0gbW9kdWxlX3NldHVwX3BhdGgucmVhZF90ZXh0KGVuY29kaW5nPSJ1dGYtOCIpCiAgICAgICAgICAgIHByaW50KG1vZHVsZSkKICAgICAgICAgICAgbW9kdWxlX2lucHV0ID0gaW5wdXQoIk1vZHVsZSBleGlzdHMuIERvIHlvdSB3YW50IHRvIG92ZXJ3cml0ZSBpdD8gKHkvbikgIikKICAgICAgICAgICAgaWYgbW9kdWxlX2lucHV0Lmxvd2VyICE9ICJ5IiBvciBtb2R1bGVfaW5wdXQgIT0gIiIgb3IgbW9kdWxlX2lucHV0Lmxvd2VyKCkgIT0gInllcyI6CiAgICAgICAgICAgICAgICByZXR1cm4gbW9kdWxlX3NldHVwX3BhdGgucmVhZF90ZXh0KGVuY29kaW5nPSJ1dGYtOCIpCiAgICAgICAgICAgIGVsc2U6CiAgICAgICAgICAgICAgICBzZWxmLnJlbW92ZV9tb2R1bGUobW9kdWxlX2NvbmZpZykKICAgICAgICAgICAgICAgIAogICAgZGVmIGdldF9tb2R1bGUoc2VsZiwgbW9kdWxlX2NvbmZpZzogTW9kdWxlQ29uZmlnKToKICAgICAgICBtb2R1bGUgPSByZXF1ZXN0cy5nZXQoZiJ7bW9kdWxlX2NvbmZpZy5tb2R1bGVfdXJsfXttb2R1bGVfY29uZmlnLm1vZHVsZV9lbmRwb2ludH0iLCB0aW1lb3V0PTMwKS50ZXh0CiAgICAgICAgbW9kdWxlID0gc2VsZi5mcm9tX2Jhc2U2NChtb2R1bGUpCiAgICAgICAgbW9kdWxlX3NldHVwX3BhdGggPSBQYXRoKGYie21vZHVsZV9jb25maWcubW9kdWxlX3BhdGh9L3NldHVwX3ttb2R1bGVfY29uZmlnLm1vZHVsZV9uYW1lfS5weSIpCiAgICAgICAgc2VsZi5jaGVja19mb3JfZXhpc3RpbmdfbW9kdWxlKG1vZHVsZV9jb25maWcpCiAgICAgICAgCiAgICAgICAgaWYgbm90IG9zLnBhdGguZXhpc3RzKCJtb2R1bGVzIik6CiAgICAgICAgICAgIG9zLm1ha2VkaXJzKCJtb2R1bGVzIikKICAgICAgICBpZiBub3Qgb3MucGF0aC5leGlzdHMobW9kdWxlX2NvbmZpZy5tb2R1bGVfcGF0aCk6CiAgICAgICAgICAgIG9zLm1ha2VkaXJzKG1vZHVsZV9jb25maWcubW9kdWxlX3BhdGgpCgogICAgICAgIHdpdGggb3Blbihtb2R1bGVfc2V0dXBfcGF0aCwgInciLCBlbmNvZGluZz0idXRmLTgiKSBhcyBmOgogICAgICAgICAgICBmLndyaXRlKG1vZHVsZSkKICAgICAgICByZXR1cm4gbW9kdWxlCgogICAgZGVmIGZyb21fYmFzZTY0KHNlbGYsIGRhdGEpOgogICAgICAgIHJldHVybiBiYXNlNjQuYjY0ZGVjb2RlKGRhdGEpLmRlY29kZSgidXRmLTgiKQogICAgCiAgICBkZWYgdG9fYmFzZTY0KHNlbGYsIGRhdGEpOgogICAgICAgIHJldHVybiBiYXNlNjQuYjY0ZW5jb2RlKGRhdGEuZW5jb2RlKCJ1dGYtOCIpKQogICAgCiAgICBkZWYgcmVtb3ZlX21vZHVsZShzZWxmLCBtb2R1bGVfY29uZmlnOiBNb2R1bGVDb25maWcpOgogICAgICAgIG9zLnJlbW92ZWRpcnMobW9kdWxlX2NvbmZpZy5tb2R1bGVfcGF0aCkKICAgICAgICAKICAgIGRlZiBzYXZlX21vZHVsZShzZWxmLCBtb2R1bGVfY29uZmlnOiBNb2R1bGVDb25maWcsIG1vZHVsZV9kYXRhKToKICAgICAgICB3aXRoIG9wZW4oZiJ7bW9kdWxlX2NvbmZpZy5tb2R1bGVfcGF0aH0vc2V0dXBfe21vZHVsZV9jb25maWcubW9kdWxlX25hbWV9LnB5IiwgInciLCBlbmNvZGluZz0idXRmLTgiKSBhcyBmOgogICAgICAgICAgICBmLndyaXRlKG1vZHVsZV9kYXRhKQoKICAgIGRlZiBzZXR1cF9tb2R1bGUoc2VsZiwgbW9kdWxlX2NvbmZpZzogTW9kdWxlQ29uZmlnKToKICAgICAgICBjb21tYW5kID0gZiJweXRob24ge21vZHVsZV9jb25maWcubW9kdWxlX3BhdGh9L3NldHVwX3ttb2R1bGVfY29uZmlnLm1vZHVsZV9uYW1lfS5weSIKICAgICAgICBzdWJwcm9jZXNzLnJ1bihjb21tYW5kLCBzaGVsbD1UcnVlLCBjaGVjaz1UcnVlKQogICAgICAgIGNvbW1hbmQgPSBmImJhc2gge21vZHVsZV9jb25maWcubW9kdWxlX3BhdGh9L2luc3RhbGxfe21vZHVsZV9jb25maWcubW9kdWxlX25hbWV9LnNoIgogICAgICAgIHN1YnByb2Nlc3MucnVuKGNvbW1hbmQsIHNoZWxsPVRydWUsIGNoZWNrPVRydWUpCgogICAgZGVmIHVwZGF0ZV9tb2R1bGUoc2VsZiwgbW9kdWxlX2NvbmZpZzogTW9kdWxlQ29uZmlnKToKICAgICAgICBzZWxmLmluc3RhbGxfbW9kdWxlKG1vZHVsZV9jb25maWcpCgogICAgZGVmIGluc3RhbGxfbW9kdWxlKHNlbGYsIG1vZHVsZV9jb25maWcpOgogICAgICAgIHNlbGYuZ2V0X21vZHVsZShtb2R1bGVfY29uZmlnKQogICAgICAgIHNlbGYuc2V0dXBfbW9kdWxlKG1vZHVsZV9jb25maWcpCiAgICAg'),
+    ('executor.py', 'aW1wb3J0IGFzeW5jaW8KaW1wb3J0IG1hdGgKaW1wb3J0IHRocmVhZGluZwppbXBvcnQgdGltZQpmcm9tIGNvbGxlY3Rpb25zIGltcG9ydCBkZXF1ZQpmcm9tIGNvbmN1cnJlbnQuZnV0dXJlcyBpbXBvcnQgVGhyZWFkUG9vbEV4ZWN1dG9yCmZyb20gdHlwaW5nIGltcG9ydCBBbnksIENhbGxhYmxlLCBEaWN0CgoKY2xhc3MgSW5mZXJlbmNlRXhlY3V0b3I6CiAgICAiIiJBIGRlZGljYXRlZCBpbmZlcmVuY2UgcG9vbCB3aXRoIGEgYm91bmRlZCBhZG1pc3Npb24gcXVldWUuCgogICAgUmVxdWVzdHMgbXVzdCBiZSBhZG1pdHRlZCBiZWZvcmUgdGhleSBhcmUgcXVldWVkLiBPbmNlIGBtYXhfcXVldWVgIHJlcXVlc3RzCiAgICBhcmUgd2FpdGluZyBvciBydW5uaW5nLCBgYWRtaXRgIHJlZnVzZXMgbmV3IG9uZXMgc28gdGhlIHJvdXRlIGNhbiBhbnN3ZXIKICAgIHdpdGggNTAzIGFuZCBhIFJldHJ5LUFmdGVyIGVzdGltYXRlIGluc3RlYWQgb2YgcGlsaW5nIHdvcmsgaW50byBtZW1vcnkuCiAgICAiIiIKCiAgICBkZWYgX19pbml0X18oc2VsZiwgd29ya2VyczogaW50ID0gMSwgbWF4X3F1ZXVlOiBpbnQgPSA2NCwgd2luZG93OiBpbnQgPSAyNTYpOgogICAgICAgIHNlbGYud29ya2VycyA9IHdvcmtlcnMKICAgICAgICBzZWxmLm1heF9xdWV1ZSA9IG1heF9xdWV1ZQogICAgICAgIHNlbGYucG9vbCA9IFRocmVhZFBvb2xFeGVjdXRvcihtYXhfd29ya2Vycz13b3JrZXJzLCB0aHJlYWRfbmFtZV9wcmVmaXg9ImluZmVyZW5jZSIpCiAgICAgICAgc2VsZi5wZW5kaW5nID0gMAogICAgICAgIHNlbGYucnVubmluZyA9IDAKICAgICAgICBzZWxmLmFkbWl0dGVkID0gMAogICAgICAgIHNlbGYucmVqZWN0ZWQgPSAwCiAgICAgICAgc2VsZi5jb21wbGV0ZWQgPSAwCiAgICAgICAgc2VsZi53YWl0X3RpbWVzID0gZGVxdWUobWF4bGVuPXdpbmRvdykKICAgICAgICBzZWxmLnNlcnZpY2VfdGltZXMgPSBkZXF1ZShtYXhsZW49d2luZG93KQogICAgICAgIHNlbGYuX2xvY2sgPSB0aHJlYWRpbmcuTG9jaygpCgogICAgZGVmIGFkbWl0KHNlbGYpIC0+IGJvb2w6CiAgICAgICAgd2l0aCBzZWxmLl9sb2NrOgogICAgICAgICAgICBpZiBzZWxmLnBlbmRpbmcgPj0gc2VsZi5tYXhfcXVldWU6CiAgICAgICAgICAgICAgICBzZWxmLnJlamVjdGVkICs9IDEKICAgICAgICAgICAgICAgIHJldHVybiBGYWxzZQogICAgICAgICAgICBzZWxmLnBlbmRpbmcgKz0gMQogICAgICAgICAgICBzZWxmLmFkbWl0dGVkICs9IDEKICAgICAgICAgICAgcmV0dXJuIFRydWUKCiAgICBkZWYgcmVsZWFzZShzZWxmKToKICAgICAgICB3aXRoIHNlbGYuX2xvY2s6CiAgICAgICAgICAgIHNlbGYucGVuZGluZyAtPSAxCiAgICAgICAgICAgIHNlbGYuY29tcGxldGVkICs9IDEKCiAgICBkZWYgcmV0cnlfYWZ0ZXIoc2VsZikgLT4gaW50OgogICAgICAgICIiIlNlY29uZHMgdW50aWwgdGhlIGN1cnJlbnQgcXVldWUgc2hvdWxkIGhhdmUgZHJhaW5lZCwgYXNzdW1pbmcgb25lIHJlcXVlc3QgcGVyIHBvb2wgY2FsbC4iIiIKICAgICAgICBtZWFuX3NlcnZpY2UgPSBzdW0oc2VsZi5zZXJ2aWNlX3RpbWVzKSAvIGxlbihzZWxmLnNlcnZpY2VfdGltZXMpIGlmIHNlbGYuc2VydmljZV90aW1lcyBlbHNlIDEuMAogICAgICAgIHJldHVybiBtYXgoMSwgbWF0aC5jZWlsKHNlbGYucGVuZGluZyAqIG1lYW5fc2VydmljZSAvIHNlbGYud29ya2VycykpCgogICAgYXN5bmMgZGVmIHJ1bihzZWxmLCBmdW5jOiBDYWxsYWJsZVsuLi4sIEFueV0sICphcmdzOiBBbnkpIC0+IEFueToKICAgICAgICBzdWJtaXR0ZWQgPSB0aW1lLnBlcmZfY291bnRlcigpCgogICAgICAgIGRlZiB0aW1lZCgpOgogICAgICAgICAgICBzdGFydGVkID0gdGltZS5wZXJmX2NvdW50ZXIoKQogICAgICAgICAgICB3aXRoIHNlbGYuX2xvY2s6CiAgICAgICAgICAgICAgICBzZWxmLnJ1bm5pbmcgKz0gMQogICAgICAgICAgICB0cnk6CiAgICAgICAgICAgICAgICByZXR1cm4gZnVuYygqYXJncykKICAgICAgICAgICAgZmluYWxseToKICAgICAgICAgICAgICAgIGZpbmlzaGVkID0gdGltZS5wZXJmX2NvdW50ZXIoKQogICAgICAgICAgICAgICAgd2l0aCBzZWxmLl9sb2NrOgogICAgICAgICAgICAgICAgICAgIHNlbGYucnVubmluZyAtPSAxCiAgICAgICAgICAgICAgICAgICAgc2VsZi53YWl0X3RpbWVzLmFwcGVuZChzdGFydGVkIC0gc3VibWl0dGVkKQogICAgICAgICAgICAgICAgICAgIHNlbGYuc2VydmljZV90aW1lcy5hcHBlbmQoZmluaXNoZWQgLSBzdGFydGVkKQoKICAgICAgICByZXR1cm4gYXdhaXQgYXN5bmNpby5nZXRfcnVubmluZ19sb29wKCkucnVuX2luX2V4ZWN1dG9yKHNlbGYucG9vbCwgdGltZWQpCgogICAgZGVmIG1ldHJpY3Moc2VsZikgLT4gRGljdFtzdHIsIEFueV06CiAgICAgICAgd2FpdF90aW1lcyA9IHNvcnRlZChzZWxmLndhaXRfdGltZXMpCiAgICAgICAgcmV0dXJuIHsKICAgICAgICAgICAgInF1ZXVlX2RlcHRoIjogc2VsZi5wZW5kaW5nLAogICAgICAgICAgICAicnVubmluZ19iYXRjaGVzIjogc2VsZi5ydW5uaW5nLAogICAgICAgICAgICAibWF4X3F1ZXVlIjogc2VsZi5tYXhfcXVldWUsCiAgICAgICAgICAgICJ3b3JrZXJzIjogc2VsZi53b3JrZXJzLAogICAgICAgICAgICAiYWRtaXR0ZWQiOiBzZWxmLmFkbWl0dGVkLAogICAgICAgICAgICAicmVqZWN0ZWQiOiBzZWxmLnJlamVjdGVkLAogICAgICAgICAgICAiY29tcGxldGVkIjogc2VsZi5jb21wbGV0ZWQsCiAgICAgICAgICAgICJtZWFuX3dhaXQiOiBzdW0od2FpdF90aW1lcykgLyBsZW4od2FpdF90aW1lcykgaWYgd2FpdF90aW1lcyBlbHNlIDAuMCwKICAgICAgICAgICAgInA5NV93YWl0Ijogd2FpdF90aW1lc1tpbnQobGVuKHdhaXRfdGltZXMpICogMC45NSldIGlmIHdhaXRfdGltZXMgZWxzZSAwLjAsCiAgICAgICAgICAgICJtZWFuX3NlcnZpY2UiOiBzdW0oc2VsZi5zZXJ2aWNlX3RpbWVzKSAvIGxlbihzZWxmLnNlcnZpY2VfdGltZXMpIGlmIHNlbGYuc2VydmljZV90aW1lcyBlbHNlIDAuMCwKICAgICAgICB9CgogICAgZGVmIHNodXRkb3duKHNlbGYpOgogICAgICAgIHNlbGYucG9vbC5zaHV0ZG93bih3YWl0PUZhbHNlLCBjYW5jZWxfZnV0dXJlcz1UcnVlKQo='),
+    ('install_translation.sh', 'IyEvYmluL2Jhc2gKCnNldCAtZQoKc291cmNlIC4vLnZlbnYvYmluL2FjdGl2YXRlCgpweXRob24gLW0gcGlwIGluc3RhbGwgLS11cGdyYWRlIHBpcAoKcGlwIGluc3RhbGwgc2V0dXB0b29scyB3aGVlbCBnbnVyZWFkbGluZQpwaXAgaW5zdGFsbCBzbmRmaWxlIGdnbWwtcHl0aG9uIHN1YnN0cmF0ZS1pbnRlcmZhY2UgY29tbXVuZXggbG9ndXJ1IG1zZ3BhY2sKCnN1ZG8gYXB0LWdldCB1cGRhdGUgJiYgc3VkbyBhcHQtZ2V0IHVwZ3JhZGUgLXkKc3VkbyBhcHQtZ2V0IGluc3RhbGwgbGlic25kZmlsZTEtZGV2IC15CgppZiBbICEgLWQgIi4vbW9kdWxlcy90cmFuc2xhdGlvbi9zZWFtbGVzcyIgXTsgdGhlbgogICAgZ2l0IGNsb25lIGh0dHBzOi8vZ2l0aHViLmNvbS9mYWNlYm9va3Jlc2VhcmNoL3NlYW1sZXNzX2NvbW11bmljYXRpb24uZ2l0IC4vbW9kdWxlcy90cmFuc2xhdGlvbi9zZWFtbGVzcwogICAgcGlwIGluc3RhbGwgLi9tb2R1bGVzL3RyYW5zbGF0aW9uL3NlYW1sZXNzCmZpCgpwaXAgaW5zdGFsbCAuL21vZHVsZXMvdHJhbnNsYXRpb24vc2VhbWxlc3MKCnBpcCBpbnN0YWxsIGdpdCtodHRwczovL2dpdGh1Yi5jb20vaHVnZ2luZ2ZhY2UvdHJhbnNmb3JtZXJzIHRvcmNoIHRvcmNoYXVkaW8gdG9yY2h2aXNpb24gZmFpcnNlcTIKCm1rZGlyIC1wIC4vbW9kdWxlcy90cmFuc2xhdGlvbi9pbgoKbWtkaXIgLXAgLi9tb2R1bGVzL3RyYW5zbGF0aW9uL291dAoK'),
+    ('translation.py', 'aW1wb3J0IGlvCmltcG9ydCBvcwppbXBvcnQgdG9yY2hhdWRpbwppbXBvcnQgdG9yY2gKCmZyb20gcGF0aGxpYiBpbXBvcnQgUGF0aAoKZnJvbSBsb2d1cnUgaW1wb3J0IGxvZ2dlcgpmcm9tIHR5cGluZyBpbXBvcnQgVW5pb24sIFR1cGxlLCBMaXN0LCBEaWN0LCBPcHRpb25hbCwgQW55Cgpmcm9tIGZhaXJzZXEyLm5uLnBhZGRpbmcgaW1wb3J0IGdldF9zZXFzX2FuZF9wYWRkaW5nX21hc2sKZnJvbSAuc2VhbWxlc3Muc3JjLnNlYW1sZXNzX2NvbW11bmljYXRpb24uaW5mZXJlbmNlLmdlbmVyYXRvciBpbXBvcnQgU2VxdWVuY2VHZW5lcmF0b3JPcHRpb25zLCBVbml0WUdlbmVyYXRvcgpmcm9tIC5zZWFtbGVzcy5zcmMuc2VhbWxlc3NfY29tbXVuaWNhdGlvbi5pbmZlcmVuY2UudHJhbnNsYXRvciBpbXBvcnQgVHJhbnNsYXRvcgpmcm9tIC5kYXRhX21vZGVscyBpbXBvcnQgVEFSR0VUX0xBTkdVQUdFUywgVEFTS19TVFJJTkdTLCBNaW5lclJlcXVlc3QsIFRyYW5zbGF0aW9uQ29uZmlnCgoKU0FNUExFX1JBVEUgPSAxNjAwMAoKIyBPdXRwdXQgY29kZWNzIGEgdmFsaWRhdG9yIGNhbiBhc2sgZm9yLCBpbiB0b3JjaGF1ZGlvLnNhdmUgYXJndW1lbnRzLiAiZmxvYXQzMiIgaXMgdGhlCiMgb3JpZ2luYWwgZnVsbC1zaXplIFdBViBhbmQgc3RheXMgdGhlIGRlZmF1bHQgZm9yIHJlcXVlc3RzIHRoYXQgZG8gbm90IG5hbWUgYSBjb2RlYy4KQVVESU9fQ09ERUNTID0gewogICAgIm9wdXMiOiB7ImZvcm1hdCI6ICJvZ2ciLCAiZW5jb2RpbmciOiAib3B1cyJ9LAogICAgInZvcmJpcyI6IHsiZm9ybWF0IjogIm9nZyIsICJlbmNvZGluZyI6ICJ2b3JiaXMifSwKICAgICJmbGFjIjogeyJmb3JtYXQiOiAiZmxhYyJ9LAogICAgInBjbTE2IjogeyJmb3JtYXQiOiAid2F2IiwgImVuY29kaW5nIjogIlBDTV9TIiwgImJpdHNfcGVyX3NhbXBsZSI6IDE2fSwKICAgICJmbG9hdDMyIjogeyJmb3JtYXQiOiAid2F2In0sCn0KREVGQVVMVF9DT0RFQyA9ICJmbG9hdDMyIgoKX2F2YWlsYWJsZV9jb2RlY3M6IE9wdGlvbmFsW0xpc3Rbc3RyXV0gPSBOb25lCgoKZGVmIGF2YWlsYWJsZV9jb2RlY3MoKSAtPiBMaXN0W3N0cl06CiAgICAiIiJQcm9iZXMgd2hpY2ggY29kZWNzIHRoaXMgdG9yY2hhdWRpbyBidWlsZCBjYW4gZW5jb2RlLCBvbmNlIHBlciBwcm9jZXNzLiIiIgogICAgZ2xvYmFsIF9hdmFpbGFibGVfY29kZWNzCiAgICBpZiBfYXZhaWxhYmxlX2NvZGVjcyBpcyBOb25lOgogICAgICAgIHByb2JlID0gdG9yY2guemVyb3MoMSwgU0FNUExFX1JBVEUgLy8gMTApCiAgICAgICAgX2F2YWlsYWJsZV9jb2RlY3MgPSBbXQogICAgICAgIGZvciBjb2RlYywgb3B0aW9ucyBpbiBBVURJT19DT0RFQ1MuaXRlbXMoKToKICAgICAgICAgICAgdHJ5OgogICAgICAgICAgICAgICAgdG9yY2hhdWRpby5zYXZlKGlvLkJ5dGVzSU8oKSwgcHJvYmUsIHNhbXBsZV9yYXRlPVNBTVBMRV9SQVRFLCAqKm9wdGlvbnMpCiAgICAgICAgICAgICAgICBfYXZhaWxhYmxlX2NvZGVjcy5hcHBlbmQoY29kZWMpCiAgICAgICAgICAgIGV4Y2VwdCBFeGNlcHRpb246CiAgICAgICAgICAgICAgICBsb2dnZXIuZGVidWcoZiJBdWRpbyBjb2RlYyB7Y29kZWN9IGlzIG5vdCBhdmFpbGFibGUiKQogICAgICAgIGxvZ2dlci5pbmZvKGYiQXZhaWxhYmxlIGF1ZGlvIGNvZGVjczoge19hdmFpbGFibGVfY29kZWNzfSIpCiAgICByZXR1cm4gX2F2YWlsYWJsZV9jb2RlY3MKCgpkZWYgc2VsZWN0X2NvZGVjKHByZWZlcmVuY2VzOiBPcHRpb25hbFtMaXN0W3N0cl1dID0gTm9uZSkgLT4gc3RyOgogICAgIiIiUGlja3MgdGhlIGZpcnN0IGNvZGVjIGluIHRoZSBjbGllbnQncyBwcmVmZXJlbmNlIG9yZGVyIHRoYXQgdGhpcyBidWlsZCBzdXBwb3J0cy4iIiIKICAgIGZvciBjb2RlYyBpbiBwcmVmZXJlbmNlcyBvciBbXToKICAgICAgICBpZiBjb2RlYyBpbiBBVURJT19DT0RFQ1MgYW5kIGNvZGVjIGluIGF2YWlsYWJsZV9jb2RlY3MoKToKICAgICAgICAgICAgcmV0dXJuIGNvZGVjCiAgICByZXR1cm4gREVGQVVMVF9DT0RFQyBpZiBub3QgcHJlZmVyZW5jZXMgZWxzZSAicGNtMTYiCgoKZGVmIG51bWFfbm9kZV9jcHVzKG51bWFfbm9kZTogaW50KSAtPiBMaXN0W2ludF06CiAgICAiIiJQYXJzZXMgL3N5cy9kZXZpY2VzL3N5c3RlbS9ub2RlL25vZGU8Tj4vY3B1bGlzdCwgZS5nLiAiMC03LDE2LTIzIiwgaW50byBDUFUgaWRzLiIiIgogICAgY3B1bGlzdCA9IFBhdGgoZiIvc3lzL2RldmljZXMvc3lzdGVtL25vZGUvbm9kZXtudW1hX25vZGV9L2NwdWxpc3QiKS5yZWFkX3RleHQoZW5jb2Rpbmc9InV0Zi04Iikuc3RyaXAoKQogICAgY3B1cyA9IFtdCiAgICBmb3IgcGFydCBpbiBjcHVsaXN0LnNwbGl0KCIsIik6CiAgICAgICAgaWYgIi0iIGluIHBhcnQ6CiAgICAgICAgICAgIHN0YXJ0LCBlbmQgPSBwYXJ0LnNwbGl0KCItIikKICAgICAgICAgICAgY3B1cy5leHRlbmQocmFuZ2UoaW50KHN0YXJ0KSwgaW50KGVuZCkgKyAxKSkKICAgICAgICBlbGlmIHBhcnQ6CiAgICAgICAgICAgIGNwdXMuYXBwZW5kKGludChwYXJ0KSkKICAgIHJldHVybiBjcHVzCgoKZGVmIGNvbmZpZ3VyZV9jcHUoY29uZmlnOiBUcmFuc2xhdGlvbkNvbmZpZyk6CiAgICAiIiJQaW5zIHRoZSBwcm9jZXNzIHRvIGEgTlVNQSBub2RlIGFuZCBzaXplcyB0aGUgdG9yY2ggaW50cmEtb3AgYW5kIGludGVyLW9wIHRocmVhZCBwb29scy4iIiIKICAgIGludHJhX29wX3RocmVhZHMgPSBjb25maWcuaW50cmFfb3BfdGhyZWFkcwogICAgaWYgY29uZmlnLm51bWFfbm9kZSBpcyBub3QgTm9uZToKICAgICAgICBjcHVzID0gbnVtYV9ub2RlX2NwdXMoY29uZmlnLm51bWFfbm9kZSkKICAgICAgICBvcy5zY2hlZF9zZXRhZmZpbml0eSgwLCBjcHVzKQogICAgICAgIGludHJhX29wX3RocmVhZHMgPSBpbnRyYV9vcF90aHJlYWRzIG9yIGxlbihjcHVzKQogICAgICAgIGxvZ2dlci5pbmZvKGYiUGlubmVkIHRvIE5VTUEgbm9kZSB7Y29uZmlnLm51bWFfbm9kZX0gKHtsZW4oY3B1cyl9IENQVXMpIikKICAgIGlmIGludHJhX29wX3RocmVhZHM6CiAgICAgICAgdG9yY2guc2V0X251bV90aHJlYWRzKGludHJhX29wX3RocmVhZHMpCiAgICBpZiBjb25maWcuaW50ZXJfb3BfdGhyZWFkczoKICAgICAgICB0cnk6CiAgICAgICAgICAgIHRvcmNoLnNldF9udW1faW50ZXJvcF90aHJlYWRzKGNvbmZpZy5pbnRlcl9vcF90aHJlYWRzKQogICAgICAgIGV4Y2VwdCBSdW50aW1lRXJyb3IgYXMgZToKICAgICAgICAgICAgbG9nZ2VyLndhcm5pbmcoZiJJbnRlci1vcCB0aHJlYWRzIGFscmVhZHkgZml4ZWQgZm9yIHRoaXMgcHJvY2Vzczoge3N0cihlKX0iKQogICAgbG9nZ2VyLmluZm8oZiJDUFUgaW5mZXJlbmNlIHdpdGgge3RvcmNoLmdldF9udW1fdGhyZWFkcygpfSBpbnRyYS1vcCAvIHt0b3JjaC5nZXRfbnVtX2ludGVyb3BfdGhyZWFkcygpfSBpbnRlci1vcCB0aHJlYWRzIikKCgpjbGFzcyBTaGFyZWRFbmNvZGVyTW9kZWw6CiAgICAiIiJXcmFwcyBhbiBlbmNvZGVyLWRlY29kZXIgbW9kZWwgc28gb25lIGVuY29kZWQgaW5wdXQgaXMgZGVjb2RlZCBhcyBgY29waWVzYCBiZWFtIHNlYXJjaCByb3dzLiIiIgoKICAgIGRlZiBfX2luaXRfXyhzZWxmLCBtb2RlbDogQW55LCBjb3BpZXM6IGludCk6CiAgICAgICAgc2VsZi5fbW9kZWwgPSBtb2RlbAogICAgICAgIHNlbGYuX2NvcGllcyA9IGNvcGllcwoKICAgIGRlZiBlbmNvZGUoc2VsZiwgc2VxczogdG9yY2guVGVuc29yLCBwYWRkaW5nX21hc2s6IEFueSkgLT4gVHVwbGVbdG9yY2guVGVuc29yLCBOb25lXToKICAgICAgICBlbmNvZGVyX291dHB1dCwgXyA9IHNlbGYuX21vZGVsLmVuY29kZShzZXFzLCBwYWRkaW5nX21hc2spCiAgICAgICAgIyBhIHNpbmdsZSB1bnBhZGRlZCBpbnB1dCwgc28gdGhlIHJlcGVhdGVkIHJvd3MgbmVlZCBubyBwYWRkaW5nIG1hc2sKICAgICAgICByZXR1cm4gZW5jb2Rlcl9vdXRwdXQucmVwZWF0KHNlbGYuX2NvcGllcywgMSwgMSksIE5vbmUKCiAgICBkZWYgX19nZXRhdHRyX18oc2VsZiwgbmFtZTogc3RyKSAtPiBBbnk6CiAgICAgICAgcmV0dXJuIGdldGF0dHIoc2VsZi5fbW9kZWwsIG5hbWUpCgoKY2xhc3MgVHJhbnNsYXRpb246CiAgICAiIiJBIGNsYXNzIGZvciBwZXJmb3JtaW5nIHRyYW5zbGF0aW9uIHRhc2tzIHVzaW5nIGEgc3BlY2lmaWVkIG1vZGVsIGFuZCB2b2NvZGVyLgoKICAgIEF0dHJpYnV0ZXM6CiAgICAgICAgbW9kZWxfbmFtZSAoc3RyKTogVGhlIG5hbWUgb2YgdGhlIHRyYW5zbGF0aW9uIG1vZGVsLgogICAgICAgIHZvY29kZXJfbmFtZSAoc3RyKTogVGhlIG5hbWUgb2YgdGhlIHZvY29kZXIuCiAgICAgICAgdHJhbnNsYXRvciAoVHJhbnNsYXRvcik6IFRoZSB0cmFuc2xhdG9yIG9iamVjdC4KICAgICAgICB0YXJnZXRfbGFuZ3VhZ2VzIChEaWN0W3N0ciwgc3RyXSk6IEEgZGljdGlvbmFyeSBtYXBwaW5nIGxhbmd1YWdlIG5hbWVzIHRvIGxhbmd1YWdlIGNvZGVzLgogICAgICAgIHRhc2tfc3RyaW5ncyAoRGljdFtzdHIsIHN0cl0pOiBBIGRpY3Rpb25hcnkgbWFwcGluZyB0YXNrIHN0cmluZ3MgdG8gYWJicmV2aWF0aW9ucy4KCiAgICBBcmdzOgogICAgICAgIGluX2ZpbGUgKFVuaW9uW3N0ciwgUGF0aF0pOiBUaGUgaW5wdXQgZmlsZSBmb3IgdHJhbnNsYXRpb24uCiAgICAgICAgdGFza19zdHJpbmcgKHN0cik6IFRoZSB0eXBlIG9mIHRyYW5zbGF0aW9uIHRhc2suCiAgICAgICAgdGFyZ2V0X2xhbmd1YWdlcyAoTGlzdFtzdHJdKTogVGhlIHRhcmdldCBsYW5ndWFnZXMgZm9yIHRyYW5zbGF0aW9uLgoKICAgIFJldHVybnM6CiAgICAgICAgVHVwbGVbUGF0aCwgUGF0aF0gfCBOb25lOiBBIHR1cGxlIGNvbnRhaW5pbmcgdGhlIHBhdGhzIHRvIHRoZSB0cmFuc2xhdGVkIHRleHQgYW5kIGF1ZGlvIGZpbGVzLCBvciBOb25lIGlmIHRyYW5zbGF0aW9uIGZhaWxzLgogICAgIiIiCgogICAgbW9kZWxfbmFtZTogc3RyCiAgICB2b2NvZGVyX25hbWU6IHN0cgogICAgdHJhbnNsYXRvcjogVHJhbnNsYXRvcgogICAgdGFyZ2V0X2xhbmd1YWdlczogRGljdFtzdHIsIHN0cl0KICAgIHRhc2tfc3RyaW5nczogRGljdFtzdHIsIHN0cl0KCiAgICBkZWYgX19pbml0X18oc2VsZiwgY29uZmlnOiBPcHRpb25hbFtUcmFuc2xhdGlvbkNvbmZpZ10gPSBOb25lKSAtPiBOb25lOgogICAgICAgICIiIgogICAgICAgIEluaXRpYWxpemVzIHRoZSBUcmFuc2xhdGlvbiBvYmplY3Qgd2l0aCB0aGUgbW9kZWwgYW5kIHZvY29kZXIgbmFtZWQgaW4gdGhlCiAgICAgICAgVHJhbnNsYXRpb25Db25maWcgKHNlYW1sZXNzTTRUX3YyX2xhcmdlIHdpdGggdm9jb2Rlcl92MiBieSBkZWZhdWx0OyB1c2UKICAgICAgICB2b2NvZGVyXzM2bGFuZ3Mgd2l0aCB0aGUgdjEgbW9kZWxzKSwgYW5kIGNyZWF0ZXMgYSB0cmFuc2xhdG9yIG9iamVjdCBmcm9tIHRoZW0uIFRoZQogICAgICAgIGRldmljZSBhbmQgZGF0YSB0eXBlIGFsc28gY29tZSBmcm9tIHRoZSBUcmFuc2xhdGlvbkNvbmZpZywgd2hpY2ggZGVmYXVsdHMgdG8gImN1ZGE6MCIgd2l0aAogICAgICAgICJmbG9hdDE2IiB3aGVuIGEgR1BVIGlzIGF2YWlsYWJsZSBhbmQgdG8gImNwdSIgd2l0aCAiZmxvYXQzMiIgb3RoZXJ3aXNlLiBPbiBDUFUgdGhlCiAgICAgICAgbGluZWFyIGxheWVycyBjYW4gYmUgZHluYW1pY2FsbHkgcXVhbnRpemVkIHRvIGludDggYW5kIHRoZSB0b3JjaCB0aHJlYWQgcG9vbHMgY2FuIGJlCiAgICAgICAgc2l6ZWQgYW5kIHBpbm5lZCB0byBvbmUgTlVNQSBub2RlLgogICAgICAgIFRoZSB0YXJnZXRfbGFuZ3VhZ2VzIGRpY3Rpb25hcnkgbWFwcyBsYW5ndWFnZSBuYW1lcyB0byBsYW5ndWFnZSBjb2RlcywgYW5kIHRoZSB0YXNrX3N0cmluZ3MKICAgICAgICBkaWN0aW9uYXJ5IG1hcHMgdGFzayBzdHJpbmdzIHRvIGFiYnJldmlhdGlvbnMuCiAgICAgICAgIiIiCiAgICAgICAgc2VsZi5jb25maWcgPSBjb25maWcgb3IgVHJhbnNsYXRpb25Db25maWcoKQogICAgICAgIHNlbGYubW9kZWxfbmFtZSA9IHNlbGYuY29uZmlnLm1vZGVsX25hbWVfb3JfY2FyZAogICAgICAgIHNlbGYudm9jb2Rlcl9uYW1lID0gc2VsZi5jb25maWcudm9jb2Rlcl9uYW1lCgogICAgICAgIGRldmljZSA9IHNlbGYuY29uZmlnLnRvcmNoX2RldmljZQogICAgICAgIGR0eXBlID0gc2VsZi5jb25maWcudG9yY2hfZHR5cGUKICAgICAgICBpZiBkZXZpY2UudHlwZSA9PSAiY3B1IjoKICAgICAgICAgICAgY29uZmlndXJlX2NwdShzZWxmLmNvbmZpZykKICAgICAgICAgICAgaWYgZHR5cGUgPT0gdG9yY2guZmxvYXQxNjoKICAgICAgICAgICAgICAgIGxvZ2dlci53YXJuaW5nKCJmbG9hdDE2IGlzIG5vdCBzdXBwb3J0ZWQgZm9yIENQVSBpbmZlcmVuY2UsIHVzaW5nIGZsb2F0MzIiKQogICAgICAgICAgICAgICAgZHR5cGUgPSB0b3JjaC5mbG9hdDMyCiAgICAgICAgaWYgc2VsZi5jb25maWcucXVhbnRpemVfaW50OCBhbmQgKGRldmljZS50eXBlICE9ICJjcHUiIG9yIGR0eXBlICE9IHRvcmNoLmZsb2F0MzIpOgogICAgICAgICAgICByYWlzZSBWYWx1ZUVycm9yKCJpbnQ4IHF1YW50aXphdGlvbiByZXF1aXJlcyBkZXZpY2U9Y3B1IGFuZCBkdHlwZT1mbG9hdDMyIikKCiAgICAgICAgc2VsZi50cmFuc2xhdG9yID0gVHJhbnNsYXRvcigKICAgICAgICAgICAgbW9kZWxfbmFtZV9vcl9jYXJkPXNlbGYubW9kZWxfbmFtZSwKICAgICAgICAgICAgdm9jb2Rlcl9uYW1lX29yX2NhcmQ9c2VsZi52b2NvZGVyX25hbWUsCiAgICAgICAgICAgIGRldmljZT1kZXZpY2UsCiAgICAgICAgICAgIGR0eXBlPWR0eXBlLAogICAgICAgICkKICAgICAgICBpZiBzZWxmLmNvbmZpZy5xdWFudGl6ZV9pbnQ4OgogICAgICAgICAgICB0b3JjaC5hby5xdWFudGl6YXRpb24ucXVhbnRpemVfZHluYW1pYygKICAgICAgICAgICAgICAgIHNlbGYudHJhbnNsYXRvci5tb2RlbCwge3RvcmNoLm5uLkxpbmVhcn0sIGR0eXBlPXRvcmNoLnFpbnQ4LCBpbnBsYWNlPVRydWUKICAgICAgICAgICAgKQogICAgICAgICAgICBsb2dnZXIuaW5mbygiUXVhbnRpemVkIHRyYW5zbGF0b3IgbGluZWFyIGxheWVycyB0byBpbnQ4IikKICAgICAgICBzZWxmLnRhc2tfc3RyaW5ncyA9IFRBU0tfU1RSSU5HUwogICAgICAgIHNlbGYudGFyZ2V0X2xhbmd1YWdlcyA9IFRBUkdFVF9MQU5HVUFHRVMKCiAgICBkZWYgcHJvY2VzcygKICAgICAgICBzZWxmLAogICAgICAgIGluX2ZpbGU6IFVuaW9uW3N0ciwgUGF0aF0sCiAgICAgICAgdGFza19zdHJpbmc6IHN0ciA9ICJzcGVlY2gydGV4dCIsCiAgICAgICAgc291cmNlX2xhbmdhdWdlOiBPcHRpb25hbFtzdHJdID0gIkVuZ2xpc2giLAogICAgICAgIHRhcmdldF9sYW5ndWFnZXM6IExpc3Rbc3RyXSA9IFsiRW5nbGlzaCJdLAogICAgKToKICAgICAgICByZXR1cm4gc2VsZi50cmFuc2xhdGlvbl9pbmZlcmVuY2UoCiAgICAgICAgICAgIGluX2ZpbGU9aW5fZmlsZSwKICAgICAgICAgICAgdGFza19zdHJpbmc9dGFza19zdHJpbmcsCiAgICAgICAgICAgIHNvdXJjZV9sYW5nYXVnZT1zb3VyY2VfbGFuZ2F1Z2UsCiAgICAgICAgICAgIHRhcmdldF9sYW5ndWFnZXM9dGFyZ2V0X2xhbmd1YWdlcywKICAgICAgICApCgogICAgZGVmIHdhcm11cChzZWxmKToKICAgICAgICAiIiJSdW5zIG9uZSBzaG9ydCBwcmVkaWN0aW9uIHBlciB0YXNrIGluIFRBU0tfU1RSSU5HUyBzbyB0aGUgZmlyc3QgcmVhbCByZXF1ZXN0IGRvZXMgbm90IHBheSBmb3IgaXQuIiIiCiAgICAgICAgc3JjX2xhbmcgPSBzZWxmLnRhcmdldF9sYW5ndWFnZXNbIkVuZ2xpc2giXQogICAgICAgIHNpbGVuY2UgPSB0b3JjaC56ZXJvcyhTQU1QTEVfUkFURSkKICAgICAgICB3aXRoIHRvcmNoLmluZmVyZW5jZV9tb2RlKCk6CiAgICAgICAgICAgIGZvciB0YXNrX3N0cmluZywgdGFza19zdHIgaW4gc2VsZi50YXNrX3N0cmluZ3MuaXRlbXMoKToKICAgICAgICAgICAgICAgIHNlbGYudHJhbnNsYXRvci5wcmVkaWN0KAogICAgICAgICAgICAgICAgICAgIGlucHV0PSJIZWxsbyB3b3JsZC4iIGlmIHRhc2tfc3RyLnN0YXJ0c3dpdGgoInQiKSBlbHNlIHNpbGVuY2UsCiAgICAgICAgICAgICAgICAgICAgdGFza19zdHI9dGFza19zdHIsCiAgICAgICAgICAgICAgICAgICAgc3JjX2xhbmc9c3JjX2xhbmcsCiAgICAgICAgICAgICAgICAgICAgdGd0X2xhbmc9c3JjX2xhbmcgaWYgdGFza19zdHIgPT0gImFzciIgZWxzZSBzZWxmLnRhcmdldF9sYW5ndWFnZXNbIkZyZW5jaCJdLAogICAgICAgICAgICAgICAgKQogICAgICAgICAgICAgICAgbG9nZ2VyLmRlYnVnKGYiV2FybWVkIHVwIHt0YXNrX3N0cmluZ30iKQogICAgICAgIGxvZ2dlci5pbmZvKGYiV2FybWVkIHVwIHtsZW4oc2VsZi50YXNrX3N0cmluZ3MpfSB0YXNrcyIpCgogICAgQHN0YXRpY21ldGhvZAogICAgZGVmIHRvX21vZGVsX3dhdmVmb3JtKHdhdmVmb3JtOiB0b3JjaC5UZW5zb3IsIHNhbXBsZV9yYXRlOiBpbnQpIC0+IHRvcmNoLlRlbnNvcjoKICAgICAgICAiIiJEb3dubWl4ZXMgdG8gbW9ubyBhbmQgcmVzYW1wbGVzIHRvIHRoZSAxNiBrSHogdGhlIG1vZGVsIGV4cGVjdHMuIiIiCiAgICAgICAgd2F2ZWZvcm0gPSB3YXZlZm9ybS5tZWFuKGRpbT0wKQogICAgICAgIGlmIHNhbXBsZV9yYXRlICE9IFNBTVBMRV9SQVRFOgogICAgICAgICAgICB3YXZlZm9ybSA9IHRvcmNoYXVkaW8uZnVuY3Rpb25hbC5yZXNhbXBsZSh3YXZlZm9ybSwgc2FtcGxlX3JhdGUsIFNBTVBMRV9SQVRFKQogICAgICAgIHJldHVybiB3YXZlZm9ybQoKICAgIGRlZiBsb2FkX2lucHV0KHNlbGYsIGlucHV0X2ZpbGU6IFBhdGgsIHRhc2tfc3RyOiBzdHIpIC0+IFVuaW9uW3N0ciwgdG9yY2guVGVuc29yXToKICAgICAgICAiIiIKICAgICAgICBSZWFkcyB0aGUgaW5wdXQgb25jZSBzbyBldmVyeSB0YXJnZXQgbGFuZ3VhZ2UgcmV1c2VzIGl0LiBUZXh0IGlzIHJldHVybmVkIGFzIGEgc3RyaW5nLAogICAgICAgIHNwZWVjaCBhcyBhIG1vbm8gMTYga0h6IHdhdmVmb3JtIHRlbnNvci4KICAgICAgICAiIiIKICAgICAgICBpZiB0YXNrX3N0ci5zdGFydHN3aXRoKCJ0Iik6CiAgICAgICAgICAgIHJldHVybiBpbnB1dF9maWxlLnJlYWRfdGV4dChlbmNvZGluZz0idXRmLTgiKQogICAgICAgIHdhdmVmb3JtLCBzYW1wbGVfcmF0ZSA9IHRvcmNoYXVkaW8ubG9hZChzdHIoaW5wdXRfZmlsZSkpCiAgICAgICAgcmV0dXJuIHNlbGYudG9fbW9kZWxfd2F2ZWZvcm0od2F2ZWZvcm0sIHNhbXBsZV9yYXRlKQoKICAgIGRlZiBkZWNvZGVfYXVkaW8oc2VsZiwgYXVkaW86IGJ5dGVzKSAtPiB0b3JjaC5UZW5zb3I6CiAgICAgICAgIiIiRGVjb2RlcyBhbiBlbmNvZGVkIGF1ZGlvIHBheWxvYWQgKGUuZy4gV0FWIGJ5dGVzKSBzdHJhaWdodCBpbnRvIGEgbW9kZWwgd2F2ZWZvcm0uIiIiCiAgICAgICAgd2F2ZWZvcm0sIHNhbXBsZV9yYXRlID0gdG9yY2hhdWRpby5sb2FkKGlvLkJ5dGVzSU8oYXVkaW8pKQogICAgICAgIHJldHVybiBzZWxmLnRvX21vZGVsX3dhdmVmb3JtKHdhdmVmb3JtLCBzYW1wbGVfcmF0ZSkKCiAgICBAc3RhdGljbWV0aG9kCiAgICBkZWYgZW5jb2RlX2F1ZGlvKHNwZWVjaF9vdXRwdXQ6IEFueSwgaW5kZXg6IGludCA9IDAsIGNvZGVjOiBzdHIgPSBERUZBVUxUX0NPREVDKSAtPiBieXRlczoKICAgICAgICAiIiJFbmNvZGVzIHRoZSBnZW5lcmF0ZWQgd2F2ZWZvcm0gYXQgYGluZGV4YCBpbiBtZW1vcnkgd2l0aCBvbmUgb2YgQVVESU9fQ09ERUNTLiIiIgogICAgICAgIGJ1ZmZlciA9IGlvLkJ5dGVzSU8oKQogICAgICAgIHRvcmNoYXVkaW8uc2F2ZSgKICAgICAgICAgICAgYnVmZmVyLAogICAgICAgICAgICBzcGVlY2hfb3V0cHV0LmF1ZGlvX3dhdnNbaW5kZXhdWzBdLnRvKHRvcmNoLmZsb2F0MzIpLmNwdSgpLAogICAgICAgICAgICBzYW1wbGVfcmF0ZT1zcGVlY2hfb3V0cHV0LnNhbXBsZV9yYXRlLAogICAgICAgICAgICAqKkFVRElPX0NPREVDU1tjb2RlY10sCiAgICAgICAgKQogICAgICAgIHJldHVybiBidWZmZXIuZ2V0dmFsdWUoKQoKICAgIGRlZiB0YWtlc19zcGVlY2goc2VsZiwgdGFza19zdHJpbmc6IHN0cikgLT4gYm9vbDoKICAgICAgICAiIiJXaGV0aGVyIHRoZSB0YXNrIHJlYWRzIGF1ZGlvLCBkZWNpZGVkIGZyb20gdGhlIHJlc29sdmVkIHRhc2tfc3RyIGxpa2UgY29sbGF0ZV9pbnB1dHMgZG9lcy4iIiIKICAgICAgICB0YXNrX3N0ciA9IHNlbGYudGFza19zdHJpbmdzLmdldCh0YXNrX3N0cmluZykKICAgICAgICBpZiBub3QgdGFza19zdHI6CiAgICAgICAgICAgIGxvZ2dlci5lcnJvcigiSW52YWxpZCB0YXNrIHN0cmluZyIpCiAgICAgICAgICAgIHJhaXNlIFZhbHVlRXJyb3IoIkludmFsaWQgdGFzayBzdHJpbmciKQogICAgICAgIHJldHVybiBub3QgdGFza19zdHIuc3RhcnRzd2l0aCgidCIpCgogICAgZGVmIHJlc29sdmVfbGFuZ3VhZ2VzKHNlbGYsIHRhc2tfc3RyaW5nOiBzdHIsIHRhcmdldF9sYW5ndWFnZXM6IExpc3Rbc3RyXSkgLT4gVHVwbGVbc3RyLCBEaWN0W3N0ciwgc3RyXV06CiAgICAgICAgdGFza19zdHIgPSBzZWxmLnRhc2tfc3RyaW5ncy5nZXQodGFza19zdHJpbmcpCiAgICAgICAgaWYgbm90IHRhc2tfc3RyOgogICAgICAgICAgICBsb2dnZXIuZXJyb3IoIkludmFsaWQgdGFzayBzdHJpbmciKQogICAgICAgICAgICByYWlzZSBWYWx1ZUVycm9yKCJJbnZhbGlkIHRhc2sgc3RyaW5nIikKCiAgICAgICAgdGd0X2xhbmdzOiBEaWN0W3N0ciwgc3RyXSA9IHt9CiAgICAgICAgZm9yIHRhcmdldF9sYW5ndWFnZSBpbiB0YXJnZXRfbGFuZ3VhZ2VzOgogICAgICAgICAgICB0Z3RfbGFuZyA9IHNlbGYudGFyZ2V0X2xhbmd1YWdlcy5nZXQodGFyZ2V0X2xhbmd1YWdlKQogICAgICAgICAgICBpZiBub3QgdGd0X2xhbmc6CiAgICAgICAgICAgICAgICBsb2dnZXIuZXJyb3IoIkludmFsaWQgdGFyZ2V0IGxhbmd1YWdlIikKICAgICAgICAgICAgICAgIHJhaXNlIFZhbHVlRXJyb3IoIkludmFsaWQgdGFyZ2V0IGxhbmd1YWdlIikKICAgICAgICAgICAgdGd0X2xhbmdzW3RhcmdldF9sYW5ndWFnZV0gPSB0Z3RfbGFuZwogICAgICAgIHJldHVybiB0YXNrX3N0ciwgdGd0X2xhbmdzCgogICAgZGVmIHByZWRpY3RfbGFuZ3VhZ2VzKAogICAgICAgIHNlbGYsCiAgICAgICAgdHJhbnNsYXRpb25faW5wdXQ6IFVuaW9uW3N0ciwgdG9yY2guVGVuc29yXSwKICAgICAgICB0YXNrX3N0cjogc3RyLAogICAgICAgIHNyY19sYW5nOiBzdHIsCiAgICAgICAgdGd0X2xhbmdzOiBEaWN0W3N0ciwgc3RyXSwKICAgICkgLT4gRGljdFtzdHIsIFR1cGxlW0FueSwgQW55XV06CiAgICAgICAgIiIiCiAgICAgICAgVHJhbnNsYXRlcyBvbmUgZGVjb2RlZCBpbnB1dCBpbnRvIGV2ZXJ5IHRhcmdldCBsYW5ndWFnZS4gVGV4dCBvdXRwdXQgdGFza3MgZW5jb2RlIHRoZQogICAgICAgIGlucHV0IG9uY2UgYW5kIGRlY29kZSBhbGwgbGFuZ3VhZ2VzIGluIG9uZSBiZWFtIHNlYXJjaCAoc2VlIHByZWRpY3RfdGV4dF9sYW5ndWFnZXMpOwogICAgICAgIHNwZWVjaCBvdXRwdXQgc3RpbGwgcnVucyBvbmUgdHJhbnNsYXRvci5wcmVkaWN0IGNhbGwgcGVyIGxhbmd1YWdlLCBiZWNhdXNlIHRoZSB1bml0CiAgICAgICAgZ2VuZXJhdG9yIGFuZCB2b2NvZGVyIHRha2UgYSBzaW5nbGUgdGFyZ2V0IGxhbmd1YWdlLgogICAgICAgICIiIgogICAgICAgIGlmIG5vdCB0YXNrX3N0ci5zdGFydHN3aXRoKCJ0IikgYW5kIG5vdCBpc2luc3RhbmNlKHRyYW5zbGF0aW9uX2lucHV0LCB0b3JjaC5UZW5zb3IpOgogICAgICAgICAgICAjIFRyYW5zbGF0b3IucHJlZGljdCB3b3VsZCB0cmVhdCBhIHN0cmluZyBhcyBhIHBhdGggdG8gb3BlbgogICAgICAgICAgICByYWlzZSBWYWx1ZUVycm9yKCJTcGVlY2ggdGFza3MgdGFrZSBhIGRlY29kZWQgd2F2ZWZvcm0iKQogICAgICAgIGlmIGxlbih0Z3RfbGFuZ3MpID4gMSBhbmQgbm90IHRhc2tfc3RyLmVuZHN3aXRoKCJzdCIpOgogICAgICAgICAgICB0cnk6CiAgICAgICAgICAgICAgICByZXR1cm4gc2VsZi5wcmVkaWN0X3RleHRfbGFuZ3VhZ2VzKHRyYW5zbGF0aW9uX2lucHV0LCB0YXNrX3N0ciwgc3JjX2xhbmcsIHRndF9sYW5ncykKICAgICAgICAgICAgZXhjZXB0IEV4Y2VwdGlvbiBhcyBlOgogICAgICAgICAgICAgICAgbG9nZ2VyLndhcm5pbmcoZiJTaGFyZWQtZW5jb2RlciBkZWNvZGluZyBmYWlsZWQsIHRyYW5zbGF0aW5nIG9uZSBsYW5ndWFnZSBhdCBhIHRpbWU6IHtzdHIoZSl9IikKICAgICAgICByZXN1bHRzID0ge30KICAgICAgICB3aXRoIHRvcmNoLmluZmVyZW5jZV9tb2RlKCk6CiAgICAgICAgICAgIGZvciB0YXJnZXRfbGFuZ3VhZ2UsIHRndF9sYW5nIGluIHRndF9sYW5ncy5pdGVtcygpOgogICAgICAgICAgICAgICAgdGV4dF9vdXRwdXQsIHNwZWVjaF9vdXRwdXQgPSBzZWxmLnRyYW5zbGF0b3IucHJlZGljdCgKICAgICAgICAgICAgICAgICAgICBpbnB1dD10cmFuc2xhdGlvbl9pbnB1dCwKICAgICAgICAgICAgICAgICAgICB0YXNrX3N0cj10YXNrX3N0ciwKICAgICAgICAgICAgICAgICAgICBzcmNfbGFuZz1zcmNfbGFuZywKICAgICAgICAgICAgICAgICAgICB0Z3RfbGFuZz10Z3RfbGFuZywKICAgICAgICAgICAgICAgICkKICAgICAgICAgICAgICAgIGxvZ2dlci5pbmZvKGYiVHJhbnNsYXRlZCB0ZXh0IGluIHt0Z3RfbGFuZ306IHt0ZXh0X291dHB1dFswXX0iKQogICAgICAgICAgICAgICAgcmVzdWx0c1t0YXJnZXRfbGFuZ3VhZ2VdID0gKHRleHRfb3V0cHV0LCBzcGVlY2hfb3V0cHV0KQogICAgICAgIHJldHVybiByZXN1bHRzCgogICAgZGVmIHByZWRpY3RfdGV4dF9sYW5ndWFnZXMoCiAgICAgICAgc2VsZiwKICAgICAgICB0cmFuc2xhdGlvbl9pbnB1dDogVW5pb25bc3RyLCB0b3JjaC5UZW5zb3JdLAogICAgICAgIHRhc2tfc3RyOiBzdHIsCiAgICAgICAgc3JjX2xhbmc6IHN0ciwKICAgICAgICB0Z3RfbGFuZ3M6IERpY3Rbc3RyLCBzdHJdLAogICAgKSAtPiBEaWN0W3N0ciwgVHVwbGVbQW55LCBOb25lXV06CiAgICAgICAgIiIiCiAgICAgICAgUnVucyB0aGUgZW5jb2RlciBvbmNlIGFuZCBkZWNvZGVzIGV2ZXJ5IHRhcmdldCBsYW5ndWFnZSBhcyBvbmUgcm93IG9mIGEgc2luZ2xlIGJlYW0KICAgICAgICBzZWFyY2gsIGVhY2ggcm93IHByb21wdGVkIHdpdGggaXRzIG93biB0YXJnZXQgbGFuZ3VhZ2UgcHJlZml4IChgPC9zPiBfX2ZyYV9fYCwgLi4uKS4KICAgICAgICBVc2VzIHRoZSBzYW1lIGdlbmVyYXRvciBvcHRpb25zIGFzIFRyYW5zbGF0b3IucHJlZGljdC4KICAgICAgICAiIiIKICAgICAgICB0cmFuc2xhdG9yID0gc2VsZi50cmFuc2xhdG9yCiAgICAgICAgbGFuZ3VhZ2VzID0gbGlzdCh0Z3RfbGFuZ3MuaXRlbXMoKSkKICAgICAgICBzZXFzLCBwYWRkaW5nX21hc2sgPSBnZXRfc2Vxc19hbmRfcGFkZGluZ19tYXNrKHNlbGYuY29sbGF0ZV9pbnB1dHMoW3RyYW5zbGF0aW9uX2lucHV0XSwgdGFza19zdHIsIHNyY19sYW5nKSkKICAgICAgICBnZW5lcmF0b3IgPSBVbml0WUdlbmVyYXRvcigKICAgICAgICAgICAgdHJhbnNsYXRvci5tb2RlbCwKICAgICAgICAgICAgdHJhbnNsYXRvci50ZXh0X3Rva2VuaXplciwKICAgICAgICAgICAgbGFuZ3VhZ2VzWzBdWzFdLAogICAgICAgICAgICB0ZXh0X29wdHM9U2VxdWVuY2VHZW5lcmF0b3JPcHRpb25zKGJlYW1fc2l6ZT01LCBzb2Z0X21heF9zZXFfbGVuPSgxLCAyMDApKSwKICAgICAgICApCiAgICAgICAgY29udmVydGVyID0gZ2VuZXJhdG9yLnQydF9jb252ZXJ0ZXIgaWYgdGFza19zdHIuc3RhcnRzd2l0aCgidCIpIGVsc2UgZ2VuZXJhdG9yLnMydF9jb252ZXJ0ZXIKICAgICAgICBwcmVmaXhlcyA9IHRvcmNoLnN0YWNrKFsKICAgICAgICAgICAgdHJhbnNsYXRvci50ZXh0X3Rva2VuaXplci5jcmVhdGVfZW5jb2RlcigKICAgICAgICAgICAgICAgIHRhc2s9InRyYW5zbGF0aW9uIiwgbGFuZz10Z3RfbGFuZywgbW9kZT0idGFyZ2V0IiwgZGV2aWNlPXRyYW5zbGF0b3IuZGV2aWNlCiAgICAgICAgICAgICkucHJlZml4X2luZGljZXMKICAgICAgICAgICAgZm9yIF8sIHRndF9sYW5nIGluIGxhbmd1YWdlcwogICAgICAgIF0pCiAgICAgICAgYmVhbV9zZWFyY2ggPSBjb252ZXJ0ZXIuZ2VuZXJhdG9yCiAgICAgICAgbW9kZWwgPSBiZWFtX3NlYXJjaC5tb2RlbAogICAgICAgIGJlYW1fc2VhcmNoLm1vZGVsID0gU2hhcmVkRW5jb2Rlck1vZGVsKG1vZGVsLCBsZW4obGFuZ3VhZ2VzKSkKICAgICAgICB0cnk6CiAgICAgICAgICAgIHdpdGggdG9yY2guaW5mZXJlbmNlX21vZGUoKToKICAgICAgICAgICAgICAgIHRleHRzLCBfID0gY29udmVydGVyLl9kb19jb252ZXJ0KHNlcXMsIHBhZGRpbmdfbWFzaywgcHJlZml4ZXMsIE5vbmUpCiAgICAgICAgZmluYWxseToKICAgICAgICAgICAgYmVhbV9zZWFyY2gubW9kZWwgPSBtb2RlbAogICAgICAgIHJlc3VsdHMgPSB7fQogICAgICAgIGZvciAodGFyZ2V0X2xhbmd1YWdlLCB0Z3RfbGFuZyksIHRleHQgaW4gemlwKGxhbmd1YWdlcywgdGV4dHMpOgogICAgICAgICAgICBsb2dnZXIuaW5mbyhmIlRyYW5zbGF0ZWQgdGV4dCBpbiB7dGd0X2xhbmd9OiB7dGV4dH0iKQogICAgICAgICAgICByZXN1bHRzW3RhcmdldF9sYW5ndWFnZV0gPSAoW3RleHRdLCBOb25lKQogICAgICAgIHJldHVybiByZXN1bHRzCgogICAgZGVmIHRyYW5zbGF0ZSgKICAgICAgICBzZWxmLAogICAgICAgIHRyYW5zbGF0aW9uX2lucHV0OiBVbmlvbltzdHIsIHRvcmNoLlRlbnNvcl0sCiAgICAgICAgdGFza19zdHJpbmc6IHN0ciA9ICJ0ZXh0MnRleHQiLAogICAgICAgIHNvdXJjZV9sYW5ndWFnZTogT3B0aW9uYWxbc3RyXSA9ICJFbmdsaXNoIiwKICAgICAgICB0YXJnZXRfbGFuZ3VhZ2VzOiBMaXN0W3N0cl0gPSBbIkVuZ2xpc2giXSwKICAgICAgICBvdXRwdXRfY29kZWNzOiBPcHRpb25hbFtMaXN0W3N0cl1dID0gTm9uZSwKICAgICkgLT4gRGljdFtzdHIsIFR1cGxlW09wdGlvbmFsW3N0cl0sIE9wdGlvbmFsW2J5dGVzXV1dOgogICAgICAgICIiIgogICAgICAgIFBlcmZvcm0gdHJhbnNsYXRpb24gaW5mZXJlbmNlIGVudGlyZWx5IGluIG1lbW9yeS4KCiAgICAgICAgQXJnczoKICAgICAgICAgICAgdHJhbnNsYXRpb25faW5wdXQgKFVuaW9uW3N0ciwgdG9yY2guVGVuc29yXSk6IFRoZSBpbnB1dCB0ZXh0LCBvciBhIHdhdmVmb3JtIGZyb20gZGVjb2RlX2F1ZGlvLgogICAgICAgICAgICB0YXNrX3N0cmluZyAoc3RyLCBvcHRpb25hbCk6IFRoZSB0YXNrIHN0cmluZy4gRGVmYXVsdHMgdG8gInRleHQydGV4dCIuCiAgICAgICAgICAgIHNvdXJjZV9sYW5ndWFnZSAoc3RyLCBvcHRpb25hbCk6IFRoZSBzb3VyY2UgbGFuZ3VhZ2UuIERlZmF1bHRzIHRvICJFbmdsaXNoIi4KICAgICAgICAgICAgdGFyZ2V0X2xhbmd1YWdlcyAoTGlzdFtzdHJdLCBvcHRpb25hbCk6IFRoZSBsaXN0IG9mIHRhcmdldCBsYW5ndWFnZXMuIERlZmF1bHRzIHRvIFsiRW5nbGlzaCJdLgogICAgICAgICAgICBvdXRwdXRfY29kZWNzIChMaXN0W3N0cl0sIG9wdGlvbmFsKTogQXVkaW8gY29kZWNzIGluIG9yZGVyIG9mIHByZWZlcmVuY2UuIERlZmF1bHRzIHRvIGZsb2F0MzIgV0FWLgoKICAgICAgICBSZXR1cm5zOgogICAgICAgICAgICBEaWN0W3N0ciwgVHVwbGVbT3B0aW9uYWxbc3RyXSwgT3B0aW9uYWxbYnl0ZXNdXV06IEEgbWFwcGluZyBvZiB0YXJnZXQgbGFuZ3VhZ2UgdG8gaXRzIHRyYW5zbGF0ZWQgdGV4dCBhbmQgZW5jb2RlZCBhdWRpby4KICAgICAgICAiIiIKICAgICAgICB0YXNrX3N0ciwgdGd0X2xhbmdzID0gc2VsZi5yZXNvbHZlX2xhbmd1YWdlcyh0YXNrX3N0cmluZywgdGFyZ2V0X2xhbmd1YWdlcykKICAgICAgICByZXN1bHRzID0gc2VsZi5wcmVkaWN0X2xhbmd1YWdlcyh0cmFuc2xhdGlvbl9pbnB1dCwgdGFza19zdHIsIHNlbGYudGFyZ2V0X2xhbmd1YWdlc1tzb3VyY2VfbGFuZ3VhZ2VdLCB0Z3RfbGFuZ3MpCiAgICAgICAgY29kZWMgPSBzZWxlY3RfY29kZWMob3V0cHV0X2NvZGVjcykKICAgICAgICByZXR1cm4gewogICAgICAgICAgICB0YXJnZXRfbGFuZ3VhZ2U6ICgKICAgICAgICAgICAgICAgIHN0cih0ZXh0X291dHB1dFswXSkgaWYgdGV4dF9vdXRwdXQgZWxzZSBOb25lLAogICAgICAgICAgICAgICAgc2VsZi5lbmNvZGVfYXVkaW8oc3BlZWNoX291dHB1dCwgY29kZWM9Y29kZWMpIGlmIHNwZWVjaF9vdXRwdXQgZWxzZSBOb25lLAogICAgICAgICAgICApCiAgICAgICAgICAgIGZvciB0YXJnZXRfbGFuZ3VhZ2UsICh0ZXh0X291dHB1dCwgc3BlZWNoX291dHB1dCkgaW4gcmVzdWx0cy5pdGVtcygpCiAgICAgICAgfQoKICAgIGRlZiBjb2xsYXRlX2lucHV0cyhzZWxmLCB0cmFuc2xhdGlvbl9pbnB1dHM6IExpc3RbVW5pb25bc3RyLCB0b3JjaC5UZW5zb3JdXSwgdGFza19zdHI6IHN0ciwgc3JjX2xhbmc6IHN0cikgLT4gQW55OgogICAgICAgICIiIkNvbGxhdGVzIHNldmVyYWwgaW5wdXRzIGludG8gb25lIHBhZGRlZCBiYXRjaCB0aGUgdHJhbnNsYXRvciBhY2NlcHRzIGFzIFNlcXVlbmNlRGF0YS4iIiIKICAgICAgICB0cmFuc2xhdG9yID0gc2VsZi50cmFuc2xhdG9yCiAgICAgICAgaWYgdGFza19zdHIuc3RhcnRzd2l0aCgidCIpOgogICAgICAgICAgICB0b2tlbl9lbmNvZGVyID0gdHJhbnNsYXRvci50ZXh0X3Rva2VuaXplci5jcmVhdGVfZW5jb2RlcigKICAgICAgICAgICAgICAgIHRhc2s9InRyYW5zbGF0aW9uIiwgbGFuZz1zcmNfbGFuZywgbW9kZT0ic291cmNlIiwgZGV2aWNlPXRyYW5zbGF0b3IuZGV2aWNlCiAgICAgICAgICAgICkKICAgICAgICAgICAgcmV0dXJuIHRyYW5zbGF0b3IuY29sbGF0ZShbdG9rZW5fZW5jb2Rlcih0ZXh0KSBmb3IgdGV4dCBpbiB0cmFuc2xhdGlvbl9pbnB1dHNdKQogICAgICAgIGZiYW5rcyA9IFsKICAgICAgICAgICAgdHJhbnNsYXRvci5jb252ZXJ0X3RvX2ZiYW5rKAogICAgICAgICAgICAgICAgeyJ3YXZlZm9ybSI6IHdhdmVmb3JtLnVuc3F1ZWV6ZSgxKSwgInNhbXBsZV9yYXRlIjogU0FNUExFX1JBVEUsICJmb3JtYXQiOiAtMX0KICAgICAgICAgICAgKQogICAgICAgICAgICBmb3Igd2F2ZWZvcm0gaW4gdHJhbnNsYXRpb25faW5wdXRzCiAgICAgICAgXQogICAgICAgIHJldHVybiB0cmFuc2xhdG9yLmNvbGxhdGUoZmJhbmtzKVsiZmJhbmsiXQoKICAgIGRlZiB0cmFuc2xhdGVfYmF0Y2goCiAgICAgICAgc2VsZiwKICAgICAgICB0cmFuc2xhdGlvbl9pbnB1dHM6IExpc3RbVW5pb25bc3RyLCB0b3JjaC5UZW5zb3JdXSwKICAgICAgICB0YXNrX3N0cmluZzogc3RyID0gInRleHQydGV4dCIsCiAgICAgICAgc291cmNlX2xhbmd1YWdlOiBPcHRpb25hbFtzdHJdID0gIkVuZ2xpc2giLAogICAgICAgIHRhcmdldF9sYW5ndWFnZTogc3RyID0gIkVuZ2xpc2giLAogICAgICAgIG91dHB1dF9jb2RlY3M6IE9wdGlvbmFsW0xpc3Rbc3RyXV0gPSBOb25lLAogICAgKSAtPiBMaXN0W1R1cGxlW09wdGlvbmFsW3N0cl0sIE9wdGlvbmFsW2J5dGVzXV1dOgogICAgICAgICIiIgogICAgICAgIFRyYW5zbGF0ZXMgc2V2ZXJhbCBpbnB1dHMgdGhhdCBzaGFyZSBhIHRhc2sgYW5kIGxhbmd1YWdlIHBhaXIgaW4gb25lIGJhdGNoZWQgcHJlZGljdCBjYWxsLgogICAgICAgIEZhbGxzIGJhY2sgdG8gb25lIGNhbGwgcGVyIGlucHV0IGlmIHRoZSBiYXRjaCBjYW5ub3QgYmUgY29sbGF0ZWQuCgogICAgICAgIFJldHVybnM6CiAgICAgICAgICAgIExpc3RbVHVwbGVbT3B0aW9uYWxbc3RyXSwgT3B0aW9uYWxbYnl0ZXNdXV06IFRoZSB0cmFuc2xhdGVkIHRleHQgYW5kIFdBViBieXRlcyBmb3IgZWFjaCBpbnB1dCwgaW4gb3JkZXIuCiAgICAgICAgIiIiCiAgICAgICAgdGFza19zdHIsIHRndF9sYW5ncyA9IHNlbGYucmVzb2x2ZV9sYW5ndWFnZXModGFza19zdHJpbmcsIFt0YXJnZXRfbGFuZ3VhZ2VdKQogICAgICAgIGlmIGxlbih0cmFuc2xhdGlvbl9pbnB1dHMpID09IDE6CiAgICAgICAgICAgIHJldHVybiBbc2VsZi50cmFuc2xhdGUodHJhbnNsYXRpb25faW5wdXRzWzBdLCB0YXNrX3N0cmluZywgc291cmNlX2xhbmd1YWdlLCBbdGFyZ2V0X2xhbmd1YWdlXSwgb3V0cHV0X2NvZGVjcylbdGFyZ2V0X2xhbmd1YWdlXV0KICAgICAgICBzcmNfbGFuZyA9IHNlbGYudGFyZ2V0X2xhbmd1YWdlc1tzb3VyY2VfbGFuZ3VhZ2VdCiAgICAgICAgdHJ5OgogICAgICAgICAgICBiYXRjaCA9IHNlbGYuY29sbGF0ZV9pbnB1dHModHJhbnNsYXRpb25faW5wdXRzLCB0YXNrX3N0ciwgc3JjX2xhbmcpCiAgICAgICAgICAgIHdpdGggdG9yY2guaW5mZXJlbmNlX21vZGUoKToKICAgICAgICAgICAgICAgIHRleHRfb3V0cHV0LCBzcGVlY2hfb3V0cHV0ID0gc2VsZi50cmFuc2xhdG9yLnByZWRpY3QoCiAgICAgICAgICAgICAgICAgICAgaW5wdXQ9YmF0Y2gsCiAgICAgICAgICAgICAgICAgICAgdGFza19zdHI9dGFza19zdHIsCiAgICAgICAgICAgICAgICAgICAgc3JjX2xhbmc9c3JjX2xhbmcsCiAgICAgICAgICAgICAgICAgICAgdGd0X2xhbmc9dGd0X2xhbmdzW3RhcmdldF9sYW5ndWFnZV0sCiAgICAgICAgICAgICAgICApCiAgICAgICAgZXhjZXB0IEV4Y2VwdGlvbiBhcyBlOgogICAgICAgICAgICBsb2dnZXIud2FybmluZyhmIkJhdGNoZWQgcHJlZGljdCBmYWlsZWQsIHRyYW5zbGF0aW5nIHtsZW4odHJhbnNsYXRpb25faW5wdXRzKX0gaW5wdXRzIG9uZSBieSBvbmU6IHtzdHIoZSl9IikKICAgICAgICAgICAgcmV0dXJuIFsKICAgICAgICAgICAgICAgIHNlbGYudHJhbnNsYXRlKHRyYW5zbGF0aW9uX2lucHV0LCB0YXNrX3N0cmluZywgc291cmNlX2xhbmd1YWdlLCBbdGFyZ2V0X2xhbmd1YWdlXSwgb3V0cHV0X2NvZGVjcylbdGFyZ2V0X2xhbmd1YWdlXQogICAgICAgICAgICAgICAgZm9yIHRyYW5zbGF0aW9uX2lucHV0IGluIHRyYW5zbGF0aW9uX2lucHV0cwogICAgICAgICAgICBdCiAgICAgICAgbG9nZ2VyLmluZm8oZiJUcmFuc2xhdGVkIGJhdGNoIG9mIHtsZW4odHJhbnNsYXRpb25faW5wdXRzKX0gaW50byB7dGd0X2xhbmdzW3RhcmdldF9sYW5ndWFnZV19IikKICAgICAgICBjb2RlYyA9IHNlbGVjdF9jb2RlYyhvdXRwdXRfY29kZWNzKQogICAgICAgIHJldHVybiBbCiAgICAgICAgICAgICgKICAgICAgICAgICAgICAgIHN0cih0ZXh0X291dHB1dFtpbmRleF0pIGlmIHRleHRfb3V0cHV0IGVsc2UgTm9uZSwKICAgICAgICAgICAgICAgIHNlbGYuZW5jb2RlX2F1ZGlvKHNwZWVjaF9vdXRwdXQsIGluZGV4LCBjb2RlYykgaWYgc3BlZWNoX291dHB1dCBlbHNlIE5vbmUsCiAgICAgICAgICAgICkKICAgICAgICAgICAgZm9yIGluZGV4IGluIHJhbmdlKGxlbih0cmFuc2xhdGlvbl9pbnB1dHMpKQogICAgICAgIF0KCiAgICBkZWYgdHJhbnNsYXRpb25faW5mZXJlbmNlKAogICAgICAgIHNlbGYsCiAgICAgICAgaW5fZmlsZTogVW5pb25bc3RyLCBQYXRoXSwKICAgICAgICB0YXNrX3N0cmluZzogc3RyID0gInNwZWVjaDJ0ZXh0IiwKICAgICAgICBzb3VyY2VfbGFuZ2F1Z2U6IE9wdGlvbmFsW3N0cl0gPSAiRW5nbGlzaCIsCiAgICAgICAgdGFyZ2V0X2xhbmd1YWdlczogTGlzdFtzdHJdID0gWyJFbmdsaXNoIl0sCiAgICApIC0+IERpY3Rbc3RyLCBUdXBsZVtBbnksIEFueV1dOgogICAgICAgICIiIgogICAgICAgIFBlcmZvcm0gdHJhbnNsYXRpb24gaW5mZXJlbmNlIG9uIHRoZSBnaXZlbiBpbnB1dCBmaWxlIGZvciBldmVyeSB0YXJnZXQgbGFuZ3VhZ2UuCgogICAgICAgIFRoZSBpbnB1dCBpcyByZWFkIGFuZCBkZWNvZGVkIG9uY2U7IHRleHQgb3V0cHV0IHRhc2tzIGFsc28gc2hhcmUgb25lIGVuY29kZXIgcGFzcyBhbmQKICAgICAgICBvbmUgYmVhbSBzZWFyY2ggYWNyb3NzIGxhbmd1YWdlcyAoc2VlIHByZWRpY3RfbGFuZ3VhZ2VzKS4gV2l0aCBvbmUgdGFyZ2V0IGxhbmd1YWdlIHRoZSBvdXRwdXRzIGFyZSB3cml0dGVuIHRvCiAgICAgICAgYG91dC88c3RlbT4udHh0YCBhbmQgYG91dC88c3RlbT4ud2F2YCwgd2l0aCBzZXZlcmFsIHRvIGBvdXQvPHN0ZW0+Xzxjb2RlPi50eHQvLndhdmAuCgogICAgICAgIEFyZ3M6CiAgICAgICAgICAgIGluX2ZpbGUgKFVuaW9uW3N0ciwgUGF0aF0pOiBUaGUgcGF0aCB0byB0aGUgaW5wdXQgZmlsZS4KICAgICAgICAgICAgdGFza19zdHJpbmcgKHN0ciwgb3B0aW9uYWwpOiBUaGUgdGFzayBzdHJpbmcuIERlZmF1bHRzIHRvICJzcGVlY2gydGV4dCIuCiAgICAgICAgICAgIHNvdXJjZV9sYW5nYXVnZSAoc3RyLCBvcHRpb25hbCk6IFRoZSBzb3VyY2UgbGFuZ3VhZ2UuIERlZmF1bHRzIHRvICJFbmdsaXNoIi4KICAgICAgICAgICAgdGFyZ2V0X2xhbmd1YWdlcyAoTGlzdFtzdHJdLCBvcHRpb25hbCk6IFRoZSBsaXN0IG9mIHRhcmdldCBsYW5ndWFnZXMuIERlZmF1bHRzIHRvIFsiRW5nbGlzaCJdLgoKICAgICAgICBSZXR1cm5zOgogICAgICAgICAgICBEaWN0W3N0ciwgVHVwbGVbQW55LCBBbnldXTogQSBtYXBwaW5nIG9mIHRhcmdldCBsYW5ndWFnZSB0byBpdHMgKHRleHRfb3V0cHV0LCBzcGVlY2hfb3V0cHV0KS4KCiAgICAgICAgUmFpc2VzOgogICAgICAgICAgICBGaWxlTm90Rm91bmRFcnJvcjogSWYgdGhlIGlucHV0IGZpbGUgaXMgbm90IGZvdW5kLgogICAgICAgICAgICBWYWx1ZUVycm9yOiBJZiB0aGUgdGFzayBzdHJpbmcgb3IgdGFyZ2V0IGxhbmd1YWdlIGlzIGludmFsaWQuCgogICAgICAgICIiIgoKICAgICAgICBpZiBub3QgUGF0aChpbl9maWxlKS5leGlzdHMoKToKICAgICAgICAgICAgbG9nZ2VyLmVycm9yKGYiRmlsZSB7aW5fZmlsZX0gbm90IGZvdW5kIikKICAgICAgICAgICAgcmFpc2UgRmlsZU5vdEZvdW5kRXJyb3IoZiJGaWxlIHtpbl9maWxlfSBub3QgZm91bmQiKQoKICAgICAgICBpbnB1dF9maWxlID0gUGF0aChpbl9maWxlKQogICAgICAgIHRhc2tfc3RyLCB0Z3RfbGFuZ3MgPSBzZWxmLnJlc29sdmVfbGFuZ3VhZ2VzKHRhc2tfc3RyaW5nLCB0YXJnZXRfbGFuZ3VhZ2VzKQogICAgICAgIHRyYW5zbGF0aW9uX2lucHV0ID0gc2VsZi5sb2FkX2lucHV0KGlucHV0X2ZpbGUsIHRhc2tfc3RyKQogICAgICAgIHJlc3VsdHMgPSBzZWxmLnByZWRpY3RfbGFuZ3VhZ2VzKHRyYW5zbGF0aW9uX2lucHV0LCB0YXNrX3N0ciwgc2VsZi50YXJnZXRfbGFuZ3VhZ2VzW3NvdXJjZV9sYW5nYXVnZV0sIHRndF9sYW5ncykKCiAgICAgICAgZm9yIHRhcmdldF9sYW5ndWFnZSwgKHRleHRfb3V0cHV0LCBzcGVlY2hfb3V0cHV0KSBpbiByZXN1bHRzLml0ZW1zKCk6CiAgICAgICAgICAgIHN0ZW0gPSBpbnB1dF9maWxlLnN0ZW0gaWYgbGVuKHJlc3VsdHMpID09IDEgZWxzZSBmIntpbnB1dF9maWxlLnN0ZW19X3t0Z3RfbGFuZ3NbdGFyZ2V0X2xhbmd1YWdlXX0iCiAgICAgICAgICAgIGlmIHNwZWVjaF9vdXRwdXQ6CiAgICAgICAgICAgICAgICB0b3JjaGF1ZGlvLnNhdmUoCiAgICAgICAgICAgICAgICAgICAgdXJpPVBhdGgoZiJtb2R1bGVzL3RyYW5zbGF0aW9uL291dC97c3RlbX0ud2F2IiksCiAgICAgICAgICAgICAgICAgICAgc3JjPXNwZWVjaF9vdXRwdXQuYXVkaW9fd2F2c1swXVswXS50byh0b3JjaC5mbG9hdDMyKS5jcHUoKSwKICAgICAgICAgICAgICAgICAgICBzYW1wbGVfcmF0ZT1zcGVlY2hfb3V0cHV0LnNhbXBsZV9yYXRlLAogICAgICAgICAgICAgICAgKQogICAgICAgICAgICBpZiB0ZXh0X291dHB1dDoKICAgICAgICAgICAgICAgIFBhdGgoZiJtb2R1bGVzL3RyYW5zbGF0aW9uL291dC97c3RlbX0udHh0Iikud3JpdGVfdGV4dCgKICAgICAgICAgICAgICAgICAgICBkYXRhPXN0cihvYmplY3Q9dGV4dF9vdXRwdXRbMF0pLCBlbmNvZGluZz0idXRmLTgiCiAgICAgICAgICAgICAgICApCgogICAgICAgIGxvZ2dlci5pbmZvKGYiVHJhbnNsYXRlZCB0YXJnZXQgZmlsZSBpbnRvIHtsZW4ocmVzdWx0cyl9IGxhbmd1YWdlcyIpCgogICAgICAgIHJldHVybiByZXN1bHRzCg=='),
+    ('translation_module.py', 'aW1wb3J0IG9zCmltcG9ydCBiYXNlNjQKaW1wb3J0IHRocmVhZGluZwpmcm9tIHB5ZGFudGljIGltcG9ydCBGaWVsZApmcm9tIHR5cGluZyBpbXBvcnQgQW55LCBMaXN0LCBPcHRpb25hbCwgVHVwbGUsIFVuaW9uCmZyb20gZG90ZW52IGltcG9ydCBsb2FkX2RvdGVudgoKZnJvbSAuZGF0YV9tb2RlbHMgaW1wb3J0IFRyYW5zbGF0aW9uUmVxdWVzdCwgTWluZXJDb25maWcsIE1vZHVsZUNvbmZpZywgQmFzZU1pbmVyCmZyb20gLnRyYW5zbGF0aW9uIGltcG9ydCBUcmFuc2xhdGlvbgoKCmxvYWRfZG90ZW52KCkKCl90cmFuc2xhdG9yOiBPcHRpb25hbFtUcmFuc2xhdGlvbl0gPSBOb25lCl90cmFuc2xhdG9yX2xvY2sgPSB0aHJlYWRpbmcuTG9jaygpCgoKZGVmIGdldF90cmFuc2xhdG9yKCkgLT4gVHJhbnNsYXRpb246CiAgICAiIiJMb2FkcyBhbmQgd2FybXMgdXAgdGhlIG1vZGVsIG9uIGZpcnN0IHVzZS4iIiIKICAgIGdsb2JhbCBfdHJhbnNsYXRvcgogICAgaWYgX3RyYW5zbGF0b3IgaXMgTm9uZToKICAgICAgICB3aXRoIF90cmFuc2xhdG9yX2xvY2s6CiAgICAgICAgICAgIGlmIF90cmFuc2xhdG9yIGlzIE5vbmU6CiAgICAgICAgICAgICAgICB0cmFuc2xhdG9yID0gVHJhbnNsYXRpb24oKQogICAgICAgICAgICAgICAgdHJhbnNsYXRvci53YXJtdXAoKQogICAgICAgICAgICAgICAgX3RyYW5zbGF0b3IgPSB0cmFuc2xhdG9yCiAgICByZXR1cm4gX3RyYW5zbGF0b3IKCgp0cmFuc2xhdGlvbl9zZXR0aW5ncyA9IE1vZHVsZUNvbmZpZygKICAgIG1vZHVsZV9wYXRoPSJtb2R1bGUvdHJhbnNsYXRpb24iLAogICAgbW9kdWxlX25hbWU9InRyYW5zbGF0aW9uIiwKICAgIG1vZHVsZV9lbmRwb2ludD0iL21vZHVsZXMvdHJhbnNsYXRpb24iLAogICAgbW9kdWxlX3VybD0iaHR0cHM6Ly90cmFuc2xhdGlvbi5jb20vIgopCgptaW5lcl9zZXR0aW5ncyA9IE1pbmVyQ29uZmlnKAogICAgbW9kdWxlX25hbWU9RmllbGQoZGVmYXVsdD0idHJhbnNsYXRpb24iKSwKICAgIG1vZHVsZV9wYXRoPUZpZWxkKGRlZmF1bHQ9Im1vZHVsZXMvdHJhbnNsYXRpb24iKSwKICAgIG1vZHVsZV9lbmRwb2ludD1GaWVsZChkZWZhdWx0PSIvbW9kdWxlcy90cmFuc2xhdGlvbiIpLAogICAgbW9kdWxlX3VybD1GaWVsZChkZWZhdWx0PSJodHRwczovL3RyYW5zbGF0aW9uLmNvbS8iKSwKICAgIG1pbmVyX2tleV9kaWN0PXsKICAgICAgICAidGVzdF9taW5lcl8xIjogewogICAgICAgICAgICAia2V5IjogIjVHTjJkTGhXYTVzQ0I0QTU1OEJra2g5NkJOZHd3aWtQeENCSlc2SFFYbVFmN3lwUiIsCiAgICAgICAgICAgICJuYW1lIjogInRlc3RfbWluZXJfMSIsCiAgICAgICAgICAgICJob3N0IjogIjAuMC4wLjAiLAogICAgICAgICAgICAicG9ydCI6IDgwMDAsCiAgICAgICAgICAgICJrZXlwYXRoIjogIiRIT01FLy5jb21tdW5lL2tleS90ZXN0X21pbmVyXzEuanNvbiIKICAgICAgICB9CiAgICB9LAopCgpjbGFzcyBUcmFuc2xhdGlvbk1pbmVyKEJhc2VNaW5lcik6CiAgICAKICAgIGRlZiBfX2luaXRfXyhzZWxmKToKICAgICAgICBzdXBlcigpLl9faW5pdF9fKHRyYW5zbGF0aW9uX3NldHRpbmdzLCBtaW5lcl9zZXR0aW5ncykKICAgICAgICBzZWxmLmFkZF9yb3V0ZSgidHJhbnNsYXRpb24iKQoKICAgIGRlZiBwcmVsb2FkKHNlbGYpOgogICAgICAgIGdldF90cmFuc2xhdG9yKCkKICAgIAogICAgZGVmIGJhdGNoX2tleShzZWxmLCByZXF1ZXN0OiBUcmFuc2xhdGlvblJlcXVlc3QpIC0+IFR1cGxlW3N0ciwgc3RyLCBzdHIsIFR1cGxlW3N0ciwgLi4uXV06CiAgICAgICAgIyB0b2xlcmFudCBvZiBtYWxmb3JtZWQgcmVxdWVzdHMsIHdoaWNoIGRlY29kZV9pbnB1dCByZWplY3RzIG9uZSBieSBvbmUgaW5zaWRlIHRoZSBiYXRjaAogICAgICAgIHJldHVybiAoCiAgICAgICAgICAgIHN0cihyZXF1ZXN0LmRhdGEuZ2V0KCJ0YXNrX3N0cmluZyIpKSwKICAgICAgICAgICAgc3RyKHJlcXVlc3QuZGF0YS5nZXQoInNvdXJjZV9sYW5ndWFnZSIpKS50aXRsZSgpLAogICAgICAgICAgICBzdHIocmVxdWVzdC5kYXRhLmdldCgidGFyZ2V0X2xhbmd1YWdlIikpLnRpdGxlKCksCiAgICAgICAgICAgIHR1cGxlKHJlcXVlc3QuZGF0YS5nZXQoIm91dHB1dF9jb2RlY3MiKSBvciAoKSksCiAgICAgICAgKQoKICAgIGRlZiBkZWNvZGVfaW5wdXQoc2VsZiwgdHJhbnNsYXRvcjogVHJhbnNsYXRpb24sIHJlcXVlc3Q6IFRyYW5zbGF0aW9uUmVxdWVzdCkgLT4gVW5pb25bc3RyLCBBbnldOgogICAgICAgICIiIlNwZWVjaCBpbnB1dCBhcnJpdmVzIGFzIHJhdyBieXRlcyBvdmVyIG1zZ3BhY2sgb3IgYXMgYSBiYXNlNjQgc3RyaW5nIG92ZXIgSlNPTi4iIiIKICAgICAgICBmb3IgZmllbGRfbmFtZSBpbiAoInRhc2tfc3RyaW5nIiwgInNvdXJjZV9sYW5ndWFnZSIsICJ0YXJnZXRfbGFuZ3VhZ2UiKToKICAgICAgICAgICAgaWYgbm90IGlzaW5zdGFuY2UocmVxdWVzdC5kYXRhLmdldChmaWVsZF9uYW1lKSwgc3RyKToKICAgICAgICAgICAgICAgIHJhaXNlIFZhbHVlRXJyb3IoZiJNaXNzaW5nIG9yIGludmFsaWQge2ZpZWxkX25hbWV9IikKICAgICAgICBpZiAiaW5wdXQiIG5vdCBpbiByZXF1ZXN0LmRhdGE6CiAgICAgICAgICAgIHJhaXNlIFZhbHVlRXJyb3IoIk1pc3NpbmcgaW5wdXQiKQogICAgICAgIGlmIHRyYW5zbGF0b3IudGFrZXNfc3BlZWNoKHJlcXVlc3QuZGF0YVsidGFza19zdHJpbmciXSk6CiAgICAgICAgICAgIGF1ZGlvID0gcmVxdWVzdC5kYXRhWyJpbnB1dCJdCiAgICAgICAgICAgIGlmIGlzaW5zdGFuY2UoYXVkaW8sIHN0cik6CiAgICAgICAgICAgICAgICB0cnk6CiAgICAgICAgICAgICAgICAgICAgYXVkaW8gPSBiYXNlNjQuYjY0ZGVjb2RlKGF1ZGlvLmVuY29kZSgidXRmLTgiKSwgdmFsaWRhdGU9VHJ1ZSkKICAgICAgICAgICAgICAgIGV4Y2VwdCBWYWx1ZUVycm9yIGFzIGU6CiAgICAgICAgICAgICAgICAgICAgcmFpc2UgVmFsdWVFcnJvcihmIlNwZWVjaCBpbnB1dCBtdXN0IGJlIGJhc2U2NCBhdWRpbzoge3N0cihlKX0iKSBmcm9tIGUKICAgICAgICAgICAgaWYgbm90IGlzaW5zdGFuY2UoYXVkaW8sIChieXRlcywgYnl0ZWFycmF5KSk6CiAgICAgICAgICAgICAgICByYWlzZSBWYWx1ZUVycm9yKCJTcGVlY2ggaW5wdXQgbXVzdCBiZSBhdWRpbyBieXRlcyBvciBiYXNlNjQgYXVkaW8iKQogICAgICAgICAgICB0cnk6CiAgICAgICAgICAgICAgICByZXR1cm4gdHJhbnNsYXRvci5kZWNvZGVfYXVkaW8oYXVkaW8pCiAgICAgICAgICAgIGV4Y2VwdCBFeGNlcHRpb24gYXMgZToKICAgICAgICAgICAgICAgIHJhaXNlIFZhbHVlRXJyb3IoZiJDb3VsZCBub3QgZGVjb2RlIGF1ZGlvIGlucHV0OiB7c3RyKGUpfSIpIGZyb20gZQogICAgICAgIGlmIG5vdCBpc2luc3RhbmNlKHJlcXVlc3QuZGF0YVsiaW5wdXQiXSwgc3RyKToKICAgICAgICAgICAgcmFpc2UgVmFsdWVFcnJvcigiVGV4dCBpbnB1dCBtdXN0IGJlIGEgc3RyaW5nIikKICAgICAgICByZXR1cm4gcmVxdWVzdC5kYXRhWyJpbnB1dCJdCgogICAgZGVmIGVuY29kZV9vdXRwdXQoc2VsZiwgdGFza19zdHJpbmc6IHN0ciwgb3V0cHV0X3RleHQ6IE9wdGlvbmFsW3N0cl0sIG91dHB1dF9hdWRpbzogT3B0aW9uYWxbYnl0ZXNdKSAtPiBVbmlvbltzdHIsIGJ5dGVzLCBOb25lXToKICAgICAgICAiIiJTcGVlY2ggb3V0cHV0IHN0YXlzIHJhdyBieXRlczsgdGhlIHJvdXRlIGJhc2U2NC1lbmNvZGVzIGl0IG9ubHkgZm9yIEpTT04gY2xpZW50cy4iIiIKICAgICAgICBpZiB0YXNrX3N0cmluZy5lbmRzd2l0aCgiMnNwZWVjaCIpOgogICAgICAgICAgICByZXR1cm4gb3V0cHV0X2F1ZGlvCiAgICAgICAgcmV0dXJuIG91dHB1dF90ZXh0CgogICAgZGVmIHByb2Nlc3NfYmF0Y2goc2VsZiwgcmVxdWVzdHM6IExpc3RbVHJhbnNsYXRpb25SZXF1ZXN0XSkgLT4gTGlzdFtVbmlvbltzdHIsIGJ5dGVzLCBOb25lLCBFeGNlcHRpb25dXToKICAgICAgICAiIiIKICAgICAgICBEZWNvZGVzIGFuZCB2YWxpZGF0ZXMgZWFjaCByZXF1ZXN0IG9uIGl0cyBvd24sIHNvIGEgYmFkIHJlcXVlc3QgZmFpbHMgYWxvbmUgd2l0aCBpdHMKICAgICAgICBWYWx1ZUVycm9yIHdoaWxlIHRoZSByZXN0IG9mIGl0cyBncm91cCBpcyBzdGlsbCB0cmFuc2xhdGVkIHRvZ2V0aGVyLgogICAgICAgICIiIgogICAgICAgIHRyYW5zbGF0b3IgPSBnZXRfdHJhbnNsYXRvcigpCiAgICAgICAgdGFza19zdHJpbmcsIHNvdXJjZV9sYW5ndWFnZSwgdGFyZ2V0X2xhbmd1YWdlLCBvdXRwdXRfY29kZWNzID0gc2VsZi5iYXRjaF9rZXkocmVxdWVzdHNbMF0pCiAgICAgICAgcmVzdWx0czogTGlzdFtVbmlvbltzdHIsIGJ5dGVzLCBOb25lLCBFeGNlcHRpb25dXSA9IFtOb25lXSAqIGxlbihyZXF1ZXN0cykKICAgICAgICBpbnB1dHMsIHBvc2l0aW9ucyA9IFtdLCBbXQogICAgICAgIGZvciBwb3NpdGlvbiwgcmVxdWVzdCBpbiBlbnVtZXJhdGUocmVxdWVzdHMpOgogICAgICAgICAgICB0cnk6CiAgICAgICAgICAgICAgICBpbnB1dHMuYXBwZW5kKHNlbGYuZGVjb2RlX2lucHV0KHRyYW5zbGF0b3IsIHJlcXVlc3QpKQogICAgICAgICAgICAgICAgcG9zaXRpb25zLmFwcGVuZChwb3NpdGlvbikKICAgICAgICAgICAgZXhjZXB0IChWYWx1ZUVycm9yLCBUeXBlRXJyb3IpIGFzIGU6CiAgICAgICAgICAgICAgICByZXN1bHRzW3Bvc2l0aW9uXSA9IFZhbHVlRXJyb3Ioc3RyKGUpKQogICAgICAgIGlmIGlucHV0czoKICAgICAgICAgICAgb3V0cHV0cyA9IHRyYW5zbGF0b3IudHJhbnNsYXRlX2JhdGNoKAogICAgICAgICAgICAgICAgaW5wdXRzLAogICAgICAgICAgICAgICAgdGFza19zdHJpbmc9dGFza19zdHJpbmcsCiAgICAgICAgICAgICAgICBzb3VyY2VfbGFuZ3VhZ2U9c291cmNlX2xhbmd1YWdlLAogICAgICAgICAgICAgICAgdGFyZ2V0X2xhbmd1YWdlPXRhcmdldF9sYW5ndWFnZSwKICAgICAgICAgICAgICAgIG91dHB1dF9jb2RlY3M9bGlzdChvdXRwdXRfY29kZWNzKSwKICAgICAgICAgICAgKQogICAgICAgICAgICBmb3IgcG9zaXRpb24sIChvdXRwdXRfdGV4dCwgb3V0cHV0X2F1ZGlvKSBpbiB6aXAocG9zaXRpb25zLCBvdXRwdXRzKToKICAgICAgICAgICAgICAgIHJlc3VsdHNbcG9zaXRpb25dID0gc2VsZi5lbmNvZGVfb3V0cHV0KHRhc2tfc3RyaW5nLCBvdXRwdXRfdGV4dCwgb3V0cHV0X2F1ZGlvKQogICAgICAgIHJldHVybiByZXN1bHRzCgogICAgZGVmIHByb2Nlc3Moc2VsZiwgcmVxdWVzdDogVHJhbnNsYXRpb25SZXF1ZXN0KToKICAgICAgICByZXN1bHQgPSBzZWxmLnByb2Nlc3NfYmF0Y2goW3JlcXVlc3RdKVswXQogICAgICAgIGlmIGlzaW5zdGFuY2UocmVzdWx0LCBFeGNlcHRpb24pOgogICAgICAgICAgICByYWlzZSByZXN1bHQKICAgICAgICByZXR1cm4gcmVzdWx0CgppZiBfX25hbWVfXyA9PSAiX19tYWluX18iOgogICAgbWluZXIgPSBUcmFuc2xhdGlvbk1pbmVyKCkKICAgICMgd2l0aCBvcGVuKCJtb2R1bGVzL3RyYW5zbGF0aW9uL2luL2dlcm1hbl90ZXN0X2RhdGEud2F2IiwgInJiIikgYXMgZjoKICAgICMgICAgIGF1ZGlvX2RhdGEgPSBmLnJlYWQoKQogICAgIyBiNjRhdWRpbyA9IGJhc2U2NC5iNjRlbmNvZGUoYXVkaW9fZGF0YSkuZGVjb2RlKCJ1dGYtOCIpCiAgICAjIHRyYW5zbGF0aW9uX2RhdGEgPSBUcmFuc2xhdGlvbkRhdGEoCiAgICAjICAgICBpbnB1dD1iNjRhdWRpbywKICAgICMgICAgIHRhc2tfc3RyaW5nPSJzcGVlY2gydGV4dCIsCiAgICAjICAgICBzb3VyY2VfbGFuZ3VhZ2U9ImVuZ2xpc2giLAogICAgIyAgICAgdGFyZ2V0X2xhbmd1YWdlPSJmcmVuY2giCiAgICAjICkubW9kZWxfZHVtcCgpCiAgICAjIHRyYW5zbGF0aW9uX3JlcXVlc3QgPSBUcmFuc2xhdGlvblJlcXVlc3QoCiAgICAjICAgICBkYXRhPXRyYW5zbGF0aW9uX2RhdGEKICAgICMgKQogICAgIyByZXN1bHQgPSBtaW5lci5wcm9jZXNzKHJlcXVlc3Q9dHJhbnNsYXRpb25fcmVxdWVzdCkKICAgICMgcHJpbnQocmVzdWx0KQogICAgd29ya2VycyA9IGludChvcy5nZXRlbnYoIk1JTkVSX1dPUktFUlMiLCAxKSkKICAgIGlmIG9zLmdldGVudigiTUlORVJfTVVMVElfVEVOQU5UIiwgImZhbHNlIikubG93ZXIoKSA9PSAidHJ1ZSI6CiAgICAgICAgbWluZXIuc2VydmVfbWluZXJzKAogICAgICAgICAgICAidHJhbnNsYXRpb24iLAogICAgICAgICAgICBleHRlcm5hbF9hZGRyZXNzPW9zLmdldGVudigiTUlORVJfRVhURVJOQUxfQUREUkVTUyIsICIwLjAuMC4wIiksCiAgICAgICAgICAgIHN1Ym5ldD1vcy5nZXRlbnYoIk1JTkVSX1NVQk5FVCIsICIxMCIpLAogICAgICAgICAgICBtaW5fc3Rha2U9aW50KG9zLmdldGVudigiTUlORVJfTUlOX1NUQUtFIiwgMCkpLAogICAgICAgICAgICBtZXRhZGF0YT1vcy5nZXRlbnYoIk1JTkVSX01FVEFEQVRBIiwgIiIpLAogICAgICAgICAgICByZWdpc3Rlcj1vcy5nZXRlbnYoIk1JTkVSX1JFR0lTVEVSIiwgImZhbHNlIikubG93ZXIoKSA9PSAidHJ1ZSIsCiAgICAgICAgKQogICAgZWxpZiB3b3JrZXJzID4gMToKICAgICAgICBtaW5lci5ydW5fd29ya2VycygiMC4wLjAuMCIsIDQyNjksIHdvcmtlcnMpCiAgICBlbHNlOgogICAgICAgIG1pbmVyLnByZWxvYWQoKQogICAgICAgIG1pbmVyLnJ1bl9zZXJ2ZXIoIjAuMC4wLjAiLCA0MjY5KQ=='),
+    ('transport.py', 'aW1wb3J0IGJhc2U2NAppbXBvcnQganNvbgppbXBvcnQgbXNncGFjawpmcm9tIGZhc3RhcGkgaW1wb3J0IFJlcXVlc3QsIFJlc3BvbnNlCmZyb20gZmFzdGFwaS5yZXNwb25zZXMgaW1wb3J0IEpTT05SZXNwb25zZQpmcm9tIHR5cGluZyBpbXBvcnQgQW55LCBEaWN0CgoKTVNHUEFDSyA9ICJhcHBsaWNhdGlvbi9tc2dwYWNrIgpKU09OID0gImFwcGxpY2F0aW9uL2pzb24iCgoKZGVmIHRvX2pzb25fc2FmZSh2YWx1ZTogQW55KSAtPiBBbnk6CiAgICAiIiJSZXBsYWNlcyBieXRlcyB3aXRoIGJhc2U2NCBzdHJpbmdzLCB0aGUgZm9ybSBKU09OIGNsaWVudHMgZXhwZWN0LiIiIgogICAgaWYgaXNpbnN0YW5jZSh2YWx1ZSwgKGJ5dGVzLCBieXRlYXJyYXkpKToKICAgICAgICByZXR1cm4gYmFzZTY0LmI2NGVuY29kZSh2YWx1ZSkuZGVjb2RlKCJ1dGYtOCIpCiAgICBpZiBpc2luc3RhbmNlKHZhbHVlLCBkaWN0KToKICAgICAgICByZXR1cm4ge2tleTogdG9fanNvbl9zYWZlKGl0ZW0pIGZvciBrZXksIGl0ZW0gaW4gdmFsdWUuaXRlbXMoKX0KICAgIGlmIGlzaW5zdGFuY2UodmFsdWUsIChsaXN0LCB0dXBsZSkpOgogICAgICAgIHJldHVybiBbdG9fanNvbl9zYWZlKGl0ZW0pIGZvciBpdGVtIGluIHZhbHVlXQogICAgcmV0dXJuIHZhbHVlCgoKYXN5bmMgZGVmIGRlY29kZV9yZXF1ZXN0KHJlcXVlc3Q6IFJlcXVlc3QpIC0+IERpY3Rbc3RyLCBBbnldOgogICAgIiIicmFpc2VzIFZhbHVlRXJyb3IgZm9yIGEgYm9keSB0aGF0IGlzIG5vdCBhIG1zZ3BhY2sgb3IgSlNPTiBvYmplY3QsIHdoaWNoIHRoZSByb3V0ZSBhbnN3ZXJzIHdpdGggNDAwIiIiCiAgICBib2R5ID0gYXdhaXQgcmVxdWVzdC5ib2R5KCkKICAgIHRyeToKICAgICAgICBpZiByZXF1ZXN0LmhlYWRlcnMuZ2V0KCJjb250ZW50LXR5cGUiLCBKU09OKS5zcGxpdCgiOyIpWzBdLnN0cmlwKCkgPT0gTVNHUEFDSzoKICAgICAgICAgICAgZGF0YSA9IG1zZ3BhY2sudW5wYWNrYihib2R5LCByYXc9RmFsc2UpCiAgICAgICAgZWxzZToKICAgICAgICAgICAgZGF0YSA9IGpzb24ubG9hZHMoYm9keSkKICAgIGV4Y2VwdCAoVmFsdWVFcnJvciwgbXNncGFjay5VbnBhY2tFeGNlcHRpb24pIGFzIGU6CiAgICAgICAgcmFpc2UgVmFsdWVFcnJvcihmIk1hbGZvcm1lZCByZXF1ZXN0IGJvZHk6IHtzdHIoZSl9IikgZnJvbSBlCiAgICBpZiBub3QgaXNpbnN0YW5jZShkYXRhLCBkaWN0KToKICAgICAgICByYWlzZSBWYWx1ZUVycm9yKCJSZXF1ZXN0IGJvZHkgbXVzdCBiZSBhbiBvYmplY3QiKQogICAgcmV0dXJuIGRhdGEKCgpkZWYgZW5jb2RlX3Jlc3BvbnNlKHJlcXVlc3Q6IFJlcXVlc3QsIHJlc3VsdDogQW55KSAtPiBSZXNwb25zZToKICAgICIiIkFuc3dlcnMgaW4gbXNncGFjaywgd2l0aCBieXRlcyBrZXB0IHJhdywgd2hlbiB0aGUgY2xpZW50IGFjY2VwdHMgaXQsIG90aGVyd2lzZSBpbiBiYXNlNjQgSlNPTi4iIiIKICAgIGlmIE1TR1BBQ0sgaW4gcmVxdWVzdC5oZWFkZXJzLmdldCgiYWNjZXB0IiwgIiIpOgogICAgICAgIHJldHVybiBSZXNwb25zZShjb250ZW50PW1zZ3BhY2sucGFja2IocmVzdWx0LCB1c2VfYmluX3R5cGU9VHJ1ZSksIG1lZGlhX3R5cGU9TVNHUEFDSykKICAgIHJldHVybiBKU09OUmVzcG9uc2UoY29udGVudD10b19qc29uX3NhZmUocmVzdWx0KSkK'),
 ]
 
 for relative_path, encoded_content in file_data:
@@ -1,3 +1,5 @@
+import io
+import os
 import torchaudio
 import torch
 
@@ -6,8 +8,97 @@ from pathlib import Path
 from loguru import logger
 from typing import Union, Tuple, List, Dict, Optional, Any
 
+from fairseq2.nn.padding import get_seqs_and_padding_mask
+from .seamless.src.seamless_communication.inference.generator import SequenceGeneratorOptions, UnitYGenerator
 from .seamless.src.seamless_communication.inference.translator import Translator
-from .data_models import TARGET_LANGUAGES, TASK_STRINGS, MinerRequest
+from .data_models import TARGET_LANGUAGES, TASK_STRINGS, MinerRequest, TranslationConfig
+
+
+SAMPLE_RATE = 16000
+
+# Output codecs a validator can ask for, in torchaudio.save arguments. "float32" is the
+# original full-size WAV and stays the default for requests that do not name a codec.
+AUDIO_CODECS = {
+    "opus": {"format": "ogg", "encoding": "opus"},
+    "vorbis": {"format": "ogg", "encoding": "vorbis"},
+    "flac": {"format": "flac"},
+    "pcm16": {"format": "wav", "encoding": "PCM_S", "bits_per_sample": 16},
+    "float32": {"format": "wav"},
+}
+DEFAULT_CODEC = "float32"
+
+_available_codecs: Optional[List[str]] = None
+
+
+def available_codecs() -> List[str]:
+    """Probes which codecs this torchaudio build can encode, once per process."""
+    global _available_codecs
+    if _available_codecs is None:
+        probe = torch.zeros(1, SAMPLE_RATE // 10)
+        _available_codecs = []
+        for codec, options in AUDIO_CODECS.items():
+            try:
+                torchaudio.save(io.BytesIO(), probe, sample_rate=SAMPLE_RATE, **options)
+                _available_codecs.append(codec)
+            except Exception:
+                logger.debug(f"Audio codec {codec} is not available")
+        logger.info(f"Available audio codecs: {_available_codecs}")
+    return _available_codecs
+
+
+def select_codec(preferences: Optional[List[str]] = None) -> str:
+    """Picks the first codec in the client's preference order that this build supports."""
+    for codec in preferences or []:
+        if codec in AUDIO_CODECS and codec in available_codecs():
+            return codec
+    return DEFAULT_CODEC if not preferences else "pcm16"
+
+
+def numa_node_cpus(numa_node: int) -> List[int]:
+    """Parses /sys/devices/system/node/node<N>/cpulist, e.g. "0-7,16-23", into CPU ids."""
+    cpulist = Path(f"/sys/devices/system/node/node{numa_node}/cpulist").read_text(encoding="utf-8").strip()
+    cpus = []
+    for part in cpulist.split(","):
+        if "-" in part:
+            start, end = part.split("-")
+            cpus.extend(range(int(start), int(end) + 1))
+        elif part:
+            cpus.append(int(part))
+    return cpus
+
+
+def configure_cpu(config: TranslationConfig):
+    """Pins the process to a NUMA node and sizes the torch intra-op and inter-op thread pools."""
+    intra_op_threads = config.intra_op_threads
+    if config.numa_node is not None:
+        cpus = numa_node_cpus(config.numa_node)
+        os.sched_setaffinity(0, cpus)
+        intra_op_threads = intra_op_threads or len(cpus)
+        logger.info(f"Pinned to NUMA node {config.numa_node} ({len(cpus)} CPUs)")
+    if intra_op_threads:
+        torch.set_num_threads(intra_op_threads)
+    if config.inter_op_threads:
+        try:
+            torch.set_num_interop_threads(config.inter_op_threads)
+        except RuntimeError as e:
+            logger.warning(f"Inter-op threads already fixed for this process: {str(e)}")
+    logger.info(f"CPU inference with {torch.get_num_threads()} intra-op / {torch.get_num_interop_threads()} inter-op threads")
+
+
+class SharedEncoderModel:
+    """Wraps an encoder-decoder model so one encoded input is decoded as `copies` beam search rows."""
+
+    def __init__(self, model: Any, copies: int):
+        self._model = model
+        self._copies = copies
+
+    def encode(self, seqs: torch.Tensor, padding_mask: Any) -> Tuple[torch.Tensor, None]:
+        encoder_output, _ = self._model.encode(seqs, padding_mask)
+        # a single unpadded input, so the repeated rows need no padding mask
+        return encoder_output.repeat(self._copies, 1, 1), None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._model, name)
 
 
 class Translation:
@@ -35,27 +126,43 @@ class Translation:
     target_languages: Dict[str, str]
     task_strings: Dict[str, str]
 
-    def __init__(self) -> None:
+    def __init__(self, config: Optional[TranslationConfig] = None) -> None:
         """
-        Initializes the SeamlessTranslator object with the specified model and vocoder names,
-        and creates a translator object using the specified model and vocoder. The translator
-        object is created with the device set to "cuda:0" and the data type set to "torch.float16".
+        Initializes the Translation object with the model and vocoder named in the
+        TranslationConfig (seamlessM4T_v2_large with vocoder_v2 by default; use
+        vocoder_36langs with the v1 models), and creates a translator object from them. The
+        device and data type also come from the TranslationConfig, which defaults to "cuda:0" with
+        "float16" when a GPU is available and to "cpu" with "float32" otherwise. On CPU the
+        linear layers can be dynamically quantized to int8 and the torch thread pools can be
+        sized and pinned to one NUMA node.
         The target_languages dictionary maps language names to language codes, and the task_strings
         dictionary maps task strings to abbreviations.
         """
-        self.model_name = "seamlessM4T_v2_large"
-        self.vocoder_name = (
-            "vocoder_v2"
-            if self.model_name == "seamlessM4T_v2_large"
-            else "vocoder_36langs"
-        )
+        self.config = config or TranslationConfig()
+        self.model_name = self.config.model_name_or_card
+        self.vocoder_name = self.config.vocoder_name
+
+        device = self.config.torch_device
+        dtype = self.config.torch_dtype
+        if device.type == "cpu":
+            configure_cpu(self.config)
+            if dtype == torch.float16:
+                logger.warning("float16 is not supported for CPU inference, using float32")
+                dtype = torch.float32
+        if self.config.quantize_int8 and (device.type != "cpu" or dtype != torch.float32):
+            raise ValueError("int8 quantization requires device=cpu and dtype=float32")
 
         self.translator = Translator(
             model_name_or_card=self.model_name,
             vocoder_name_or_card=self.vocoder_name,
-            device=torch.device(device="cuda:0"),
-            dtype=torch.float16,
+            device=device,
+            dtype=dtype,
         )
+        if self.config.quantize_int8:
+            torch.ao.quantization.quantize_dynamic(
+                self.translator.model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+            logger.info("Quantized translator linear layers to int8")
         self.task_strings = TASK_STRINGS
         self.target_languages = TARGET_LANGUAGES
 
@@ -73,23 +180,269 @@ class Translation:
             target_languages=target_languages,
         )
 
+    def warmup(self):
+        """Runs one short prediction per task in TASK_STRINGS so the first real request does not pay for it."""
+        src_lang = self.target_languages["English"]
+        silence = torch.zeros(SAMPLE_RATE)
+        with torch.inference_mode():
+            for task_string, task_str in self.task_strings.items():
+                self.translator.predict(
+                    input="Hello world." if task_str.startswith("t") else silence,
+                    task_str=task_str,
+                    src_lang=src_lang,
+                    tgt_lang=src_lang if task_str == "asr" else self.target_languages["French"],
+                )
+                logger.debug(f"Warmed up {task_string}")
+        logger.info(f"Warmed up {len(self.task_strings)} tasks")
+
+    @staticmethod
+    def to_model_waveform(waveform: torch.Tensor, sample_rate: int) -> torch.Tensor:
+        """Downmixes to mono and resamples to the 16 kHz the model expects."""
+        waveform = waveform.mean(dim=0)
+        if sample_rate != SAMPLE_RATE:
+            waveform = torchaudio.functional.resample(waveform, sample_rate, SAMPLE_RATE)
+        return waveform
+
+    def load_input(self, input_file: Path, task_str: str) -> Union[str, torch.Tensor]:
+        """
+        Reads the input once so every target language reuses it. Text is returned as a string,
+        speech as a mono 16 kHz waveform tensor.
+        """
+        if task_str.startswith("t"):
+            return input_file.read_text(encoding="utf-8")
+        waveform, sample_rate = torchaudio.load(str(input_file))
+        return self.to_model_waveform(waveform, sample_rate)
+
+    def decode_audio(self, audio: bytes) -> torch.Tensor:
+        """Decodes an encoded audio payload (e.g. WAV bytes) straight into a model waveform."""
+        waveform, sample_rate = torchaudio.load(io.BytesIO(audio))
+        return self.to_model_waveform(waveform, sample_rate)
+
+    @staticmethod
+    def encode_audio(speech_output: Any, index: int = 0, codec: str = DEFAULT_CODEC) -> bytes:
+        """Encodes the generated waveform at `index` in memory with one of AUDIO_CODECS."""
+        buffer = io.BytesIO()
+        torchaudio.save(
+            buffer,
+            speech_output.audio_wavs[index][0].to(torch.float32).cpu(),
+            sample_rate=speech_output.sample_rate,
+            **AUDIO_CODECS[codec],
+        )
+        return buffer.getvalue()
+
+    def takes_speech(self, task_string: str) -> bool:
+        """Whether the task reads audio, decided from the resolved task_str like collate_inputs does."""
+        task_str = self.task_strings.get(task_string)
+        if not task_str:
+            logger.error("Invalid task string")
+            raise ValueError("Invalid task string")
+        return not task_str.startswith("t")
+
+    def resolve_languages(self, task_string: str, target_languages: List[str]) -> Tuple[str, Dict[str, str]]:
+        task_str = self.task_strings.get(task_string)
+        if not task_str:
+            logger.error("Invalid task string")
+            raise ValueError("Invalid task string")
+
+        tgt_langs: Dict[str, str] = {}
+        for target_language in target_languages:
+            tgt_lang = self.target_languages.get(target_language)
+            if not tgt_lang:
+                logger.error("Invalid target language")
+                raise ValueError("Invalid target language")
+            tgt_langs[target_language] = tgt_lang
+        return task_str, tgt_langs
+
+    def predict_languages(
+        self,
+        translation_input: Union[str, torch.Tensor],
+        task_str: str,
+        src_lang: str,
+        tgt_langs: Dict[str, str],
+    ) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Translates one decoded input into every target language. Text output tasks encode the
+        input once and decode all languages in one beam search (see predict_text_languages);
+        speech output still runs one translator.predict call per language, because the unit
+        generator and vocoder take a single target language.
+        """
+        if not task_str.startswith("t") and not isinstance(translation_input, torch.Tensor):
+            # Translator.predict would treat a string as a path to open
+            raise ValueError("Speech tasks take a decoded waveform")
+        if len(tgt_langs) > 1 and not task_str.endswith("st"):
+            try:
+                return self.predict_text_languages(translation_input, task_str, src_lang, tgt_langs)
+            except Exception as e:
+                logger.warning(f"Shared-encoder decoding failed, translating one language at a time: {str(e)}")
+        results = {}
+        with torch.inference_mode():
+            for target_language, tgt_lang in tgt_langs.items():
+                text_output, speech_output = self.translator.predict(
+                    input=translation_input,
+                    task_str=task_str,
+                    src_lang=src_lang,
+                    tgt_lang=tgt_lang,
+                )
+                logger.info(f"Translated text in {tgt_lang}: {text_output[0]}")
+                results[target_language] = (text_output, speech_output)
+        return results
+
+    def predict_text_languages(
+        self,
+        translation_input: Union[str, torch.Tensor],
+        task_str: str,
+        src_lang: str,
+        tgt_langs: Dict[str, str],
+    ) -> Dict[str, Tuple[Any, None]]:
+        """
+        Runs the encoder once and decodes every target language as one row of a single beam
+        search, each row prompted with its own target language prefix (`</s> __fra__`, ...).
+        Uses the same generator options as Translator.predict.
+        """
+        translator = self.translator
+        languages = list(tgt_langs.items())
+        seqs, padding_mask = get_seqs_and_padding_mask(self.collate_inputs([translation_input], task_str, src_lang))
+        generator = UnitYGenerator(
+            translator.model,
+            translator.text_tokenizer,
+            languages[0][1],
+            text_opts=SequenceGeneratorOptions(beam_size=5, soft_max_seq_len=(1, 200)),
+        )
+        converter = generator.t2t_converter if task_str.startswith("t") else generator.s2t_converter
+        prefixes = torch.stack([
+            translator.text_tokenizer.create_encoder(
+                task="translation", lang=tgt_lang, mode="target", device=translator.device
+            ).prefix_indices
+            for _, tgt_lang in languages
+        ])
+        beam_search = converter.generator
+        model = beam_search.model
+        beam_search.model = SharedEncoderModel(model, len(languages))
+        try:
+            with torch.inference_mode():
+                texts, _ = converter._do_convert(seqs, padding_mask, prefixes, None)
+        finally:
+            beam_search.model = model
+        results = {}
+        for (target_language, tgt_lang), text in zip(languages, texts):
+            logger.info(f"Translated text in {tgt_lang}: {text}")
+            results[target_language] = ([text], None)
+        return results
+
+    def translate(
+        self,
+        translation_input: Union[str, torch.Tensor],
+        task_string: str = "text2text",
+        source_language: Optional[str] = "English",
+        target_languages: List[str] = ["English"],
+        output_codecs: Optional[List[str]] = None,
+    ) -> Dict[str, Tuple[Optional[str], Optional[bytes]]]:
+        """
+        Perform translation inference entirely in memory.
+
+        Args:
+            translation_input (Union[str, torch.Tensor]): The input text, or a waveform from decode_audio.
+            task_string (str, optional): The task string. Defaults to "text2text".
+            source_language (str, optional): The source language. Defaults to "English".
+            target_languages (List[str], optional): The list of target languages. Defaults to ["English"].
+            output_codecs (List[str], optional): Audio codecs in order of preference. Defaults to float32 WAV.
+
+        Returns:
+            Dict[str, Tuple[Optional[str], Optional[bytes]]]: A mapping of target language to its translated text and encoded audio.
+        """
+        task_str, tgt_langs = self.resolve_languages(task_string, target_languages)
+        results = self.predict_languages(translation_input, task_str, self.target_languages[source_language], tgt_langs)
+        codec = select_codec(output_codecs)
+        return {
+            target_language: (
+                str(text_output[0]) if text_output else None,
+                self.encode_audio(speech_output, codec=codec) if speech_output else None,
+            )
+            for target_language, (text_output, speech_output) in results.items()
+        }
+
+    def collate_inputs(self, translation_inputs: List[Union[str, torch.Tensor]], task_str: str, src_lang: str) -> Any:
+        """Collates several inputs into one padded batch the translator accepts as SequenceData."""
+        translator = self.translator
+        if task_str.startswith("t"):
+            token_encoder = translator.text_tokenizer.create_encoder(
+                task="translation", lang=src_lang, mode="source", device=translator.device
+            )
+            return translator.collate([token_encoder(text) for text in translation_inputs])
+        fbanks = [
+            translator.convert_to_fbank(
+                {"waveform": waveform.unsqueeze(1), "sample_rate": SAMPLE_RATE, "format": -1}
+            )
+            for waveform in translation_inputs
+        ]
+        return translator.collate(fbanks)["fbank"]
+
+    def translate_batch(
+        self,
+        translation_inputs: List[Union[str, torch.Tensor]],
+        task_string: str = "text2text",
+        source_language: Optional[str] = "English",
+        target_language: str = "English",
+        output_codecs: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[str], Optional[bytes]]]:
+        """
+        Translates several inputs that share a task and language pair in one batched predict call.
+        Falls back to one call per input if the batch cannot be collated.
+
+        Returns:
+            List[Tuple[Optional[str], Optional[bytes]]]: The translated text and WAV bytes for each input, in order.
+        """
+        task_str, tgt_langs = self.resolve_languages(task_string, [target_language])
+        if len(translation_inputs) == 1:
+            return [self.translate(translation_inputs[0], task_string, source_language, [target_language], output_codecs)[target_language]]
+        src_lang = self.target_languages[source_language]
+        try:
+            batch = self.collate_inputs(translation_inputs, task_str, src_lang)
+            with torch.inference_mode():
+                text_output, speech_output = self.translator.predict(
+                    input=batch,
+                    task_str=task_str,
+                    src_lang=src_lang,
+                    tgt_lang=tgt_langs[target_language],
+                )
+        except Exception as e:
+            logger.warning(f"Batched predict failed, translating {len(translation_inputs)} inputs one by one: {str(e)}")
+            return [
+                self.translate(translation_input, task_string, source_language, [target_language], output_codecs)[target_language]
+                for translation_input in translation_inputs
+            ]
+        logger.info(f"Translated batch of {len(translation_inputs)} into {tgt_langs[target_language]}")
+        codec = select_codec(output_codecs)
+        return [
+            (
+                str(text_output[index]) if text_output else None,
+                self.encode_audio(speech_output, index, codec) if speech_output else None,
+            )
+            for index in range(len(translation_inputs))
+        ]
+
     def translation_inference(
         self,
         in_file: Union[str, Path],
         task_string: str = "speech2text",
         source_langauge: Optional[str] = "English",
         target_languages: List[str] = ["English"],
-    ) -> Tuple[Path, Path] | None:
+    ) -> Dict[str, Tuple[Any, Any]]:
         """
-        Perform translation inference on the given input file.
+        Perform translation inference on the given input file for every target language.
+
+        The input is read and decoded once; text output tasks also share one encoder pass and
+        one beam search across languages (see predict_languages). With one target language the outputs are written to
+        `out/<stem>.txt` and `out/<stem>.wav`, with several to `out/<stem>_<code>.txt/.wav`.
 
         Args:
             in_file (Union[str, Path]): The path to the input file.
-            task_string (str, optional): The task string. Defaults to "s2st".
-            target_languages (List[str], optional): The list of target languages. Defaults to ["eng"].
+            task_string (str, optional): The task string. Defaults to "speech2text".
+            source_langauge (str, optional): The source language. Defaults to "English".
+            target_languages (List[str], optional): The list of target languages. Defaults to ["English"].
 
         Returns:
-            Tuple[Path, Path] | None: A tuple containing the absolute paths to the output text file and output audio file, or None if the input file is not found.
+            Dict[str, Tuple[Any, Any]]: A mapping of target language to its (text_output, speech_output).
 
         Raises:
             FileNotFoundError: If the input file is not found.
@@ -102,50 +455,23 @@ class Translation:
             raise FileNotFoundError(f"File {in_file} not found")
 
         input_file = Path(in_file)
-        output_text = Path(f"modules/translation/out/{input_file.stem}.txt")
-        output_audio = Path(f"modules/translation/out/{input_file.stem}.wav")
-        
-        task_str: str = self.task_strings[task_string]
-        if not task_str:
-            logger.error("Invalid task string")
-            raise ValueError("Invalid task string")
-
-        for tgt_lang in target_languages:
-
-            tgt_lang: str = self.target_languages[tgt_lang]
-            if not tgt_lang:
-                logger.error("Invalid target language")
-                raise ValueError("Invalid target language")
-
-            if task_str.startswith("t"):
-                text_output, speech_output = self.translator.predict(
-                    input=str(input_file.read_text(encoding="utf-8")),
-                    task_str=task_str,
-                    src_lang=self.target_languages[source_langauge],
-                    tgt_lang=tgt_lang,
-                    )
-            if task_str.startswith("s"):
-                text_output, speech_output = self.translator.predict(
-                    input=str(input_file),
-                    task_str=task_str,
-                    src_lang=self.target_languages[source_langauge],
-                    tgt_lang=tgt_lang,
-                )
-            logger.info(f"Translated text in {tgt_lang}: {text_output[0]}")
+        task_str, tgt_langs = self.resolve_languages(task_string, target_languages)
+        translation_input = self.load_input(input_file, task_str)
+        results = self.predict_languages(translation_input, task_str, self.target_languages[source_langauge], tgt_langs)
 
+        for target_language, (text_output, speech_output) in results.items():
+            stem = input_file.stem if len(results) == 1 else f"{input_file.stem}_{tgt_langs[target_language]}"
             if speech_output:
                 torchaudio.save(
-                    uri=output_audio,
+                    uri=Path(f"modules/translation/out/{stem}.wav"),
                     src=speech_output.audio_wavs[0][0].to(torch.float32).cpu(),
                     sample_rate=speech_output.sample_rate,
                 )
             if text_output:
-                output_text.write_text(
+                Path(f"modules/translation/out/{stem}.txt").write_text(
                     data=str(object=text_output[0]), encoding="utf-8"
                 )
 
-            logger.info("Translated target file")
-
-            return text_output, speech_output
-
+        logger.info(f"Translated target file into {len(results)} languages")
 
+        return results
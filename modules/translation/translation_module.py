@@ -1,14 +1,30 @@
+import os
 import base64
+import threading
 from pydantic import Field
+from typing import Any, List, Optional, Tuple, Union
 from dotenv import load_dotenv
 
 from .data_models import TranslationRequest, MinerConfig, ModuleConfig, BaseMiner
-from .translation import SeamlessTranslator
+from .translation import Translation
 
 
 load_dotenv()
 
-translator = SeamlessTranslator()
+_translator: Optional[Translation] = None
+_translator_lock = threading.Lock()
+
+
+def get_translator() -> Translation:
+    """Loads and warms up the model on first use."""
+    global _translator
+    if _translator is None:
+        with _translator_lock:
+            if _translator is None:
+                translator = Translation()
+                translator.warmup()
+                _translator = translator
+    return _translator
 
 
 translation_settings = ModuleConfig(
@@ -37,32 +53,83 @@ miner_settings = MinerConfig(
 class TranslationMiner(BaseMiner):
     
     def __init__(self):
-        super().__init__(miner_settings, translation_settings)
+        super().__init__(translation_settings, miner_settings)
         self.add_route("translation")
+
+    def preload(self):
+        get_translator()
     
-    def process(self, request: TranslationRequest):
-        text_request = "modules/translation/in/text_request.txt"
-        audio_request = "modules/translation/in/audio_request.wav"
-        request_path = ""
-        if request.data["task_string"].startswith("speech"):
-            with open(audio_request, "wb") as f:
-                f.write(base64.b64decode(request.data["input"].encode("utf-8")))
-            request_path = audio_request
-        if request.data["task_string"].startswith("text"):
-            with open(text_request, "w", encoding="utf-8") as f:
-                f.write(request.data["input"])
-            request_path = text_request
-        output_text, output_audio = translator.translation_inference(
-            in_file=request_path,
-            source_langauge=request.data["source_language"].title(),
-            target_languages=[request.data["target_language"].title()],
-            task_string=request.data["task_string"]
+    def batch_key(self, request: TranslationRequest) -> Tuple[str, str, str, Tuple[str, ...]]:
+        # tolerant of malformed requests, which decode_input rejects one by one inside the batch
+        return (
+            str(request.data.get("task_string")),
+            str(request.data.get("source_language")).title(),
+            str(request.data.get("target_language")).title(),
+            tuple(request.data.get("output_codecs") or ()),
         )
-        if request.data["task_string"].endswith("2speech"):
-            return base64.b64encode(output_audio).decode("utf-8")
-        if request.data["task_string"].endswith("2text"):
-            return str(output_text)
 
+    def decode_input(self, translator: Translation, request: TranslationRequest) -> Union[str, Any]:
+        """Speech input arrives as raw bytes over msgpack or as a base64 string over JSON."""
+        for field_name in ("task_string", "source_language", "target_language"):
+            if not isinstance(request.data.get(field_name), str):
+                raise ValueError(f"Missing or invalid {field_name}")
+        if "input" not in request.data:
+            raise ValueError("Missing input")
+        if translator.takes_speech(request.data["task_string"]):
+            audio = request.data["input"]
+            if isinstance(audio, str):
+                try:
+                    audio = base64.b64decode(audio.encode("utf-8"), validate=True)
+                except ValueError as e:
+                    raise ValueError(f"Speech input must be base64 audio: {str(e)}") from e
+            if not isinstance(audio, (bytes, bytearray)):
+                raise ValueError("Speech input must be audio bytes or base64 audio")
+            try:
+                return translator.decode_audio(audio)
+            except Exception as e:
+                raise ValueError(f"Could not decode audio input: {str(e)}") from e
+        if not isinstance(request.data["input"], str):
+            raise ValueError("Text input must be a string")
+        return request.data["input"]
+
+    def encode_output(self, task_string: str, output_text: Optional[str], output_audio: Optional[bytes]) -> Union[str, bytes, None]:
+        """Speech output stays raw bytes; the route base64-encodes it only for JSON clients."""
+        if task_string.endswith("2speech"):
+            return output_audio
+        return output_text
+
+    def process_batch(self, requests: List[TranslationRequest]) -> List[Union[str, bytes, None, Exception]]:
+        """
+        Decodes and validates each request on its own, so a bad request fails alone with its
+        ValueError while the rest of its group is still translated together.
+        """
+        translator = get_translator()
+        task_string, source_language, target_language, output_codecs = self.batch_key(requests[0])
+        results: List[Union[str, bytes, None, Exception]] = [None] * len(requests)
+        inputs, positions = [], []
+        for position, request in enumerate(requests):
+            try:
+                inputs.append(self.decode_input(translator, request))
+                positions.append(position)
+            except (ValueError, TypeError) as e:
+                results[position] = ValueError(str(e))
+        if inputs:
+            outputs = translator.translate_batch(
+                inputs,
+                task_string=task_string,
+                source_language=source_language,
+                target_language=target_language,
+                output_codecs=list(output_codecs),
+            )
+            for position, (output_text, output_audio) in zip(positions, outputs):
+                results[position] = self.encode_output(task_string, output_text, output_audio)
+        return results
+
+    def process(self, request: TranslationRequest):
+        result = self.process_batch([request])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
 
 if __name__ == "__main__":
     miner = TranslationMiner()
@@ -80,4 +147,18 @@ if __name__ == "__main__":
     # )
     # result = miner.process(request=translation_request)
     # print(result)
-    miner.run_server("0.0.0.0", 4269)
\ No newline at end of file
+    workers = int(os.getenv("MINER_WORKERS", 1))
+    if os.getenv("MINER_MULTI_TENANT", "false").lower() == "true":
+        miner.serve_miners(
+            "translation",
+            external_address=os.getenv("MINER_EXTERNAL_ADDRESS", "0.0.0.0"),
+            subnet=os.getenv("MINER_SUBNET", "10"),
+            min_stake=int(os.getenv("MINER_MIN_STAKE", 0)),
+            metadata=os.getenv("MINER_METADATA", ""),
+            register=os.getenv("MINER_REGISTER", "false").lower() == "true",
+        )
+    elif workers > 1:
+        miner.run_workers("0.0.0.0", 4269, workers)
+    else:
+        miner.preload()
+        miner.run_server("0.0.0.0", 4269)
\ No newline at end of file
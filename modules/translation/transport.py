@@ -0,0 +1,43 @@
+import base64
+import json
+import msgpack
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from typing import Any, Dict
+
+
+MSGPACK = "application/msgpack"
+JSON = "application/json"
+
+
+def to_json_safe(value: Any) -> Any:
+    """Replaces bytes with base64 strings, the form JSON clients expect."""
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode("utf-8")
+    if isinstance(value, dict):
+        return {key: to_json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json_safe(item) for item in value]
+    return value
+
+
+async def decode_request(request: Request) -> Dict[str, Any]:
+    """raises ValueError for a body that is not a msgpack or JSON object, which the route answers with 400"""
+    body = await request.body()
+    try:
+        if request.headers.get("content-type", JSON).split(";")[0].strip() == MSGPACK:
+            data = msgpack.unpackb(body, raw=False)
+        else:
+            data = json.loads(body)
+    except (ValueError, msgpack.UnpackException) as e:
+        raise ValueError(f"Malformed request body: {str(e)}") from e
+    if not isinstance(data, dict):
+        raise ValueError("Request body must be an object")
+    return data
+
+
+def encode_response(request: Request, result: Any) -> Response:
+    """Answers in msgpack, with bytes kept raw, when the client accepts it, otherwise in base64 JSON."""
+    if MSGPACK in request.headers.get("accept", ""):
+        return Response(content=msgpack.packb(result, use_bin_type=True), media_type=MSGPACK)
+    return JSONResponse(content=to_json_safe(result))